@@ -0,0 +1,280 @@
+"""End-to-end throughput of the client booking flow.
+
+Boots the multibot stack against the Postgres and Redis of the local config files,
+with Telegram replaced by the in-process fake Bot API, and walks N concurrent new
+clients of one tenant bot through
+
+    /start -> RegistrationSG.GET_CITY -> MainMenuSG.MENU -> BookingSG.GET_SERVICE -> BookingSG.GET_DATE
+
+Each step is timed from the update entering getUpdates to the bot rendering the next
+window. Without --token a throwaway tenant with one city, branch, service and master
+is seeded and dropped afterwards. A bot given by --token must exist in the database
+with at least one city and one service.
+
+    PYTHONPATH=src python benchmarks/booking_flow.py --clients 200
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from aiogram.client.telegram import TelegramAPIServer
+from aiohttp import web
+from common import Tenant, create_bench_engine, drop_tenants, save_report, seed_tenant, summarize
+from sqlalchemy import event
+
+from hub.infrastructure.telegram.fake_server import FakeTelegramServer, RecordedCall
+from hub.main.bot import create_hub
+
+CB_SEP = "\x1d"  # aiogram-dialog's separator of intent id and widget callback data
+STEP_TIMEOUT = 30
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    state: str
+    # Button pressed to get here, None for the /start message
+    widget_id: str | None
+    # Buttons of which the rendered window must have one, so the next step can press it
+    expects: tuple[str, ...]
+
+
+STEPS = (
+    # A bot with one city registers the client right away and shows the menu
+    Step(state="RegistrationSG.GET_CITY", widget_id=None, expects=("select.city", "open.booking")),
+    Step(state="MainMenuSG.MENU", widget_id="select.city", expects=("open.booking",)),
+    Step(state="BookingSG.GET_SERVICE", widget_id="open.booking", expects=("select.service",)),
+    Step(state="BookingSG.GET_DATE", widget_id="select.service", expects=()),
+)
+
+
+@dataclass
+class Results:
+    latencies: defaultdict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    updates: int = 0
+    failed_clients: int = 0
+
+
+class StepFailedError(Exception):
+    pass
+
+
+class SimulatedClient:
+    def __init__(self, fake_server: FakeTelegramServer, token: str, user_id: int, results: Results):
+        self._fake_server = fake_server
+        self._token = token
+        self._user_id = user_id
+        self._results = results
+        self._replies = fake_server.watch(token, user_id)
+        self._window: dict[str, Any] | None = None
+
+    async def walk(self) -> None:
+        try:
+            for step in STEPS:
+                await self._step(step)
+        except (StepFailedError, TimeoutError) as e:
+            self._results.failed_clients += 1
+            logger.warning("Client %s stopped: %r", self._user_id, e)
+        finally:
+            self._fake_server.unwatch(self._token, self._user_id)
+
+    async def _step(self, step: Step) -> None:
+        if step.widget_id is None:
+            update = {"message": self._message({"text": "/start", "entities": [_command_entity("/start")]})}
+        elif step.widget_id == "select.city" and self._find_button(self._window or {}, step.widget_id) is None:
+            # Already registered without choosing a city
+            return
+        else:
+            update = {"callback_query": self._callback(step.widget_id)}
+
+        started_at = time.monotonic()
+        self._fake_server.push(self._token, update)
+        self._results.updates += 1
+        window = await self._wait_window(step)
+        self._results.latencies[step.state].append(window.at - started_at)
+        if isinstance(window.result, dict):
+            self._window = window.result
+
+    async def _wait_window(self, step: Step) -> RecordedCall:
+        async with asyncio.timeout(STEP_TIMEOUT):
+            while True:
+                call = await self._replies.get()
+                if not isinstance(call.result, dict) or not call.result.get("reply_markup"):
+                    continue
+                if not step.expects or any(self._find_button(call.result, button) for button in step.expects):
+                    return call
+
+    def _callback(self, widget_id: str) -> dict[str, Any]:
+        if self._window is None:
+            raise StepFailedError(f"No window to press {widget_id} in")
+        callback_data = self._find_button(self._window, widget_id)
+        if callback_data is None:
+            raise StepFailedError(f"No {widget_id} button in the current window")
+        return {
+            "id": f"{self._user_id}{time.monotonic_ns()}",
+            "from": self._user(),
+            "chat_instance": str(self._user_id),
+            "message": self._window,
+            "data": callback_data,
+        }
+
+    def _message(self, content: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "message_id": 1,
+            "date": int(time.time()),
+            "chat": {"id": self._user_id, "type": "private"},
+            "from": self._user(),
+            **content,
+        }
+
+    def _user(self) -> dict[str, Any]:
+        return {"id": self._user_id, "is_bot": False, "first_name": "Benchmark", "last_name": str(self._user_id)}
+
+    @staticmethod
+    def _find_button(window: dict[str, Any], widget_id: str) -> str | None:
+        for row in (window.get("reply_markup") or {}).get("inline_keyboard", []):
+            for button in row:
+                data = button.get("callback_data") or ""
+                _, _, widget_data = data.rpartition(CB_SEP)
+                if widget_data == widget_id or widget_data.startswith(f"{widget_id}:"):
+                    return data
+        return None
+
+
+def _command_entity(command: str) -> dict[str, Any]:
+    return {"type": "bot_command", "offset": 0, "length": len(command)}
+
+
+async def run(
+    token: str | None,
+    clients: int,
+    first_user_id: int,
+    port: int,
+    *,
+    rate_limit: bool,
+) -> dict[str, Any]:
+    if token is not None:
+        return await run_flow(token, clients, first_user_id, port, rate_limit=rate_limit)
+
+    engine = create_bench_engine()
+    tenant: Tenant | None = None
+    try:
+        async with engine.begin() as connection:
+            tenant = await seed_tenant(connection)
+        return await run_flow(tenant.token, clients, first_user_id, port, rate_limit=rate_limit)
+    finally:
+        if tenant is not None:
+            async with engine.begin() as connection:
+                await drop_tenants(connection, [tenant])
+        await engine.dispose()
+
+
+async def run_flow(
+    token: str,
+    clients: int,
+    first_user_id: int,
+    port: int,
+    *,
+    rate_limit: bool,
+) -> dict[str, Any]:
+    fake_server = FakeTelegramServer()
+    hub = create_hub(api=TelegramAPIServer.from_base(f"http://127.0.0.1:{port}"), rate_limit=rate_limit)
+
+    queries = 0
+
+    def count_query(*_: Any) -> None:
+        nonlocal queries
+        queries += 1
+
+    event.listen(hub.engine.sync_engine, "before_cursor_execute", count_query)
+
+    app = web.Application()
+    fake_server.setup(app)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    polling = asyncio.create_task(
+        hub.multibot_dispatcher.start_polling(
+            hub.bot_registry.get(token),
+            polling_timeout=1,
+            handle_signals=False,
+            close_bot_session=False,
+        ),
+    )
+
+    results = Results()
+    try:
+        started_at = time.monotonic()
+        await asyncio.gather(
+            *(SimulatedClient(fake_server, token, first_user_id + index, results).walk() for index in range(clients)),
+        )
+        duration = time.monotonic() - started_at
+    finally:
+        # Handlers still running after their reply, like aiogram-dialog saving its stack, need the
+        # FSM storage the shutdown closes. Cancelling start_polling would leave its loop running.
+        await asyncio.gather(*hub.multibot_dispatcher._handle_update_tasks, return_exceptions=True)  # noqa: SLF001
+        await hub.multibot_dispatcher.stop_polling()
+        await asyncio.gather(polling, return_exceptions=True)
+        await hub.bot_registry.close()
+        await runner.cleanup()
+        await hub.engine.dispose()
+        await hub.redis.aclose()
+
+    return {
+        "benchmark": "booking_flow",
+        "started_at": datetime.now(tz=UTC).isoformat(),
+        "clients": clients,
+        "failed_clients": results.failed_clients,
+        "rate_limit": rate_limit,
+        "updates": results.updates,
+        "duration_s": duration,
+        "updates_per_second": results.updates / duration if duration else 0,
+        "db_queries": queries,
+        "db_queries_per_update": queries / results.updates if results.updates else 0,
+        "steps": {
+            step.state: summarize(results.latencies[step.state]) for step in STEPS if results.latencies[step.state]
+        },
+        "telegram_calls": fake_server.stats()["calls"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the client booking flow end to end")
+    parser.add_argument(
+        "--token",
+        default=None,
+        help="token of a tenant bot with cities and services, a throwaway tenant is seeded by default",
+    )
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument(
+        "--first-user-id",
+        type=int,
+        default=None,
+        help="telegram id of the first simulated client, unused ids by default so every client is new",
+    )
+    parser.add_argument("--port", type=int, default=8082)
+    parser.add_argument(
+        "--rate-limit",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="keep the send limits of the config, as in production",
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level="WARNING")
+    first_user_id = args.first_user_id if args.first_user_id is not None else time.time_ns() // 1000
+    report = asyncio.run(run(args.token, args.clients, first_user_id, args.port, rate_limit=args.rate_limit))
+    save_report("booking_flow", report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Shared setup of the database benchmarks.
+
+They run against the database of ./config/main_bot_config.toml, migrated to head,
+and seed throwaway tenants of the size they need. Benchmarks that read through one
+connection roll the seed back, the others drop their tenants when done.
+"""
+
+import json
+import statistics
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from redis.asyncio import Redis
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from hub.infrastructure.config_loader import load_config
+from hub.infrastructure.database.config import DBConfig
+from hub.infrastructure.database.factories import create_engine
+from hub.main.config import CacheConfig
+
+CONFIG_PATH = Path("./config/main_bot_config.toml")
+RESULTS_PATH = Path(__file__).parent / "results"
+
+SEED_MANAGER = text("INSERT INTO managers (telegram_id) VALUES (:telegram_id) RETURNING id")
+SEED_BOT = text(
+    "INSERT INTO bots (token, telegram_id, name, manager_id) "
+    "VALUES (:token, :telegram_id, 'Benchmark', :manager_id) RETURNING id",
+)
+SEED_CITIES = text(
+    "INSERT INTO cities (name, timezone, bot_id) "
+    "SELECT 'City ' || n, :timezone, :bot_id FROM generate_series(1, :count) n",
+)
+SEED_BRANCHES = text(
+    """
+    WITH city AS (SELECT array_agg(id ORDER BY id) AS ids FROM cities WHERE bot_id = :bot_id)
+    INSERT INTO branches (name, address, city_id)
+    SELECT 'Branch ' || n, 'Street ' || n, city.ids[1 + n % cardinality(city.ids)]
+    FROM city, generate_series(1, :count) n
+    """,
+)
+SEED_SERVICES = text(
+    "INSERT INTO services (name, description, bot_id) "
+    "SELECT 'Service ' || n, 'Description ' || n, :bot_id FROM generate_series(1, :count) n",
+)
+SEED_MASTERS = text(
+    """
+    WITH city AS (SELECT array_agg(id ORDER BY id) AS ids FROM cities WHERE bot_id = :bot_id)
+    INSERT INTO masters (name, bot_id, city_id)
+    SELECT 'Master ' || n, :bot_id, city.ids[1 + n % cardinality(city.ids)]
+    FROM city, generate_series(1, :count) n
+    """,
+)
+# Master i gets the `per_master` branches and services that follow its index, wrapping around
+SEED_BRANCH_MASTERS = text(
+    """
+    WITH master AS (SELECT array_agg(id ORDER BY id) AS ids FROM masters WHERE bot_id = :bot_id),
+    branch AS (
+        SELECT array_agg(branches.id ORDER BY branches.id) AS ids
+        FROM branches JOIN cities ON cities.id = branches.city_id
+        WHERE cities.bot_id = :bot_id
+    )
+    INSERT INTO branch_master_association (branch_id, master_id)
+    SELECT branch.ids[1 + (i * :per_master + k) % cardinality(branch.ids)], master.ids[i + 1]
+    FROM master, branch, generate_series(0, cardinality(master.ids) - 1) i, generate_series(0, :per_master - 1) k
+    ON CONFLICT DO NOTHING
+    """,
+)
+SEED_SERVICE_MASTERS = text(
+    """
+    WITH master AS (SELECT array_agg(id ORDER BY id) AS ids FROM masters WHERE bot_id = :bot_id),
+    service AS (SELECT array_agg(id ORDER BY id) AS ids FROM services WHERE bot_id = :bot_id)
+    INSERT INTO service_master_association (service_id, master_id, work_time, break_time)
+    SELECT service.ids[1 + (i * :per_master + k) % cardinality(service.ids)], master.ids[i + 1], 60, 0
+    FROM master, service, generate_series(0, cardinality(master.ids) - 1) i, generate_series(0, :per_master - 1) k
+    ON CONFLICT DO NOTHING
+    """,
+)
+SEED_CLIENTS = text(
+    """
+    WITH city AS (SELECT array_agg(id ORDER BY id) AS ids FROM cities WHERE bot_id = :bot_id)
+    INSERT INTO clients (telegram_id, name, bot_id, city_id)
+    SELECT :first_telegram_id + n, 'Client ' || n, :bot_id, city.ids[1 + n % cardinality(city.ids)]
+    FROM city, generate_series(1, :count) n
+    """,
+)
+# One hour at 10:00 UTC on each of `per_master` consecutive days, for the master's first service
+SEED_APPOINTMENTS = text(
+    """
+    WITH master AS (SELECT array_agg(id ORDER BY id) AS ids FROM masters WHERE bot_id = :bot_id),
+    client AS (SELECT array_agg(id ORDER BY id) AS ids FROM clients WHERE bot_id = :bot_id),
+    first_service AS (
+        SELECT master_id, min(service_id) AS service_id
+        FROM service_master_association JOIN masters ON masters.id = service_master_association.master_id
+        WHERE masters.bot_id = :bot_id
+        GROUP BY master_id
+    )
+    INSERT INTO appointments (date, end_date, master_id, client_id, service_id)
+    SELECT
+        slot.start, slot.start + interval '1 hour', master.ids[i + 1],
+        client.ids[1 + (i * :per_master + d) % cardinality(client.ids)], first_service.service_id
+    FROM master, client, generate_series(0, cardinality(master.ids) - 1) i, generate_series(0, :per_master - 1) d,
+        LATERAL (SELECT CAST(:first_day AS timestamptz) + d * interval '1 day' + interval '10 hours' AS start) slot,
+        first_service
+    WHERE first_service.master_id = master.ids[i + 1]
+    """,
+)
+DROP_TENANTS = tuple(
+    text(statement)
+    for statement in (
+        (
+            "DELETE FROM appointments USING masters WHERE masters.id = appointments.master_id "
+            "AND masters.bot_id = ANY(:bot_ids)"
+        ),
+        (
+            "DELETE FROM branch_master_association USING masters "
+            "WHERE masters.id = branch_master_association.master_id AND masters.bot_id = ANY(:bot_ids)"
+        ),
+        (
+            "DELETE FROM service_master_association USING masters "
+            "WHERE masters.id = service_master_association.master_id AND masters.bot_id = ANY(:bot_ids)"
+        ),
+        "DELETE FROM clients WHERE bot_id = ANY(:bot_ids)",
+        "DELETE FROM masters WHERE bot_id = ANY(:bot_ids)",
+        "DELETE FROM managers USING bots WHERE bots.manager_id = managers.id AND bots.id = ANY(:bot_ids)",
+    )
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Tenant:
+    manager_id: int
+    bot_id: int
+    token: str
+    telegram_id: int
+
+
+def create_bench_engine() -> AsyncEngine:
+    return create_engine(load_config(DBConfig, "db", path=CONFIG_PATH))
+
+
+def create_bench_redis() -> Redis:
+    return Redis.from_url(load_config(CacheConfig, "cache", path=CONFIG_PATH).full_url)
+
+
+async def seed_tenant(
+    connection: AsyncConnection,
+    *,
+    cities: int = 1,
+    branches: int = 1,
+    services: int = 1,
+    masters: int = 1,
+    branches_per_master: int = 1,
+    services_per_master: int = 1,
+    clients: int = 0,
+    appointments_per_master: int = 0,
+    timezone: str = "Europe/Moscow",
+) -> Tenant:
+    """Insert a bot with its catalogue, clients and appointments from today on."""
+    telegram_id = time.time_ns() // 1000
+    manager_id = (await connection.execute(SEED_MANAGER, {"telegram_id": telegram_id})).scalar_one()
+    token = f"{telegram_id}:benchmark"
+    bot_id = (
+        await connection.execute(SEED_BOT, {"token": token, "telegram_id": telegram_id, "manager_id": manager_id})
+    ).scalar_one()
+
+    await connection.execute(SEED_CITIES, {"bot_id": bot_id, "count": cities, "timezone": timezone})
+    await connection.execute(SEED_BRANCHES, {"bot_id": bot_id, "count": branches})
+    await connection.execute(SEED_SERVICES, {"bot_id": bot_id, "count": services})
+    await connection.execute(SEED_MASTERS, {"bot_id": bot_id, "count": masters})
+    await connection.execute(SEED_BRANCH_MASTERS, {"bot_id": bot_id, "per_master": min(branches_per_master, branches)})
+    await connection.execute(SEED_SERVICE_MASTERS, {"bot_id": bot_id, "per_master": min(services_per_master, services)})
+    if clients:
+        await connection.execute(SEED_CLIENTS, {"bot_id": bot_id, "count": clients, "first_telegram_id": telegram_id})
+    if clients and appointments_per_master:
+        await connection.execute(
+            SEED_APPOINTMENTS,
+            {"bot_id": bot_id, "per_master": appointments_per_master, "first_day": datetime.now(tz=UTC).date()},
+        )
+    return Tenant(manager_id=manager_id, bot_id=bot_id, token=token, telegram_id=telegram_id)
+
+
+async def drop_tenants(connection: AsyncConnection, tenants: list[Tenant]) -> None:
+    # The association tables do not cascade, and the SET NULL references from appointments,
+    # clients and masters have no index, so the rows behind them go first
+    for statement in DROP_TENANTS:
+        await connection.execute(statement, {"bot_ids": [tenant.bot_id for tenant in tenants]})
+
+
+def summarize(latencies: list[float]) -> dict[str, float | int]:
+    if len(latencies) == 1:
+        p50 = p95 = p99 = latencies[0]
+    else:
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = quantiles[49], quantiles[94], quantiles[98]
+    return {
+        "count": len(latencies),
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": p50 * 1000,
+        "p95_ms": p95 * 1000,
+        "p99_ms": p99 * 1000,
+    }
+
+
+def save_report(name: str, report: dict[str, Any], output: Path | None = None) -> None:
+    output = output or RESULTS_PATH / f"{name}-{datetime.now(tz=UTC):%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(json.dumps(report, indent=2))  # noqa: T201
+    print(f"Saved to {output}")  # noqa: T201
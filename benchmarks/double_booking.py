@@ -0,0 +1,136 @@
+"""Fire concurrent bookings of one slot through CreateAppointment.
+
+Seeds a tenant whose masters all provide one service, then lets N clients book the
+same start time at once, each in its own session like a request would. The exclusion
+constraint must let exactly one booking per master commit and turn the rest into
+SlotAlreadyTakenError.
+
+    PYTHONPATH=src python benchmarks/double_booking.py --bookings 500
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytz
+from common import Tenant, create_bench_engine, create_bench_redis, drop_tenants, save_report, seed_tenant, summarize
+from redis.asyncio import Redis
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from hub.application.appointment.create import CreateAppointment, CreateAppointmentDTO
+from hub.application.appointment.exceptions import SlotAlreadyTakenError
+from hub.domain.models.schedule import WORKING_DAY_START
+from hub.infrastructure.database.adapters.appointment import AppointmentDbGateway
+from hub.infrastructure.database.adapters.schedule import ScheduleDbGateway
+from hub.infrastructure.redis_storage.availability_cache import RedisDayAvailabilityCache
+from hub.infrastructure.redis_storage.client_appointments_cache import RedisClientAppointmentsCache
+from hub.infrastructure.redis_storage.reminder_queue import RedisReminderQueue
+
+TIMEZONE = "Europe/Moscow"
+CLIENTS = text("SELECT id, telegram_id FROM clients WHERE bot_id = :bot_id ORDER BY id")
+SERVICE = text("SELECT id FROM services WHERE bot_id = :bot_id")
+
+
+async def book(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    redis: Redis,
+    data: CreateAppointmentDTO,
+) -> tuple[str, float]:
+    started_at = time.monotonic()
+    async with sessionmaker() as session:
+        interactor = CreateAppointment(
+            db_gateway=AppointmentDbGateway(session),
+            schedule_db_gateway=ScheduleDbGateway(session),
+            availability_cache=RedisDayAvailabilityCache(redis),
+            appointments_cache=RedisClientAppointmentsCache(redis),
+            reminder_queue=RedisReminderQueue(redis),
+        )
+        try:
+            await interactor(data)
+        except SlotAlreadyTakenError:
+            outcome = "slot_taken"
+        except Exception:  # noqa: BLE001
+            outcome = "error"
+        else:
+            outcome = "booked"
+    return outcome, time.monotonic() - started_at
+
+
+async def run(bookings: int, masters: int) -> dict[str, Any]:
+    engine = create_bench_engine()
+    redis = create_bench_redis()
+    sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+    tenant: Tenant | None = None
+    try:
+        async with engine.begin() as connection:
+            tenant = await seed_tenant(
+                connection,
+                masters=masters,
+                services=1,
+                clients=bookings,
+                timezone=TIMEZONE,
+            )
+            clients = (await connection.execute(CLIENTS, {"bot_id": tenant.bot_id})).all()
+            service_id = (await connection.execute(SERVICE, {"bot_id": tenant.bot_id})).scalar_one()
+
+        tz = pytz.timezone(TIMEZONE)
+        tomorrow = datetime.now(tz=tz).date() + timedelta(days=1)
+        slot = tz.localize(datetime.combine(tomorrow, WORKING_DAY_START)) + timedelta(hours=3)
+        requests = [
+            CreateAppointmentDTO(
+                bot_id=tenant.bot_id,
+                client_id=client_id,
+                client_telegram_id=telegram_id,
+                service_id=service_id,
+                date_time=slot,
+                timezone=TIMEZONE,
+            )
+            for client_id, telegram_id in clients
+        ]
+
+        started_at = time.monotonic()
+        results = await asyncio.gather(*(book(sessionmaker, redis, data) for data in requests))
+        duration = time.monotonic() - started_at
+    finally:
+        if tenant is not None:
+            async with engine.begin() as connection:
+                await drop_tenants(connection, [tenant])
+        await engine.dispose()
+        await redis.aclose()
+
+    latencies: dict[str, list[float]] = {}
+    for outcome, latency in results:
+        latencies.setdefault(outcome, []).append(latency)
+    return {
+        "benchmark": "double_booking",
+        "started_at": datetime.now(tz=UTC).isoformat(),
+        "bookings": bookings,
+        "masters": masters,
+        "booked": len(latencies.get("booked", [])),
+        "slot_taken": len(latencies.get("slot_taken", [])),
+        "errors": len(latencies.get("error", [])),
+        "duration_s": duration,
+        "latency": summarize([latency for _, latency in results]),
+        "by_outcome": {outcome: summarize(values) for outcome, values in latencies.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Book one slot concurrently and count the commits")
+    parser.add_argument("--bookings", type=int, default=500)
+    parser.add_argument("--masters", type=int, default=1, help="masters providing the service, one booking each wins")
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.bookings, args.masters))
+    save_report("double_booking", report, args.output)
+    if report["booked"] != args.masters or report["errors"]:
+        raise SystemExit(f"Expected {args.masters} booked and no errors, got {report['booked']} and {report['errors']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Compare the master editor's branch and service lists before and after the LEFT JOIN.
+
+Seeds one bot with 5k branches, 5k services and 1k masters holding 50 of each
+(50k associations per table), then times MasterDbGateway.get_available_branches
+and get_available_services against the UNION ALL queries they replaced, and records
+the EXPLAIN ANALYZE plan of each statement. "sql" times the statement alone through
+the driver. "call" times the whole read: the gateways load domain objects from the
+rows, while the UNION ALL queries stop at ORM rows, as their per-row conversion is
+gone. Everything runs in one transaction that is rolled back at the end.
+
+    PYTHONPATH=src python benchmarks/master_associations.py
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from common import create_bench_engine, save_report, seed_tenant, summarize
+from sqlalchemy import Select, event, literal, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from hub.domain.models.bot import BotId
+from hub.domain.models.master import MasterId
+from hub.infrastructure.database.adapters.master import MasterDbGateway
+from hub.infrastructure.database.models import (
+    BranchMasterAssociationModel,
+    BranchModel,
+    CityModel,
+    MasterModel,
+    ServiceMasterAssociationModel,
+    ServiceModel,
+)
+
+MIDDLE_MASTER = text(
+    "SELECT id FROM masters WHERE bot_id = :bot_id ORDER BY id OFFSET (SELECT count(*) / 2 FROM masters "
+    "WHERE bot_id = :bot_id) LIMIT 1",
+)
+
+
+def union_available_branches(bot_id: BotId, master_id: MasterId) -> Select[Any]:
+    """The query get_available_branches ran before the LEFT JOIN rewrite."""
+    subquery = select(BranchModel.id).join(CityModel).where(CityModel.bot_id == bot_id)
+    return (
+        select(literal(value=True).label("is_associated"), BranchModel)
+        .join(BranchMasterAssociationModel, BranchModel.id == BranchMasterAssociationModel.branch_id)
+        .filter(BranchMasterAssociationModel.master_id == master_id, BranchModel.id.in_(subquery))
+        .union_all(
+            select(literal(value=False).label("is_associated"), BranchModel).filter(
+                BranchModel.id.in_(subquery),
+                ~BranchModel.masters.any(MasterModel.id == master_id),
+            ),
+        )
+    )
+
+
+def union_available_services(bot_id: BotId, master_id: MasterId) -> Select[Any]:
+    """The query get_available_services ran before the LEFT JOIN rewrite."""
+    subquery = select(ServiceModel.id).where(ServiceModel.bot_id == bot_id)
+    return (
+        select(literal(value=True).label("is_associated"), ServiceModel)
+        .join(ServiceMasterAssociationModel, ServiceModel.id == ServiceMasterAssociationModel.service_id)
+        .filter(ServiceMasterAssociationModel.master_id == master_id, ServiceModel.id.in_(subquery))
+        .union_all(
+            select(literal(value=False).label("is_associated"), ServiceModel).filter(
+                ServiceModel.id.in_(subquery),
+                ~ServiceModel.masters.any(MasterModel.id == master_id),
+            ),
+        )
+    )
+
+
+async def measure(
+    connection: AsyncConnection,
+    call: Callable[[AsyncSession], Awaitable[list[Any]]],
+    iterations: int,
+) -> dict[str, Any]:
+    statements: list[tuple[str, Any]] = []
+
+    def capture(_conn: Any, _cursor: Any, statement: str, parameters: Any, *_: Any) -> None:
+        statements.append((statement, parameters))
+
+    session = AsyncSession(bind=connection)
+    event.listen(connection.sync_engine, "before_cursor_execute", capture)
+    try:
+        rows = len(await call(session))
+    finally:
+        event.remove(connection.sync_engine, "before_cursor_execute", capture)
+
+    # The statement alone, sent and fetched through the driver, then the whole call with row loading
+    sql_latencies = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        for statement, parameters in statements:
+            (await connection.exec_driver_sql(statement, parameters)).all()
+        sql_latencies.append(time.perf_counter() - started_at)
+    call_latencies = []
+    for _ in range(iterations):
+        session.expunge_all()
+        started_at = time.perf_counter()
+        await call(session)
+        call_latencies.append(time.perf_counter() - started_at)
+
+    plans = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters)
+        plans.append(result.scalar_one()[0])
+    return {
+        "rows": rows,
+        "execution_ms": sum(plan["Execution Time"] for plan in plans),
+        "shared_buffers_hit": sum(plan["Plan"].get("Shared Hit Blocks", 0) for plan in plans),
+        "sql": summarize(sql_latencies),
+        "call": summarize(call_latencies),
+        "plans": [plan["Plan"] for plan in plans],
+    }
+
+
+async def run(iterations: int) -> dict[str, Any]:
+    engine = create_bench_engine()
+    try:
+        async with engine.connect() as connection:
+            tenant = await seed_tenant(
+                connection,
+                cities=50,
+                branches=5_000,
+                services=5_000,
+                masters=1_000,
+                branches_per_master=50,
+                services_per_master=50,
+            )
+            await connection.execute(text("ANALYZE"))
+            master_id = (await connection.execute(MIDDLE_MASTER, {"bot_id": tenant.bot_id})).scalar_one()
+            bot_id = tenant.bot_id
+
+            cases: dict[str, Callable[[AsyncSession], Awaitable[list[Any]]]] = {
+                "branches_union_all": lambda session: _all(session, union_available_branches(bot_id, master_id)),
+                "branches_left_join": lambda session: MasterDbGateway(session).get_available_branches(
+                    bot_id,
+                    master_id,
+                ),
+                "services_union_all": lambda session: _all(session, union_available_services(bot_id, master_id)),
+                "services_left_join": lambda session: MasterDbGateway(session).get_available_services(
+                    bot_id,
+                    master_id,
+                ),
+            }
+            results = {name: await measure(connection, call, iterations) for name, call in cases.items()}
+            await connection.rollback()
+    finally:
+        await engine.dispose()
+
+    return {
+        "benchmark": "master_associations",
+        "started_at": datetime.now(tz=UTC).isoformat(),
+        "branches": 5_000,
+        "services": 5_000,
+        "associations_per_table": 50_000,
+        "iterations": iterations,
+        "cases": results,
+    }
+
+
+async def _all(session: AsyncSession, query: Select[Any]) -> list[Any]:
+    return list((await session.execute(query)).all())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the master editor association lists")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    save_report("master_associations", asyncio.run(run(args.iterations)), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Measure the memory and construction time of the slotted domain models.
+
+Builds 100k instances of a few domain models, which are frozen and slotted, and
+of mutable dataclasses with the same fields with and without slots. Reports the
+bytes tracemalloc sees allocated per instance, the list holding them included (8
+bytes each), and the construction time. The field values are built beforehand and
+shared by all cases, so only the instances themselves are counted.
+
+    PYTHONPATH=src python benchmarks/model_memory.py
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import fields, make_dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from common import save_report
+
+from hub.domain.models.appointment import Appointment
+from hub.domain.models.client import Client
+from hub.domain.models.master import Master
+
+SAMPLES: dict[type, Callable[[int], tuple[Any, ...]]] = {
+    Master: lambda n: (n, f"Master {n}", 1, n % 50),
+    Client: lambda n: (n, 10**9 + n, f"Client {n}", 1, n % 50),
+    Appointment: lambda n: (
+        n,
+        datetime(2026, 1, 1, tzinfo=UTC) + timedelta(hours=n),
+        datetime(2026, 1, 1, 1, tzinfo=UTC) + timedelta(hours=n),
+        n % 1000,
+        n,
+        n % 30,
+    ),
+}
+
+
+def rebuild(cls: type, *, slots: bool) -> type:
+    """The same fields in a mutable dataclass, with or without slots."""
+    return make_dataclass(cls.__name__, [(field.name, field.type) for field in fields(cls)], slots=slots)
+
+
+def measure(cls: type, values: list[tuple[Any, ...]]) -> dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(*args) for args in values]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del instances
+
+    gc.collect()
+    started_at = time.perf_counter()
+    instances = [cls(*args) for args in values]
+    duration = time.perf_counter() - started_at
+    del instances
+    return {
+        "bytes_per_instance": allocated / len(values),
+        "total_mb": allocated / 2**20,
+        "construct_ms": duration * 1000,
+    }
+
+
+def run(count: int) -> dict[str, Any]:
+    models = {}
+    for cls, sample in SAMPLES.items():
+        values = [sample(n) for n in range(count)]
+        models[cls.__name__] = {
+            "plain": measure(rebuild(cls, slots=False), values),
+            "slotted": measure(rebuild(cls, slots=True), values),
+            "slotted_frozen": measure(cls, values),
+        }
+    return {
+        "benchmark": "model_memory",
+        "started_at": datetime.now(tz=UTC).isoformat(),
+        "instances": count,
+        "models": models,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure memory per instance of the domain models")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    save_report("model_memory", run(args.count), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compare identity and boxed domain new types.
+
+Loads 100k master row mappings into Master, whose ids and names are identity new
+types, and into a twin of it whose fields are boxed new types, with loaders from
+the shared retort. Also times calling the types directly on the same values.
+
+    PYTHONPATH=src python benchmarks/new_type.py
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from common import save_report, summarize
+
+from hub.domain.models.bot import BotId
+from hub.domain.models.city import CityId
+from hub.domain.models.master import Master, MasterId, MasterName
+from hub.domain.new_type import new_type
+from hub.infrastructure.database.converters import master_row_loader, retort
+
+BoxedMasterId = new_type("BoxedMasterId", int, boxed=True)
+BoxedMasterName = new_type("BoxedMasterName", str, boxed=True)
+BoxedBotId = new_type("BoxedBotId", int, boxed=True)
+BoxedCityId = new_type("BoxedCityId", int, boxed=True)
+
+
+@dataclass(frozen=True, slots=True)
+class BoxedMaster:
+    id: BoxedMasterId | None
+    name: BoxedMasterName
+
+    bot_id: BoxedBotId
+    city_id: BoxedCityId
+
+
+boxed_master_row_loader = retort.get_loader(BoxedMaster)
+
+
+def time_calls(call: Callable[[], Any], iterations: int) -> dict[str, float | int]:
+    latencies = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started_at)
+    return summarize(latencies)
+
+
+def run(count: int, iterations: int) -> dict[str, Any]:
+    rows = [{"id": n, "name": f"Master {n}", "bot_id": 1, "city_id": n % 50} for n in range(count)]
+    return {
+        "benchmark": "new_type",
+        "started_at": datetime.now(tz=UTC).isoformat(),
+        "rows": count,
+        "iterations": iterations,
+        "load": {
+            "identity": time_calls(lambda: [master_row_loader(row) for row in rows], iterations),
+            "boxed": time_calls(lambda: [boxed_master_row_loader(row) for row in rows], iterations),
+        },
+        "construct": {
+            "identity": time_calls(
+                lambda: [
+                    Master(MasterId(row["id"]), MasterName(row["name"]), BotId(row["bot_id"]), CityId(row["city_id"]))
+                    for row in rows
+                ],
+                iterations,
+            ),
+            "boxed": time_calls(
+                lambda: [
+                    BoxedMaster(
+                        BoxedMasterId(row["id"]),
+                        BoxedMasterName(row["name"]),
+                        BoxedBotId(row["bot_id"]),
+                        BoxedCityId(row["city_id"]),
+                    )
+                    for row in rows
+                ],
+                iterations,
+            ),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time identity against boxed new types")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    save_report("new_type", run(args.rows, args.iterations), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Compare ORM hydration with row mappings fed to precompiled loaders.
+
+Seeds one bot with 10k masters, then reads them the way list reads used to, ORM
+instances copied by master_converter, and the way they do now, row mappings fed to
+master_row_loader, plus the same loader built with strict_coercion=False and debug
+trails disabled. "read" times the whole query, "convert" only the conversion
+of rows fetched beforehand. Everything runs in one transaction that is rolled back
+at the end.
+
+    PYTHONPATH=src python benchmarks/row_loading.py
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from adaptix import DebugTrail, Retort
+from common import create_bench_engine, save_report, seed_tenant, summarize
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from hub.domain.models.master import Master
+from hub.domain.new_type import NewTypeUnwrappingProvider
+from hub.infrastructure.database.converters import master_converter, master_row_loader
+from hub.infrastructure.database.models import MasterModel
+
+lax_master_row_loader = Retort(
+    recipe=[NewTypeUnwrappingProvider()],
+    strict_coercion=False,
+    debug_trail=DebugTrail.DISABLE,
+).get_loader(Master)
+
+
+def time_calls(call: Callable[[], Any], iterations: int) -> dict[str, float | int]:
+    latencies = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started_at)
+    return summarize(latencies)
+
+
+async def run(masters: int, iterations: int) -> dict[str, Any]:
+    engine = create_bench_engine()
+    try:
+        async with engine.connect() as connection:
+            tenant = await seed_tenant(connection, cities=10, masters=masters)
+            await connection.execute(text("ANALYZE masters"))
+            session = AsyncSession(bind=connection)
+            models_query = select(MasterModel).where(MasterModel.bot_id == tenant.bot_id)
+            rows_query = select(*MasterModel.__table__.columns).where(MasterModel.bot_id == tenant.bot_id)
+
+            async def read_models() -> list[Master]:
+                session.expunge_all()
+                return [master_converter(master) for master in await session.scalars(models_query)]
+
+            async def read_rows(row_loader: Callable[[Any], Master]) -> list[Master]:
+                return [row_loader(row) for row in (await session.execute(rows_query)).mappings()]
+
+            reads = {
+                "orm_converter": read_models,
+                "mappings_loader": lambda: read_rows(master_row_loader),
+                "mappings_lax_loader": lambda: read_rows(lax_master_row_loader),
+            }
+            read_latencies: dict[str, list[float]] = {name: [] for name in reads}
+            for _ in range(iterations):
+                # Interleaved so that drift of the machine spreads over all cases
+                for name, read in reads.items():
+                    started_at = time.perf_counter()
+                    await read()
+                    read_latencies[name].append(time.perf_counter() - started_at)
+
+            session.expunge_all()
+            models = list(await session.scalars(models_query))
+            rows = list((await session.execute(rows_query)).mappings())
+            converts = {
+                "orm_converter": time_calls(lambda: [master_converter(model) for model in models], iterations),
+                "mappings_loader": time_calls(lambda: [master_row_loader(row) for row in rows], iterations),
+                "mappings_lax_loader": time_calls(
+                    lambda: [lax_master_row_loader(row) for row in rows],
+                    iterations,
+                ),
+            }
+            await connection.rollback()
+    finally:
+        await engine.dispose()
+
+    return {
+        "benchmark": "row_loading",
+        "started_at": datetime.now(tz=UTC).isoformat(),
+        "rows": len(rows),
+        "iterations": iterations,
+        "read": {name: summarize(latencies) for name, latencies in read_latencies.items()},
+        "convert": converts,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time ORM hydration against row mapping loaders")
+    parser.add_argument("--masters", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    save_report("row_loading", asyncio.run(run(args.masters, args.iterations)), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+
+import pytz
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import (
+    AppointmentSaver,
+    ClientAppointmentsCache,
+    Committer,
+    DayAvailabilityCache,
+    ReminderQueue,
+)
+from hub.domain.models.appointment import AppointmentId
+from hub.domain.models.bot import BotId
+from hub.domain.models.client import ClientId
+from hub.domain.models.schedule import SLOT_STEP, WORKING_DAY_END, WORKING_DAY_START
+from hub.domain.models.timezone import TimeZone
+from hub.domain.services.availability import compute_available_days
+from ..booking.get_available_slots import GetAvailableSlotsDbGateway
+
+
+@dataclass
+class CancelAppointmentDTO:
+    bot_id: BotId
+    client_id: ClientId
+    appointment_id: AppointmentId
+    timezone: TimeZone
+
+
+class CancelAppointmentDbGateway(Committer, AppointmentSaver, Protocol):
+    pass
+
+
+class CancelAppointment(Interactor[CancelAppointmentDTO, None]):
+    def __init__(
+        self,
+        db_gateway: CancelAppointmentDbGateway,
+        schedule_db_gateway: GetAvailableSlotsDbGateway,
+        availability_cache: DayAvailabilityCache,
+        appointments_cache: ClientAppointmentsCache,
+        reminder_queue: ReminderQueue,
+    ):
+        self.db_gateway = db_gateway
+        self.schedule_db_gateway = schedule_db_gateway
+        self.availability_cache = availability_cache
+        self.appointments_cache = appointments_cache
+        self.reminder_queue = reminder_queue
+
+    async def __call__(self, data: CancelAppointmentDTO) -> None:
+        appointment = await self.db_gateway.delete_client_appointment(data.appointment_id, data.client_id)
+        await self.db_gateway.commit()
+        await self.appointments_cache.invalidate(data.client_id)
+        await self.reminder_queue.cancel(data.appointment_id)
+
+        if appointment.service_id is None:
+            await self.availability_cache.invalidate(data.bot_id)
+            return
+        tz = pytz.timezone(data.timezone)
+        day = appointment.date_time.astimezone(tz).date()
+        opens_at = tz.localize(datetime.combine(day, WORKING_DAY_START))
+        closes_at = tz.localize(datetime.combine(day, WORKING_DAY_END))
+        schedules = await self.schedule_db_gateway.get_master_schedules(
+            bot_id=data.bot_id,
+            service_id=appointment.service_id,
+            start=opens_at,
+            end=closes_at,
+        )
+        available_days = compute_available_days(
+            schedules=schedules,
+            days=[(opens_at, closes_at)],
+            step=SLOT_STEP,
+            not_before=datetime.now(tz=tz),
+        )
+        await self.availability_cache.update_day(
+            bot_id=data.bot_id,
+            service_id=appointment.service_id,
+            timezone=data.timezone,
+            day=day,
+            is_available=bool(available_days),
+        )
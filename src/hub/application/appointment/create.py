@@ -0,0 +1,117 @@
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Protocol
+
+import pytz
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import (
+    AppointmentSaver,
+    ClientAppointmentsCache,
+    Committer,
+    DayAvailabilityCache,
+    ReminderQueue,
+)
+from hub.domain.models.appointment import Appointment
+from hub.domain.models.bot import BotId
+from hub.domain.models.client import ClientId, ClientTelegramId
+from hub.domain.models.schedule import SLOT_STEP, WORKING_DAY_END, WORKING_DAY_START, BusyInterval
+from hub.domain.models.service import ServiceId
+from hub.domain.models.timezone import TimeZone
+from hub.domain.services.availability import compute_available_days, iter_free_starts
+from hub.domain.services.reminders import plan_reminders
+from ..booking.get_available_slots import GetAvailableSlotsDbGateway
+from .exceptions import SlotAlreadyTakenError
+
+
+@dataclass
+class CreateAppointmentDTO:
+    bot_id: BotId
+    client_id: ClientId
+    client_telegram_id: ClientTelegramId
+    service_id: ServiceId
+    date_time: datetime
+    timezone: TimeZone
+
+
+class CreateAppointmentDbGateway(Committer, AppointmentSaver, Protocol):
+    pass
+
+
+class CreateAppointment(Interactor[CreateAppointmentDTO, Appointment]):
+    def __init__(
+        self,
+        db_gateway: CreateAppointmentDbGateway,
+        schedule_db_gateway: GetAvailableSlotsDbGateway,
+        availability_cache: DayAvailabilityCache,
+        appointments_cache: ClientAppointmentsCache,
+        reminder_queue: ReminderQueue,
+    ):
+        self.db_gateway = db_gateway
+        self.schedule_db_gateway = schedule_db_gateway
+        self.availability_cache = availability_cache
+        self.appointments_cache = appointments_cache
+        self.reminder_queue = reminder_queue
+
+    async def __call__(self, data: CreateAppointmentDTO) -> Appointment:
+        tz = pytz.timezone(data.timezone)
+        day = data.date_time.astimezone(tz).date()
+        opens_at = tz.localize(datetime.combine(day, WORKING_DAY_START))
+        closes_at = tz.localize(datetime.combine(day, WORKING_DAY_END))
+        now = datetime.now(tz=tz)
+        schedules = await self.schedule_db_gateway.get_master_schedules(
+            bot_id=data.bot_id,
+            service_id=data.service_id,
+            start=opens_at,
+            end=closes_at,
+        )
+        candidates = [
+            schedule
+            for schedule in schedules
+            if data.date_time in iter_free_starts(schedule, opens_at, closes_at, SLOT_STEP, not_before=now)
+        ]
+        # The schedule may already be stale, the exclusion constraint on appointments
+        # is what actually decides whether the master is still free.
+        for schedule in candidates:
+            appointment = Appointment(
+                id=None,
+                date_time=data.date_time,
+                end_date_time=data.date_time + timedelta(minutes=schedule.work_time + schedule.break_time),
+                master_id=schedule.master_id,
+                client_id=data.client_id,
+                service_id=data.service_id,
+            )
+            try:
+                appointment_id = await self.db_gateway.save_appointment(appointment)
+            except SlotAlreadyTakenError:
+                continue
+            await self.db_gateway.commit()
+            await self.appointments_cache.invalidate(data.client_id)
+            appointment = replace(appointment, id=appointment_id)
+            await self.reminder_queue.schedule(
+                plan_reminders(
+                    appointment_id=appointment_id,
+                    appointment_date_time=appointment.date_time,
+                    bot_id=data.bot_id,
+                    chat_id=data.client_telegram_id,
+                    timezone=data.timezone,
+                    not_before=datetime.now(tz=tz),
+                ),
+            )
+
+            schedule.busy.append(BusyInterval(start=appointment.date_time, end=appointment.end_date_time))
+            available_days = compute_available_days(
+                schedules=schedules,
+                days=[(opens_at, closes_at)],
+                step=SLOT_STEP,
+                not_before=datetime.now(tz=tz),
+            )
+            await self.availability_cache.update_day(
+                bot_id=data.bot_id,
+                service_id=data.service_id,
+                timezone=data.timezone,
+                day=day,
+                is_available=bool(available_days),
+            )
+            return appointment
+        raise SlotAlreadyTakenError
@@ -0,0 +1,9 @@
+from hub.application.common.exceptions import ApplicationError
+
+
+class SlotAlreadyTakenError(ApplicationError):
+    """Raised when trying to book a slot, but no master is free at that time anymore"""
+
+
+class AppointmentIdNotExistsError(ApplicationError):
+    """Raised when the appointment is gone or belongs to another client"""
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Protocol
+
+import pytz
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import AppointmentReader
+from hub.application.common.pagination import Page
+from hub.domain.models.appointment import Appointment, AppointmentCursor
+from hub.domain.models.branch import BranchId
+from hub.domain.models.timezone import TimeZone
+
+
+@dataclass
+class GetBranchDayAppointmentsDTO:
+    branch_id: BranchId
+    date: date
+    timezone: TimeZone
+    limit: int
+    after: AppointmentCursor | None = None
+
+
+class GetBranchDayAppointmentsDbGateway(AppointmentReader, Protocol):
+    pass
+
+
+class GetBranchDayAppointments(Interactor[GetBranchDayAppointmentsDTO, Page[Appointment]]):
+    def __init__(self, db_gateway: GetBranchDayAppointmentsDbGateway):
+        self.db_gateway = db_gateway
+
+    async def __call__(self, data: GetBranchDayAppointmentsDTO) -> Page[Appointment]:
+        tz = pytz.timezone(data.timezone)
+        return await self.db_gateway.get_branch_appointments(
+            branch_id=data.branch_id,
+            start=tz.localize(datetime.combine(data.date, time.min)),
+            end=tz.localize(datetime.combine(data.date + timedelta(days=1), time.min)),
+            after=data.after,
+            limit=data.limit,
+        )
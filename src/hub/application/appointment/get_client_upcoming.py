@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Protocol
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import AppointmentReader, ClientAppointmentsCache
+from hub.application.common.pagination import Page
+from hub.domain.models.appointment import AppointmentCursor, ClientAppointment
+from hub.domain.models.client import ClientId
+
+
+@dataclass
+class GetClientUpcomingAppointmentsDTO:
+    client_id: ClientId
+    limit: int
+    after: AppointmentCursor | None = None
+
+
+class GetClientUpcomingAppointmentsDbGateway(AppointmentReader, Protocol):
+    pass
+
+
+class GetClientUpcomingAppointments(Interactor[GetClientUpcomingAppointmentsDTO, Page[ClientAppointment]]):
+    def __init__(
+        self,
+        db_gateway: GetClientUpcomingAppointmentsDbGateway,
+        appointments_cache: ClientAppointmentsCache,
+    ):
+        self.db_gateway = db_gateway
+        self.appointments_cache = appointments_cache
+
+    async def __call__(self, data: GetClientUpcomingAppointmentsDTO) -> Page[ClientAppointment]:
+        page = await self.appointments_cache.get_page(data.client_id, data.after)
+        if page is not None and page.limit == data.limit:
+            return page
+        page = await self.db_gateway.get_client_upcoming_appointments(
+            client_id=data.client_id,
+            now=datetime.now(tz=UTC),
+            after=data.after,
+            limit=data.limit,
+        )
+        await self.appointments_cache.save_page(data.client_id, data.after, page)
+        return page
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Protocol
+
+import pytz
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import AppointmentReader
+from hub.application.common.pagination import Page
+from hub.domain.models.appointment import Appointment, AppointmentCursor
+from hub.domain.models.master import MasterId
+from hub.domain.models.timezone import TimeZone
+
+
+@dataclass
+class GetMasterDayAppointmentsDTO:
+    master_id: MasterId
+    date: date
+    timezone: TimeZone
+    limit: int
+    after: AppointmentCursor | None = None
+
+
+class GetMasterDayAppointmentsDbGateway(AppointmentReader, Protocol):
+    pass
+
+
+class GetMasterDayAppointments(Interactor[GetMasterDayAppointmentsDTO, Page[Appointment]]):
+    def __init__(self, db_gateway: GetMasterDayAppointmentsDbGateway):
+        self.db_gateway = db_gateway
+
+    async def __call__(self, data: GetMasterDayAppointmentsDTO) -> Page[Appointment]:
+        tz = pytz.timezone(data.timezone)
+        return await self.db_gateway.get_master_appointments(
+            master_id=data.master_id,
+            start=tz.localize(datetime.combine(data.date, time.min)),
+            end=tz.localize(datetime.combine(data.date + timedelta(days=1), time.min)),
+            after=data.after,
+            limit=data.limit,
+        )
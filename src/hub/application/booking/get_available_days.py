@@ -0,0 +1,70 @@
+from calendar import monthrange
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Protocol
+
+import pytz
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import DayAvailabilityCache, ScheduleReader
+from hub.domain.models.bot import BotId
+from hub.domain.models.schedule import SLOT_STEP, WORKING_DAY_END, WORKING_DAY_START
+from hub.domain.models.service import ServiceId
+from hub.domain.models.timezone import TimeZone
+from hub.domain.services.availability import compute_available_days, next_grid_point
+
+
+@dataclass
+class GetAvailableDaysDTO:
+    bot_id: BotId
+    service_id: ServiceId
+    month: date
+    timezone: TimeZone
+
+
+class GetAvailableDaysDbGateway(ScheduleReader, Protocol):
+    pass
+
+
+class GetAvailableDays(Interactor[GetAvailableDaysDTO, set[date]]):
+    def __init__(self, db_gateway: GetAvailableDaysDbGateway, cache: DayAvailabilityCache):
+        self.db_gateway = db_gateway
+        self.cache = cache
+
+    async def __call__(self, data: GetAvailableDaysDTO) -> set[date]:
+        month = data.month.replace(day=1)
+        month_days = [month.replace(day=day) for day in range(1, monthrange(month.year, month.month)[1] + 1)]
+        available_days = await self.cache.get_month(data.bot_id, data.service_id, data.timezone, month)
+        if available_days is None:
+            tz = pytz.timezone(data.timezone)
+            now = datetime.now(tz=tz)
+            working_days = [
+                (
+                    tz.localize(datetime.combine(day, WORKING_DAY_START)),
+                    tz.localize(datetime.combine(day, WORKING_DAY_END)),
+                )
+                for day in month_days
+            ]
+            schedules = await self.db_gateway.get_master_schedules(
+                bot_id=data.bot_id,
+                service_id=data.service_id,
+                start=working_days[0][0],
+                end=working_days[-1][1],
+            )
+            available_days = compute_available_days(
+                schedules=schedules,
+                days=working_days,
+                step=SLOT_STEP,
+                not_before=now,
+            )
+            # Days are local to the client's city, so every timezone gets its own entry,
+            # and it lasts until the next slot start could drop a day.
+            await self.cache.save_month(
+                bot_id=data.bot_id,
+                service_id=data.service_id,
+                timezone=data.timezone,
+                month=month,
+                available_days=available_days,
+                valid_until=next_grid_point(working_days, SLOT_STEP, now),
+            )
+        return {day for offset, day in enumerate(month_days) if available_days & (1 << offset)}
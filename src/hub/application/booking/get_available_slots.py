@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Protocol
+
+import pytz
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import ScheduleReader
+from hub.domain.models.bot import BotId
+from hub.domain.models.schedule import SLOT_STEP, WORKING_DAY_END, WORKING_DAY_START, Slot
+from hub.domain.models.service import ServiceId
+from hub.domain.models.timezone import TimeZone
+from hub.domain.services.availability import compute_slots
+
+
+@dataclass
+class GetAvailableSlotsDTO:
+    bot_id: BotId
+    service_id: ServiceId
+    date: date
+    timezone: TimeZone
+
+
+class GetAvailableSlotsDbGateway(ScheduleReader, Protocol):
+    pass
+
+
+class GetAvailableSlots(Interactor[GetAvailableSlotsDTO, list[Slot]]):
+    def __init__(self, db_gateway: GetAvailableSlotsDbGateway):
+        self.db_gateway = db_gateway
+
+    async def __call__(self, data: GetAvailableSlotsDTO) -> list[Slot]:
+        tz = pytz.timezone(data.timezone)
+        opens_at = tz.localize(datetime.combine(data.date, WORKING_DAY_START))
+        closes_at = tz.localize(datetime.combine(data.date, WORKING_DAY_END))
+        schedules = await self.db_gateway.get_master_schedules(
+            bot_id=data.bot_id,
+            service_id=data.service_id,
+            start=opens_at,
+            end=closes_at,
+        )
+        return compute_slots(
+            schedules=schedules,
+            opens_at=opens_at,
+            closes_at=closes_at,
+            step=SLOT_STEP,
+            not_before=datetime.now(tz=tz),
+        )
@@ -1,8 +1,6 @@
 from dataclasses import dataclass
 from typing import Protocol
 
-from aiogram import Bot as AiogramBot
-from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.exceptions import TelegramUnauthorizedError
 from aiogram.utils.token import TokenValidationError
 
@@ -10,6 +8,7 @@ from hub.application.common.interactor import Interactor
 from hub.application.common.interfaces import BotReader, BotSaver, Committer
 from hub.domain.models.bot import Bot, BotId, BotToken
 from hub.domain.models.manager import ManagerId
+from hub.infrastructure.telegram.registry import TenantBotRegistry
 from hub.infrastructure.webhook_url import MultibotWebhookUrl
 from .exceptions import BotAlreadyExistsError, BotTokenNotExistsError, InvalidBotTokenError
 
@@ -34,9 +33,11 @@ class CreateBot(Interactor[NewBotDTO, BotId]):
         self,
         db_gateway: CreateBotDbGateway,
         multibot_webhook_url: MultibotWebhookUrl,
+        bot_registry: TenantBotRegistry,
     ):
         self.db_gateway = db_gateway
         self.multibot_webhook_url = multibot_webhook_url
+        self.bot_registry = bot_registry
 
     async def __call__(self, data: NewBotDTO) -> BotId:
         try:
@@ -44,18 +45,16 @@ class CreateBot(Interactor[NewBotDTO, BotId]):
             raise BotAlreadyExistsError
         except BotTokenNotExistsError:
             pass
-        session = AiohttpSession()
-        aiogram_bot = AiogramBot(data.token, session=session)
         try:
+            aiogram_bot = self.bot_registry.get(data.token)
             aiogram_bot_data = await aiogram_bot.get_me()
         except (TokenValidationError, TelegramUnauthorizedError) as err:
+            self.bot_registry.discard(data.token)
             raise InvalidBotTokenError from err
         else:
             await aiogram_bot.delete_webhook(drop_pending_updates=True)
             webhook_url = self.multibot_webhook_url.format(bot_token=data.token)
             await aiogram_bot.set_webhook(webhook_url)
-        finally:
-            await session.close()
         bot_id = await self.db_gateway.save_bot(
             Bot(
                 id=None,
@@ -26,7 +26,6 @@ class GetBotBranches(Interactor[GetBotBranchesDTO, list[Branch]]):
         if data.bot_id:
             return await self.db_gateway.get_bot_branches(data.bot_id)
         elif data.bot_telegram_id:
-            bot = await self.db_gateway.get_bot_by_telegram_id(data.bot_telegram_id)
-            return await self.db_gateway.get_bot_branches(bot.id)
+            return await self.db_gateway.get_bot_branches_by_telegram_id(data.bot_telegram_id)
         else:
             raise InsufficientDataError
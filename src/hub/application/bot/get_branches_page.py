@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import BotReader
+from hub.application.common.pagination import Page
+from hub.domain.models.bot import BotId
+from hub.domain.models.branch import Branch, BranchId
+
+
+@dataclass
+class GetBotBranchesPageDTO:
+    bot_id: BotId
+    limit: int
+    after_id: BranchId | None = None
+
+
+class GetBotBranchesPageDbGateway(BotReader, Protocol):
+    pass
+
+
+class GetBotBranchesPage(Interactor[GetBotBranchesPageDTO, Page[Branch]]):
+    def __init__(self, db_gateway: GetBotBranchesPageDbGateway):
+        self.db_gateway = db_gateway
+
+    async def __call__(self, data: GetBotBranchesPageDTO) -> Page[Branch]:
+        return await self.db_gateway.get_bot_branches_page(data.bot_id, data.after_id, data.limit)
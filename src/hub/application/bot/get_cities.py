@@ -26,7 +26,6 @@ class GetBotCities(Interactor[GetBotCitiesDTO, list[City]]):
         if data.bot_id is not None:
             return await self.db_gateway.get_bot_cities(data.bot_id)
         elif data.bot_telegram_id is not None:
-            bot = await self.db_gateway.get_bot_by_telegram_id(data.bot_telegram_id)
-            return await self.db_gateway.get_bot_cities(bot.id)
+            return await self.db_gateway.get_bot_cities_by_telegram_id(data.bot_telegram_id)
         else:
             raise InsufficientDataError
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import BotReader
+from hub.application.common.pagination import Page
+from hub.domain.models.bot import BotId
+from hub.domain.models.city import City, CityId
+
+
+@dataclass
+class GetBotCitiesPageDTO:
+    bot_id: BotId
+    limit: int
+    after_id: CityId | None = None
+
+
+class GetBotCitiesPageDbGateway(BotReader, Protocol):
+    pass
+
+
+class GetBotCitiesPage(Interactor[GetBotCitiesPageDTO, Page[City]]):
+    def __init__(self, db_gateway: GetBotCitiesPageDbGateway):
+        self.db_gateway = db_gateway
+
+    async def __call__(self, data: GetBotCitiesPageDTO) -> Page[City]:
+        return await self.db_gateway.get_bot_cities_page(data.bot_id, data.after_id, data.limit)
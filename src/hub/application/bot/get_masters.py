@@ -26,7 +26,6 @@ class GetBotMasters(Interactor[GetBotMastersDTO, list[Master]]):
         if data.bot_id:
             return await self.db_gateway.get_bot_masters(data.bot_id)
         elif data.bot_telegram_id:
-            bot = await self.db_gateway.get_bot_by_telegram_id(data.bot_telegram_id)
-            return await self.db_gateway.get_bot_masters(bot.id)
+            return await self.db_gateway.get_bot_masters_by_telegram_id(data.bot_telegram_id)
         else:
             raise InsufficientDataError
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import BotReader
+from hub.application.common.pagination import Page
+from hub.domain.models.bot import BotId
+from hub.domain.models.master import Master, MasterId
+
+
+@dataclass
+class GetBotMastersPageDTO:
+    bot_id: BotId
+    limit: int
+    after_id: MasterId | None = None
+
+
+class GetBotMastersPageDbGateway(BotReader, Protocol):
+    pass
+
+
+class GetBotMastersPage(Interactor[GetBotMastersPageDTO, Page[Master]]):
+    def __init__(self, db_gateway: GetBotMastersPageDbGateway):
+        self.db_gateway = db_gateway
+
+    async def __call__(self, data: GetBotMastersPageDTO) -> Page[Master]:
+        return await self.db_gateway.get_bot_masters_page(data.bot_id, data.after_id, data.limit)
@@ -26,7 +26,6 @@ class GetBotServices(Interactor[GetBotServicesDTO, list[Service]]):
         if data.bot_id:
             return await self.db_gateway.get_bot_services(data.bot_id)
         elif data.bot_telegram_id:
-            bot = await self.db_gateway.get_bot_by_telegram_id(data.bot_telegram_id)
-            return await self.db_gateway.get_bot_services(bot.id)
+            return await self.db_gateway.get_bot_services_by_telegram_id(data.bot_telegram_id)
         else:
             raise InsufficientDataError
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import BotReader
+from hub.application.common.pagination import Page
+from hub.domain.models.bot import BotId
+from hub.domain.models.service import Service, ServiceId
+
+
+@dataclass
+class GetBotServicesPageDTO:
+    bot_id: BotId
+    limit: int
+    after_id: ServiceId | None = None
+
+
+class GetBotServicesPageDbGateway(BotReader, Protocol):
+    pass
+
+
+class GetBotServicesPage(Interactor[GetBotServicesPageDTO, Page[Service]]):
+    def __init__(self, db_gateway: GetBotServicesPageDbGateway):
+        self.db_gateway = db_gateway
+
+    async def __call__(self, data: GetBotServicesPageDTO) -> Page[Service]:
+        return await self.db_gateway.get_bot_services_page(data.bot_id, data.after_id, data.limit)
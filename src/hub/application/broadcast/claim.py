@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Protocol
+from uuid import uuid4
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import BroadcastSaver, Committer
+from hub.domain.models.broadcast import Broadcast, BroadcastLeaseToken
+
+# A worker renews the lease with every batch, a broadcast left longer than this is taken over
+BROADCAST_LEASE = timedelta(minutes=5)
+
+
+@dataclass
+class ClaimBroadcastDTO:
+    lease: timedelta = BROADCAST_LEASE
+
+
+class ClaimBroadcastDbGateway(Committer, BroadcastSaver, Protocol):
+    pass
+
+
+class ClaimBroadcast(Interactor[ClaimBroadcastDTO, Broadcast | None]):
+    def __init__(self, db_gateway: ClaimBroadcastDbGateway):
+        self.db_gateway = db_gateway
+
+    async def __call__(self, data: ClaimBroadcastDTO) -> Broadcast | None:
+        now = datetime.now(tz=UTC)
+        broadcast = await self.db_gateway.claim_broadcast(
+            now=now,
+            lease_until=now + data.lease,
+            lease_token=BroadcastLeaseToken(uuid4()),
+        )
+        await self.db_gateway.commit()
+        return broadcast
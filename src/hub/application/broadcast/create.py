@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import BroadcastSaver, Committer
+from hub.domain.models.bot import BotId
+from hub.domain.models.broadcast import Broadcast, BroadcastId, BroadcastStatus, BroadcastText
+
+
+@dataclass
+class CreateBroadcastDTO:
+    bot_id: BotId
+    text: BroadcastText
+
+
+class CreateBroadcastDbGateway(Committer, BroadcastSaver, Protocol):
+    pass
+
+
+class CreateBroadcast(Interactor[CreateBroadcastDTO, BroadcastId]):
+    """Queue a message to every client of the bot, the broadcast worker sends it."""
+
+    def __init__(self, db_gateway: CreateBroadcastDbGateway):
+        self.db_gateway = db_gateway
+
+    async def __call__(self, data: CreateBroadcastDTO) -> BroadcastId:
+        broadcast_id = await self.db_gateway.save_broadcast(
+            Broadcast(
+                id=None,
+                bot_id=data.bot_id,
+                text=data.text,
+                status=BroadcastStatus.PENDING,
+                last_client_id=None,
+                delivered=0,
+                blocked=0,
+                failed=0,
+            ),
+        )
+        await self.db_gateway.commit()
+        return broadcast_id
@@ -0,0 +1,9 @@
+from hub.application.common.exceptions import ApplicationError
+
+
+class BroadcastIdNotExistsError(ApplicationError):
+    """Raised when trying to get a broadcast, but the specified BroadcastId does not exist"""
+
+
+class BroadcastLeaseLostError(ApplicationError):
+    """Raised when another worker claimed the broadcast after this one's lease ran out"""
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import BroadcastReader
+from hub.domain.models.broadcast import Broadcast, BroadcastId
+
+
+@dataclass
+class GetBroadcastDTO:
+    broadcast_id: BroadcastId
+
+
+class GetBroadcastDbGateway(BroadcastReader, Protocol):
+    pass
+
+
+class GetBroadcast(Interactor[GetBroadcastDTO, Broadcast]):
+    def __init__(self, db_gateway: GetBroadcastDbGateway):
+        self.db_gateway = db_gateway
+
+    async def __call__(self, data: GetBroadcastDTO) -> Broadcast:
+        return await self.db_gateway.get_broadcast(data.broadcast_id)
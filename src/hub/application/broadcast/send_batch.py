@@ -0,0 +1,78 @@
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from typing import Protocol
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import BroadcastReader, BroadcastSaver, BroadcastSender, Committer
+from hub.domain.models.broadcast import Broadcast, BroadcastStatus
+from ..bot.get import GetBotDbGateway
+from .claim import BROADCAST_LEASE
+from .exceptions import BroadcastLeaseLostError
+
+BROADCAST_BATCH_SIZE = 1000
+
+
+@dataclass
+class SendBroadcastBatchDTO:
+    broadcast: Broadcast
+    batch_size: int = BROADCAST_BATCH_SIZE
+    lease: timedelta = BROADCAST_LEASE
+
+
+class SendBroadcastBatchDbGateway(Committer, BroadcastReader, BroadcastSaver, Protocol):
+    pass
+
+
+class SendBroadcastBatch(Interactor[SendBroadcastBatchDTO, Broadcast]):
+    """Send the broadcast to the next batch of clients and record how far it got.
+
+    Progress is committed after every batch, so a restarted worker resends at most
+    one batch. Returns the broadcast as it is now, DONE once no clients are left.
+    Raises BroadcastLeaseLostError once another worker has claimed the broadcast.
+    """
+
+    def __init__(
+        self,
+        db_gateway: SendBroadcastBatchDbGateway,
+        bot_db_gateway: GetBotDbGateway,
+        sender: BroadcastSender,
+    ):
+        self.db_gateway = db_gateway
+        self.bot_db_gateway = bot_db_gateway
+        self.sender = sender
+
+    async def __call__(self, data: SendBroadcastBatchDTO) -> Broadcast:
+        broadcast = data.broadcast
+        if broadcast.id is None or broadcast.lease_token is None:
+            raise ValueError("Broadcast must be claimed before sending")
+        recipients = await self.db_gateway.get_broadcast_recipients(
+            bot_id=broadcast.bot_id,
+            after_client_id=broadcast.last_client_id,
+            limit=data.batch_size,
+        )
+        if not recipients:
+            if not await self.db_gateway.finish_broadcast(broadcast.id, broadcast.lease_token):
+                raise BroadcastLeaseLostError
+            await self.db_gateway.commit()
+            return replace(broadcast, status=BroadcastStatus.DONE)
+
+        bot = await self.bot_db_gateway.get_bot(broadcast.bot_id)
+        report = await self.sender.send(bot_token=bot.token, text=broadcast.text, recipients=recipients)
+        last_client_id = recipients[-1].client_id
+        saved = await self.db_gateway.save_broadcast_progress(
+            broadcast_id=broadcast.id,
+            lease_token=broadcast.lease_token,
+            last_client_id=last_client_id,
+            report=report,
+            lease_until=datetime.now(tz=UTC) + data.lease,
+        )
+        if not saved:
+            raise BroadcastLeaseLostError
+        await self.db_gateway.commit()
+        return replace(
+            broadcast,
+            last_client_id=last_client_id,
+            delivered=broadcast.delivered + report.delivered,
+            blocked=broadcast.blocked + report.blocked,
+            failed=broadcast.failed + report.failed,
+        )
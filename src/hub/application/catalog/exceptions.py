@@ -0,0 +1,8 @@
+from hub.application.common.exceptions import ApplicationError
+
+
+class InvalidCatalogValueError(ApplicationError):
+    def __init__(self, column: str, value: str | None):
+        super().__init__(column, value)
+        self.column = column
+        self.value = value
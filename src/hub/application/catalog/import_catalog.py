@@ -0,0 +1,107 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import CatalogSaver, Committer, DayAvailabilityCache
+from hub.domain.models.bot import BotId
+from hub.domain.models.catalog import CatalogImportReport, CatalogRow, CatalogRowError
+from hub.domain.models.timezone import TimeZone
+from .exceptions import InvalidCatalogValueError
+
+CATALOG_COLUMNS = (
+    "city",
+    "timezone",
+    "branch",
+    "address",
+    "service",
+    "description",
+    "master",
+    "work_time",
+    "break_time",
+)
+
+
+@dataclass
+class ImportCatalogDTO:
+    bot_id: BotId
+    # (line number, record) pairs, records map CATALOG_COLUMNS to raw values
+    rows: Iterable[tuple[int, Mapping[str, Any]]]
+
+
+class ImportCatalogDbGateway(Committer, CatalogSaver, Protocol):
+    pass
+
+
+def _get_text(record: Mapping[str, Any], column: str) -> str | None:
+    value = record.get(column)
+    if value is None:
+        return None
+    return str(value).strip() or None
+
+
+def _require_text(record: Mapping[str, Any], column: str) -> str:
+    value = _get_text(record, column)
+    if value is None:
+        raise InvalidCatalogValueError(column, None)
+    return value
+
+
+def _get_minutes(record: Mapping[str, Any], column: str, minimum: int) -> int | None:
+    value = _get_text(record, column)
+    if value is None:
+        return None
+    if not value.isdigit() or int(value) < minimum:
+        raise InvalidCatalogValueError(column, value)
+    return int(value)
+
+
+def parse_catalog_row(record: Mapping[str, Any]) -> CatalogRow:
+    timezone_name = _require_text(record, "timezone")
+    try:
+        timezone = TimeZone(timezone_name)
+    except ValueError as err:
+        raise InvalidCatalogValueError("timezone", timezone_name) from err
+    branch_name = _get_text(record, "branch")
+    service_name = _get_text(record, "service")
+    master_name = _get_text(record, "master")
+    work_time = _get_minutes(record, "work_time", minimum=1)
+    break_time = _get_minutes(record, "break_time", minimum=0)
+    # Times belong to the master-service pair, they mean nothing without both
+    if master_name is None or service_name is None:
+        for column, value in (("work_time", work_time), ("break_time", break_time)):
+            if value is not None:
+                raise InvalidCatalogValueError(column, str(value))
+    return CatalogRow(
+        city_name=_require_text(record, "city"),
+        timezone=timezone,
+        branch_name=branch_name,
+        branch_address=_require_text(record, "address") if branch_name is not None else None,
+        service_name=service_name,
+        service_description=_get_text(record, "description"),
+        master_name=master_name,
+        work_time=work_time,
+        break_time=break_time,
+    )
+
+
+class ImportCatalog(Interactor[ImportCatalogDTO, CatalogImportReport]):
+    def __init__(self, db_gateway: ImportCatalogDbGateway, availability_cache: DayAvailabilityCache):
+        self.db_gateway = db_gateway
+        self.availability_cache = availability_cache
+
+    async def __call__(self, data: ImportCatalogDTO) -> CatalogImportReport:
+        rows: list[CatalogRow] = []
+        errors: list[CatalogRowError] = []
+        for line, record in data.rows:
+            try:
+                rows.append(parse_catalog_row(record))
+            except InvalidCatalogValueError as err:
+                errors.append(CatalogRowError(line=line, column=err.column, value=err.value))
+        report = CatalogImportReport()
+        if rows:
+            report = await self.db_gateway.import_catalog(data.bot_id, rows)
+            await self.db_gateway.commit()
+            await self.availability_cache.invalidate(data.bot_id)
+        report.errors = errors
+        return report
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+from hub.domain.models.bot import BotTelegramId
+from hub.domain.models.client import ClientContext, ClientTelegramId
+from ..common.interactor import Interactor
+from ..common.interfaces import ClientReader
+
+
+@dataclass
+class GetClientContextDTO:
+    bot_telegram_id: BotTelegramId
+    # None for updates without a user, their context has no client
+    telegram_id: ClientTelegramId | None
+
+
+class GetClientContextDbGateway(ClientReader, Protocol):
+    pass
+
+
+class GetClientContext(Interactor[GetClientContextDTO, ClientContext]):
+    def __init__(self, db_gateway: GetClientContextDbGateway):
+        self.db_gateway = db_gateway
+
+    async def __call__(self, data: GetClientContextDTO) -> ClientContext:
+        return await self.db_gateway.get_client_context(
+            bot_telegram_id=data.bot_telegram_id,
+            telegram_id=data.telegram_id,
+        )
@@ -1,13 +1,29 @@
 from abc import abstractmethod
-from typing import Protocol
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+from typing import Any, Protocol
 
+from hub.application.common.pagination import Page
+from hub.domain.models.appointment import Appointment, AppointmentCursor, AppointmentId, ClientAppointment
 from hub.domain.models.bot import Bot, BotId, BotTelegramId, BotToken
 from hub.domain.models.branch import AvailableBranch, Branch, BranchId
+from hub.domain.models.broadcast import (
+    Broadcast,
+    BroadcastId,
+    BroadcastLeaseToken,
+    BroadcastRecipient,
+    BroadcastText,
+    DeliveryReport,
+)
+from hub.domain.models.catalog import CatalogImportReport, CatalogRow
 from hub.domain.models.city import City, CityId, CityName
-from hub.domain.models.client import Client, ClientId, ClientTelegramId
+from hub.domain.models.client import Client, ClientContext, ClientId, ClientTelegramId
 from hub.domain.models.manager import Manager, ManagerId, ManagerTelegramId
 from hub.domain.models.master import Master, MasterId
+from hub.domain.models.reminder import Reminder
+from hub.domain.models.schedule import MasterSchedule
 from hub.domain.models.service import AvailableService, Service, ServiceId
+from hub.domain.models.service_master import MasterAssociationsDiff
 from hub.domain.models.timezone import TimeZone
 
 
@@ -50,6 +66,38 @@ class BotReader(Protocol):
     async def get_bot_masters(self, bot_id: BotId) -> list[Master]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_bot_cities_page(self, bot_id: BotId, after_id: CityId | None, limit: int) -> Page[City]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_bot_services_page(self, bot_id: BotId, after_id: ServiceId | None, limit: int) -> Page[Service]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_bot_branches_page(self, bot_id: BotId, after_id: BranchId | None, limit: int) -> Page[Branch]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_bot_masters_page(self, bot_id: BotId, after_id: MasterId | None, limit: int) -> Page[Master]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_bot_cities_by_telegram_id(self, bot_telegram_id: BotTelegramId) -> list[City]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_bot_services_by_telegram_id(self, bot_telegram_id: BotTelegramId) -> list[Service]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_bot_branches_by_telegram_id(self, bot_telegram_id: BotTelegramId) -> list[Branch]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_bot_masters_by_telegram_id(self, bot_telegram_id: BotTelegramId) -> list[Master]:
+        raise NotImplementedError
+
 
 class BotSaver(Protocol):
     @abstractmethod
@@ -142,88 +190,268 @@ class MasterReader(Protocol):
     async def get_available_services(self, bot_id: BotId, master_id: MasterId) -> list[AvailableService]:
         raise NotImplementedError
 
+
+class MasterSaver(Protocol):
     @abstractmethod
-    async def check_master_attached_to_branch(self, master_id: MasterId, branch_id: BranchId) -> bool:
+    async def save_master(self, master: Master) -> MasterId:
         raise NotImplementedError
 
     @abstractmethod
-    async def check_master_provides_service(self, master_id: MasterId, service_id: ServiceId) -> bool:
+    async def update_master_name(self, master_id: MasterId, name: str) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_master_associations(self, master_id: MasterId, diff: MasterAssociationsDiff) -> None:
+        raise NotImplementedError
 
-class MasterSaver(Protocol):
     @abstractmethod
-    async def save_master(self, master: Master) -> MasterId:
+    async def delete_master(self, master_id: MasterId) -> None:
         raise NotImplementedError
 
+
+class ServiceReader(Protocol):
     @abstractmethod
-    async def update_master_name(self, master_id: MasterId, name: str) -> None:
+    async def get_service(self, service_id: ServiceId) -> Service:
         raise NotImplementedError
 
+
+class ServiceSaver(Protocol):
     @abstractmethod
-    async def attach_master_to_branch(self, master_id: MasterId, branch_id: BranchId) -> None:
+    async def save_service(self, bot_id: BotId, service: Service) -> ServiceId:
         raise NotImplementedError
 
     @abstractmethod
-    async def detach_master_from_branch(self, master_id: MasterId, branch_id: BranchId) -> None:
+    async def update_service_name(self, service_id: ServiceId, name: str) -> None:
         raise NotImplementedError
 
     @abstractmethod
-    async def master_provide_service(self, master_id: MasterId, service_id: ServiceId) -> None:
+    async def update_service_description(self, service_id: ServiceId, description: str) -> None:
         raise NotImplementedError
 
     @abstractmethod
-    async def master_withhold_service(self, master_id: MasterId, service_id: ServiceId) -> None:
+    async def delete_service(self, service_id: ServiceId) -> None:
         raise NotImplementedError
 
+
+class ClientReader(Protocol):
     @abstractmethod
-    async def update_master_work_time(self, master_id: MasterId, service_id: ServiceId, work_time: int) -> None:
+    async def get_client(self, client_id: ClientId) -> Client:
         raise NotImplementedError
 
     @abstractmethod
-    async def update_master_break_time(self, master_id: MasterId, service_id: ServiceId, break_time: int) -> None:
+    async def get_client_by_telegram_id(self, bot_id: BotId, telegram_id: ClientTelegramId) -> Client:
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_master(self, master_id: MasterId) -> None:
+    async def get_client_context(
+        self,
+        bot_telegram_id: BotTelegramId,
+        telegram_id: ClientTelegramId | None,
+    ) -> ClientContext:
         raise NotImplementedError
 
 
-class ServiceReader(Protocol):
+class ClientSaver(Protocol):
     @abstractmethod
-    async def get_service(self, service_id: ServiceId) -> Service:
+    async def save_client(self, client: Client) -> ClientId:
         raise NotImplementedError
 
 
-class ServiceSaver(Protocol):
+class ScheduleReader(Protocol):
     @abstractmethod
-    async def save_service(self, bot_id: BotId, service: Service) -> ServiceId:
+    async def get_master_schedules(
+        self,
+        bot_id: BotId,
+        service_id: ServiceId,
+        start: datetime,
+        end: datetime,
+    ) -> list[MasterSchedule]:
         raise NotImplementedError
 
+
+class DayAvailabilityCache(Protocol):
     @abstractmethod
-    async def update_service_name(self, service_id: ServiceId, name: str) -> None:
+    async def get_month(self, bot_id: BotId, service_id: ServiceId, timezone: TimeZone, month: date) -> int | None:
         raise NotImplementedError
 
     @abstractmethod
-    async def update_service_description(self, service_id: ServiceId, description: str) -> None:
+    async def save_month(
+        self,
+        bot_id: BotId,
+        service_id: ServiceId,
+        timezone: TimeZone,
+        month: date,
+        available_days: int,
+        valid_until: datetime | None,
+    ) -> None:
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_service(self, service_id: ServiceId) -> None:
+    async def update_day(
+        self,
+        bot_id: BotId,
+        service_id: ServiceId,
+        timezone: TimeZone,
+        day: date,
+        *,
+        is_available: bool,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self, bot_id: BotId) -> None:
         raise NotImplementedError
 
 
-class ClientReader(Protocol):
+class AppointmentSaver(Protocol):
     @abstractmethod
-    async def get_client(self, client_id: ClientId) -> Client:
+    async def save_appointment(self, appointment: Appointment) -> AppointmentId:
         raise NotImplementedError
 
     @abstractmethod
-    async def get_client_by_telegram_id(self, bot_id: BotId, telegram_id: ClientTelegramId) -> Client:
+    async def delete_client_appointment(self, appointment_id: AppointmentId, client_id: ClientId) -> Appointment:
         raise NotImplementedError
 
 
-class ClientSaver(Protocol):
+class AppointmentReader(Protocol):
     @abstractmethod
-    async def save_client(self, client: Client) -> ClientId:
+    async def get_master_appointments(
+        self,
+        master_id: MasterId,
+        start: datetime,
+        end: datetime,
+        after: AppointmentCursor | None,
+        limit: int,
+    ) -> Page[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_branch_appointments(
+        self,
+        branch_id: BranchId,
+        start: datetime,
+        end: datetime,
+        after: AppointmentCursor | None,
+        limit: int,
+    ) -> Page[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_client_upcoming_appointments(
+        self,
+        client_id: ClientId,
+        now: datetime,
+        after: AppointmentCursor | None,
+        limit: int,
+    ) -> Page[ClientAppointment]:
+        raise NotImplementedError
+
+
+class ClientAppointmentsCache(Protocol):
+    @abstractmethod
+    async def get_page(self, client_id: ClientId, after: AppointmentCursor | None) -> Page[ClientAppointment] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_page(
+        self,
+        client_id: ClientId,
+        after: AppointmentCursor | None,
+        page: Page[ClientAppointment],
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self, client_id: ClientId) -> None:
+        raise NotImplementedError
+
+
+class CatalogSaver(Protocol):
+    @abstractmethod
+    async def import_catalog(self, bot_id: BotId, rows: list[CatalogRow]) -> CatalogImportReport:
+        raise NotImplementedError
+
+
+class BotDataReader(Protocol):
+    @abstractmethod
+    def stream_bot_data(self, bot_id: BotId) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Yield (record type, record) pairs for everything stored for the bot, without buffering."""
+        raise NotImplementedError
+
+
+class ReminderQueue(Protocol):
+    @abstractmethod
+    async def schedule(self, reminders: list[Reminder]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def cancel(self, appointment_id: AppointmentId) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def pop_due(self, now: datetime, limit: int) -> list[Reminder]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def reschedule(self, reminders: list[Reminder]) -> None:
+        """Put popped reminders back, except those whose appointment was cancelled since."""
+        raise NotImplementedError
+
+
+class BroadcastReader(Protocol):
+    @abstractmethod
+    async def get_broadcast(self, broadcast_id: BroadcastId) -> Broadcast:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_broadcast_recipients(
+        self,
+        bot_id: BotId,
+        after_client_id: ClientId | None,
+        limit: int,
+    ) -> list[BroadcastRecipient]:
+        raise NotImplementedError
+
+
+class BroadcastSaver(Protocol):
+    @abstractmethod
+    async def save_broadcast(self, broadcast: Broadcast) -> BroadcastId:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim_broadcast(
+        self,
+        now: datetime,
+        lease_until: datetime,
+        lease_token: BroadcastLeaseToken,
+    ) -> Broadcast | None:
+        """Take a pending broadcast, or a running one whose worker let its lease expire."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_broadcast_progress(
+        self,
+        broadcast_id: BroadcastId,
+        lease_token: BroadcastLeaseToken,
+        last_client_id: ClientId,
+        report: DeliveryReport,
+        lease_until: datetime,
+    ) -> bool:
+        """Record a sent batch, False if the lease was taken over and nothing was recorded."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def finish_broadcast(self, broadcast_id: BroadcastId, lease_token: BroadcastLeaseToken) -> bool:
+        """Mark the broadcast done, False if the lease was taken over and it was left as is."""
+        raise NotImplementedError
+
+
+class BroadcastSender(Protocol):
+    @abstractmethod
+    async def send(
+        self,
+        bot_token: BotToken,
+        text: BroadcastText,
+        recipients: list[BroadcastRecipient],
+    ) -> DeliveryReport:
         raise NotImplementedError
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from math import ceil
+from typing import Generic, TypeVar
+
+ItemT = TypeVar("ItemT")
+
+
+@dataclass
+class Page(Generic[ItemT]):
+    """One keyset page: items come after the requested id, total counts the whole list."""
+
+    items: list[ItemT]
+    total: int
+    limit: int
+
+    @property
+    def pages(self) -> int:
+        return ceil(self.total / self.limit) if self.limit else 0
+
+    @property
+    def is_full(self) -> bool:
+        return len(self.items) == self.limit
@@ -0,0 +1,61 @@
+import json
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Protocol
+
+from hub.application.common.interactor import Interactor
+from hub.application.common.interfaces import BotDataReader
+from hub.domain.models.bot import BotId
+
+# Lines are joined into chunks of roughly this size before they are handed out
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class ExportBotDTO:
+    bot_id: BotId
+
+
+class ExportBotDbGateway(BotDataReader, Protocol):
+    pass
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ExportBot(Interactor[ExportBotDTO, AsyncIterator[bytes]]):
+    """Export everything stored for a bot as NDJSON, one {"type": ..., "data": ...} object per line.
+
+    The result is an async iterator of byte chunks, consume it while the request scope is alive.
+    """
+
+    def __init__(self, db_gateway: ExportBotDbGateway):
+        self.db_gateway = db_gateway
+
+    async def __call__(self, data: ExportBotDTO) -> AsyncIterator[bytes]:
+        return self._iter_chunks(data.bot_id)
+
+    async def _iter_chunks(self, bot_id: BotId) -> AsyncIterator[bytes]:
+        chunk: list[bytes] = []
+        chunk_size = 0
+        async for record_type, record in self.db_gateway.stream_bot_data(bot_id):
+            line = (
+                json.dumps(
+                    {"type": record_type, "data": record},
+                    ensure_ascii=False,
+                    default=_json_default,
+                ).encode()
+                + b"\n"
+            )
+            chunk.append(line)
+            chunk_size += len(line)
+            if chunk_size >= EXPORT_CHUNK_SIZE:
+                yield b"".join(chunk)
+                chunk.clear()
+                chunk_size = 0
+        if chunk:
+            yield b"".join(chunk)
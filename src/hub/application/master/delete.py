@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Protocol
 
 from hub.application.common.interactor import Interactor
-from hub.application.common.interfaces import Committer, MasterSaver
+from hub.application.common.interfaces import Committer, DayAvailabilityCache, MasterReader, MasterSaver
 from hub.domain.models.master import MasterId
 
 
@@ -11,14 +11,17 @@ class DeleteMasterDTO:
     master_id: MasterId
 
 
-class DeleteMasterDbGateway(Committer, MasterSaver, Protocol):
+class DeleteMasterDbGateway(Committer, MasterReader, MasterSaver, Protocol):
     pass
 
 
 class DeleteMaster(Interactor[DeleteMasterDTO, None]):
-    def __init__(self, db_gateway: DeleteMasterDbGateway):
+    def __init__(self, db_gateway: DeleteMasterDbGateway, availability_cache: DayAvailabilityCache):
         self.db_gateway = db_gateway
+        self.availability_cache = availability_cache
 
     async def __call__(self, data: DeleteMasterDTO) -> None:
+        master = await self.db_gateway.get_master(data.master_id)
         await self.db_gateway.delete_master(data.master_id)
         await self.db_gateway.commit()
+        await self.availability_cache.invalidate(master.bot_id)
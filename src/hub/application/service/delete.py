@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Protocol
 
 from hub.application.common.interactor import Interactor
-from hub.application.common.interfaces import Committer, ServiceSaver
+from hub.application.common.interfaces import Committer, DayAvailabilityCache, ServiceReader, ServiceSaver
 from hub.domain.models.service import ServiceId
 
 
@@ -11,14 +11,17 @@ class DeleteServiceDTO:
     service_id: ServiceId
 
 
-class DeleteServiceDbGateway(Committer, ServiceSaver, Protocol):
+class DeleteServiceDbGateway(Committer, ServiceReader, ServiceSaver, Protocol):
     pass
 
 
 class DeleteService(Interactor[DeleteServiceDTO, None]):
-    def __init__(self, db_gateway: DeleteServiceDbGateway):
+    def __init__(self, db_gateway: DeleteServiceDbGateway, availability_cache: DayAvailabilityCache):
         self.db_gateway = db_gateway
+        self.availability_cache = availability_cache
 
     async def __call__(self, data: DeleteServiceDTO) -> None:
+        service = await self.db_gateway.get_service(data.service_id)
         await self.db_gateway.delete_service(data.service_id)
         await self.db_gateway.commit()
+        await self.availability_cache.invalidate(service.bot_id)
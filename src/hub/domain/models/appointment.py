@@ -1,17 +1,36 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from hub.domain.models.branch import BranchAddress, BranchName
 from hub.domain.models.client import ClientId
-from hub.domain.models.master import MasterId
+from hub.domain.models.master import MasterId, MasterName
+from hub.domain.models.service import ServiceId, ServiceName
 from hub.domain.new_type import new_type
 
 AppointmentId = int
 AppointmentDateTime = datetime
+# Keyset position in a date-ordered appointment list
+AppointmentCursor = tuple[AppointmentDateTime, AppointmentId]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Appointment:
     id: AppointmentId | None
     date_time: AppointmentDateTime
+    end_date_time: AppointmentDateTime
     master_id: MasterId
     client_id: ClientId
+    service_id: ServiceId | None
+
+
+@dataclass(frozen=True, slots=True)
+class ClientAppointment:
+    """Appointment as the client sees it, with names instead of ids"""
+
+    id: AppointmentId
+    date_time: AppointmentDateTime
+    end_date_time: AppointmentDateTime
+    master_name: MasterName
+    service_name: ServiceName | None
+    branch_name: BranchName | None
+    branch_address: BranchAddress | None
@@ -9,7 +9,7 @@ BotToken = str
 BotName = str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Bot:
     id: BotId | None
     token: BotToken
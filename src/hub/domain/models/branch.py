@@ -8,7 +8,7 @@ BranchName = new_type("BranchName", str)
 BranchAddress = new_type("BranchAddress", str)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Branch:
     id: BranchId | None
     name: BranchName
@@ -17,6 +17,6 @@ class Branch:
     city_id: CityId
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AvailableBranch(Branch):
     is_associated: bool
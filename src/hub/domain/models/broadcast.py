@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from enum import StrEnum
+from uuid import UUID
+
+from hub.domain.models.bot import BotId
+from hub.domain.models.client import ClientId, ClientTelegramId
+from hub.domain.new_type import new_type
+
+BroadcastId = new_type("BroadcastId", int)
+BroadcastText = new_type("BroadcastText", str)
+# Set anew by every claim, only the worker holding it may record progress
+BroadcastLeaseToken = new_type("BroadcastLeaseToken", UUID)
+
+
+class BroadcastStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+
+
+@dataclass(frozen=True, slots=True)
+class Broadcast:
+    id: BroadcastId | None
+    bot_id: BotId
+    text: BroadcastText
+    status: BroadcastStatus
+    # Clients are sent to in id order, everyone up to this id already has the message
+    last_client_id: ClientId | None
+    delivered: int
+    blocked: int
+    failed: int
+    lease_token: BroadcastLeaseToken | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BroadcastRecipient:
+    client_id: ClientId
+    chat_id: ClientTelegramId
+
+
+@dataclass(slots=True)
+class DeliveryReport:
+    delivered: int = 0
+    blocked: int = 0
+    failed: int = 0
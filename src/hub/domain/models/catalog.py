@@ -0,0 +1,41 @@
+from dataclasses import dataclass, field
+
+from hub.domain.models.branch import BranchAddress, BranchName
+from hub.domain.models.city import CityName
+from hub.domain.models.master import MasterName
+from hub.domain.models.service import ServiceDescription, ServiceName
+from hub.domain.models.service_master import BreakTime, WorkTime
+from hub.domain.models.timezone import TimeZone
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogRow:
+    """One imported line: a city and, optionally, a branch, a service and a master working there."""
+
+    city_name: CityName
+    timezone: TimeZone
+    branch_name: BranchName | None = None
+    branch_address: BranchAddress | None = None
+    service_name: ServiceName | None = None
+    service_description: ServiceDescription | None = None
+    master_name: MasterName | None = None
+    work_time: WorkTime | None = None
+    break_time: BreakTime | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogRowError:
+    line: int
+    column: str
+    value: str | None
+
+
+@dataclass(slots=True)
+class CatalogImportReport:
+    created_cities: int = 0
+    created_branches: int = 0
+    created_services: int = 0
+    created_masters: int = 0
+    updated: int = 0
+    links: int = 0
+    errors: list[CatalogRowError] = field(default_factory=list)
@@ -8,7 +8,7 @@ CityId = int
 CityName = str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class City:
     id: CityId | None
     name: CityName
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
-from hub.domain.models.bot import BotId
-from hub.domain.models.city import CityId
+from hub.domain.models.bot import Bot, BotId
+from hub.domain.models.city import City, CityId
 from hub.domain.new_type import new_type
 
 ClientId = new_type("ClientId", int)
@@ -9,7 +9,7 @@ ClientTelegramId = new_type("ClientTelegramId", int)
 ClientName = new_type("ClientName", str)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Client:
     id: ClientId
     telegram_id: ClientTelegramId
@@ -17,3 +17,10 @@ class Client:
 
     bot_id: BotId
     city_id: CityId
+
+
+@dataclass(frozen=True, slots=True)
+class ClientContext:
+    bot: Bot
+    client: Client | None
+    city: City | None
@@ -6,7 +6,7 @@ ManagerId = new_type("ManagerId", int)
 ManagerTelegramId = new_type("ManagerTelegramId", int)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Manager:
     id: ManagerId | None
     telegram_id: ManagerTelegramId | None
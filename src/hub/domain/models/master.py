@@ -8,7 +8,7 @@ MasterId = new_type("MasterId", int)
 MasterName = new_type("MasterName", str)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Master:
     id: MasterId | None
     name: MasterName
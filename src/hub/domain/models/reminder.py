@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from hub.domain.models.appointment import AppointmentDateTime, AppointmentId
+from hub.domain.models.bot import BotId
+from hub.domain.models.client import ClientTelegramId
+from hub.domain.models.timezone import TimeZone
+
+# How long before an appointment its reminders go out
+REMINDER_LEAD_TIMES = (timedelta(hours=24), timedelta(hours=2))
+
+
+@dataclass(frozen=True, slots=True)
+class Reminder:
+    appointment_id: AppointmentId
+    lead_time: timedelta
+    due_at: datetime
+
+    bot_id: BotId
+    chat_id: ClientTelegramId
+    appointment_date_time: AppointmentDateTime
+    timezone: TimeZone
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+
+from hub.domain.models.master import MasterId
+from hub.domain.models.service_master import BreakTime, WorkTime
+
+WORKING_DAY_START = time(hour=9)
+WORKING_DAY_END = time(hour=21)
+SLOT_STEP = timedelta(minutes=30)
+
+
+@dataclass(frozen=True, slots=True)
+class BusyInterval:
+    start: datetime
+    end: datetime
+
+
+@dataclass(slots=True)
+class MasterSchedule:
+    master_id: MasterId
+    work_time: WorkTime
+    break_time: BreakTime
+    busy: list[BusyInterval]
+
+
+@dataclass(slots=True)
+class Slot:
+    start: datetime
+    master_ids: list[MasterId]
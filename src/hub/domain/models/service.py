@@ -8,7 +8,7 @@ ServiceName = new_type("ServiceName", str)
 ServiceDescription = new_type("ServiceDescription", str)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Service:
     id: ServiceId | None
     name: ServiceName
@@ -17,6 +17,6 @@ class Service:
     bot_id: BotId
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AvailableService(Service):
     is_associated: bool
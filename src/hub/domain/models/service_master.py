@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from hub.domain.models.branch import BranchId
 from hub.domain.models.master import MasterId
 from hub.domain.models.service import ServiceId
 from hub.domain.new_type import new_type
@@ -7,11 +8,34 @@ from hub.domain.new_type import new_type
 WorkTime = new_type("WorkTime", int)
 BreakTime = new_type("BreakTime", int)
 
+DEFAULT_WORK_TIME = WorkTime(60)
+DEFAULT_BREAK_TIME = BreakTime(0)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ServiceMaster:
     work_time: WorkTime
     break_time: BreakTime
 
     service_id: ServiceId
     master_id: MasterId
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceMasterTime:
+    service_id: ServiceId
+    work_time: WorkTime | None = None
+    break_time: BreakTime | None = None
+
+
+@dataclass(slots=True)
+class MasterAssociationsDiff:
+    attach_branches: set[BranchId] = field(default_factory=set)
+    detach_branches: set[BranchId] = field(default_factory=set)
+    provide_services: set[ServiceId] = field(default_factory=set)
+    withhold_services: set[ServiceId] = field(default_factory=set)
+    service_times: list[ServiceMasterTime] = field(default_factory=list)
+
+    @property
+    def changes_services(self) -> bool:
+        return bool(self.provide_services or self.withhold_services or self.service_times)
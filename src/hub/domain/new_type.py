@@ -3,7 +3,7 @@
 #
 
 from dataclasses import replace
-from typing import TypeVar
+from typing import NewType, TypeVar
 
 from adaptix import CannotProvide, Dumper, Loader, Mediator
 from adaptix._internal.morphing.provider_template import DumperProvider, LoaderProvider
@@ -30,6 +30,9 @@ class NewTypeUnwrappingProvider(LoaderProvider, DumperProvider):
             ),
         )
 
+        if isinstance(new_type, IdentityNewType):
+            return supertype_loader
+
         def my_new_type_loader(data):
             return new_type(supertype_loader(data))
 
@@ -45,5 +48,27 @@ class NewTypeUnwrappingProvider(LoaderProvider, DumperProvider):
         )
 
 
-def new_type(name: str, cls: type):
-    return type(name, (cls,), {"__my_supertype__": cls})
+class IdentityNewType(NewType):
+    """typing.NewType marker that keeps __my_supertype__ for NewTypeUnwrappingProvider.
+
+    Values of the supertype pass through as is. Anything else is converted by the
+    supertype, so ids parsed from callback data still become ints.
+    """
+
+    def __init__(self, name: str, tp: type):
+        super().__init__(name, tp)
+        self.__my_supertype__ = tp
+
+    def __call__(self, x):
+        return x if type(x) is self.__supertype__ else self.__supertype__(x)
+
+
+def new_type(name: str, cls: type, *, boxed: bool = False):
+    """Create a distinct domain type over cls.
+
+    By default it is an IdentityNewType and costs nothing at runtime. boxed=True
+    builds a real subclass instead, so every value is re-allocated as that subclass.
+    """
+    if boxed:
+        return type(name, (cls,), {"__my_supertype__": cls})
+    return IdentityNewType(name, cls)
@@ -0,0 +1,114 @@
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from hub.domain.models.schedule import BusyInterval, MasterSchedule, Slot
+
+if TYPE_CHECKING:
+    from hub.domain.models.master import MasterId
+
+
+def merge_busy_intervals(busy: Iterable[BusyInterval]) -> list[BusyInterval]:
+    merged: list[BusyInterval] = []
+    for interval in sorted(busy, key=lambda item: item.start):
+        if merged and interval.start <= merged[-1].end:
+            if interval.end > merged[-1].end:
+                merged[-1] = BusyInterval(start=merged[-1].start, end=interval.end)
+        else:
+            merged.append(interval)
+    return merged
+
+
+def align_to_grid(moment: datetime, origin: datetime, step: timedelta) -> datetime:
+    """Round the moment up to the nearest point of the grid that starts at origin."""
+    if moment <= origin:
+        return origin
+    steps = -((origin - moment) // step)
+    return origin + steps * step
+
+
+def next_grid_point(days: Sequence[tuple[datetime, datetime]], step: timedelta, now: datetime) -> datetime | None:
+    """First slot start of the days not earlier than now.
+
+    Availability computed with not_before=now stays the same until then, None means
+    now is past every day and it never changes.
+    """
+    for opens_at, closes_at in days:
+        point = align_to_grid(now, opens_at, step)
+        if point <= closes_at:
+            return point
+    return None
+
+
+def _iter_free_starts(
+    work_time: timedelta,
+    occupied_time: timedelta,
+    busy: Sequence[BusyInterval],
+    opens_at: datetime,
+    closes_at: datetime,
+    step: timedelta,
+    not_before: datetime | None,
+) -> Iterator[datetime]:
+    index = bisect_right(busy, opens_at, key=lambda interval: interval.end)
+    start = opens_at if not_before is None else align_to_grid(not_before, opens_at, step)
+    while start + work_time <= closes_at:
+        while index < len(busy) and busy[index].end <= start:
+            index += 1
+        if index < len(busy) and busy[index].start < start + occupied_time:
+            start = align_to_grid(busy[index].end, opens_at, step)
+            continue
+        yield start
+        start += step
+
+
+def iter_free_starts(
+    schedule: MasterSchedule,
+    opens_at: datetime,
+    closes_at: datetime,
+    step: timedelta,
+    not_before: datetime | None = None,
+) -> Iterator[datetime]:
+    work_time = timedelta(minutes=schedule.work_time)
+    occupied_time = work_time + timedelta(minutes=schedule.break_time)
+    busy = merge_busy_intervals(schedule.busy)
+    return _iter_free_starts(work_time, occupied_time, busy, opens_at, closes_at, step, not_before)
+
+
+def compute_slots(
+    schedules: Iterable[MasterSchedule],
+    opens_at: datetime,
+    closes_at: datetime,
+    step: timedelta,
+    not_before: datetime | None = None,
+) -> list[Slot]:
+    masters_by_start: defaultdict[datetime, list[MasterId]] = defaultdict(list)
+    for schedule in schedules:
+        for start in iter_free_starts(schedule, opens_at, closes_at, step, not_before):
+            masters_by_start[start].append(schedule.master_id)
+    return [Slot(start=start, master_ids=master_ids) for start, master_ids in sorted(masters_by_start.items())]
+
+
+def compute_available_days(
+    schedules: Iterable[MasterSchedule],
+    days: Sequence[tuple[datetime, datetime]],
+    step: timedelta,
+    not_before: datetime | None = None,
+) -> int:
+    """Build a bitmap where bit N is set when days[N] has at least one free slot."""
+    available_days = 0
+    all_days = (1 << len(days)) - 1
+    for schedule in schedules:
+        work_time = timedelta(minutes=schedule.work_time)
+        occupied_time = work_time + timedelta(minutes=schedule.break_time)
+        busy = merge_busy_intervals(schedule.busy)
+        for offset, (opens_at, closes_at) in enumerate(days):
+            if available_days & (1 << offset):
+                continue
+            free_starts = _iter_free_starts(work_time, occupied_time, busy, opens_at, closes_at, step, not_before)
+            if next(free_starts, None) is not None:
+                available_days |= 1 << offset
+        if available_days == all_days:
+            break
+    return available_days
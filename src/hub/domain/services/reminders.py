@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from hub.domain.models.appointment import AppointmentDateTime, AppointmentId
+from hub.domain.models.bot import BotId
+from hub.domain.models.client import ClientTelegramId
+from hub.domain.models.reminder import REMINDER_LEAD_TIMES, Reminder
+from hub.domain.models.timezone import TimeZone
+
+
+def plan_reminders(
+    appointment_id: AppointmentId,
+    appointment_date_time: AppointmentDateTime,
+    bot_id: BotId,
+    chat_id: ClientTelegramId,
+    timezone: TimeZone,
+    not_before: datetime,
+) -> list[Reminder]:
+    """Reminders of an appointment that are still ahead of not_before."""
+    return [
+        Reminder(
+            appointment_id=appointment_id,
+            lead_time=lead_time,
+            due_at=appointment_date_time - lead_time,
+            bot_id=bot_id,
+            chat_id=chat_id,
+            appointment_date_time=appointment_date_time,
+            timezone=timezone,
+        )
+        for lead_time in REMINDER_LEAD_TIMES
+        if appointment_date_time - lead_time > not_before
+    ]
@@ -0,0 +1,36 @@
+import csv
+import json
+from collections.abc import Iterator
+from io import TextIOWrapper
+from pathlib import PurePath
+from typing import IO, Any
+
+
+class UnsupportedCatalogFileError(ValueError):
+    pass
+
+
+def read_catalog_file(file: IO[bytes], file_name: str) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield (line number, record) pairs from a CSV file with a header row or a JSON array of objects.
+
+    CSV is read lazily, so the whole file is never decoded at once. Decoding and syntax
+    problems surface as ValueError or csv.Error while iterating. The file is left open.
+    """
+    suffix = PurePath(file_name).suffix.lower()
+    if suffix == ".csv":
+        text = TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        try:
+            reader = csv.DictReader(text)
+            for record in reader:
+                yield reader.line_num, record
+        finally:
+            # A collected wrapper closes the file under it, which belongs to the caller
+            text.detach()
+    elif suffix == ".json":
+        records = json.load(file)
+        if not isinstance(records, list):
+            raise UnsupportedCatalogFileError("The JSON catalog must be an array of objects")
+        for number, record in enumerate(records, start=1):
+            yield number, record if isinstance(record, dict) else {}
+    else:
+        raise UnsupportedCatalogFileError(f"Unsupported catalog file type: {suffix or file_name}")
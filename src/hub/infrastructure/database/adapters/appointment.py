@@ -0,0 +1,158 @@
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from typing import Any, TypeVar
+
+from psycopg.errors import ExclusionViolation
+from sqlalchemy import ColumnElement, Select, delete, func, select, true, tuple_
+from sqlalchemy.exc import IntegrityError
+
+from hub.application.appointment.exceptions import AppointmentIdNotExistsError, SlotAlreadyTakenError
+from hub.application.common.interfaces import AppointmentReader, AppointmentSaver
+from hub.application.common.pagination import Page
+from hub.domain.models.appointment import Appointment, AppointmentCursor, AppointmentId, ClientAppointment
+from hub.domain.models.branch import BranchId
+from hub.domain.models.client import ClientId
+from hub.domain.models.master import MasterId
+from ..converters import appointment_row_loader, client_appointment_row_loader
+from ..models import AppointmentModel, BranchMasterAssociationModel, BranchModel, MasterModel, ServiceModel
+from .base import BaseDbGateway, CommiterImpl
+
+# Columns labelled after the Appointment fields so rows load without ORM hydration
+APPOINTMENT_COLUMNS = (
+    AppointmentModel.id,
+    AppointmentModel.date.label("date_time"),
+    AppointmentModel.end_date.label("end_date_time"),
+    AppointmentModel.master_id,
+    AppointmentModel.client_id,
+    AppointmentModel.service_id,
+)
+
+ItemT = TypeVar("ItemT")
+
+
+class AppointmentDbGateway(BaseDbGateway, CommiterImpl, AppointmentSaver, AppointmentReader):
+    async def _get_page(
+        self,
+        query: Select[Any],
+        after: AppointmentCursor | None,
+        limit: int,
+        loader: Callable[[Mapping[str, Any]], ItemT],
+    ) -> Page[ItemT]:
+        total = await self._session.scalar(query.with_only_columns(func.count(), maintain_column_froms=True))
+        conditions: list[ColumnElement[bool]] = []
+        if after is not None:
+            # Row comparison keeps (date, id) ordering stable for appointments starting at the same time
+            conditions.append(tuple_(AppointmentModel.date, AppointmentModel.id) > tuple_(*after))
+        rows = await self._session.execute(
+            query.where(*conditions).order_by(AppointmentModel.date, AppointmentModel.id).limit(limit),
+        )
+        return Page(items=[loader(row) for row in rows.mappings()], total=total or 0, limit=limit)
+
+    async def save_appointment(self, appointment: Appointment) -> AppointmentId:
+        appointment_model = AppointmentModel()
+        appointment_model.date = appointment.date_time
+        appointment_model.end_date = appointment.end_date_time
+        appointment_model.master_id = appointment.master_id
+        appointment_model.client_id = appointment.client_id
+        appointment_model.service_id = appointment.service_id
+
+        try:
+            async with self._session.begin_nested():
+                self._session.add(appointment_model)
+        except IntegrityError as e:
+            if isinstance(e.orig, ExclusionViolation):
+                raise SlotAlreadyTakenError from e
+            raise
+        return appointment_model.id
+
+    async def delete_client_appointment(self, appointment_id: AppointmentId, client_id: ClientId) -> Appointment:
+        row = await self._session.execute(
+            delete(AppointmentModel)
+            .where(AppointmentModel.id == appointment_id, AppointmentModel.client_id == client_id)
+            .returning(*APPOINTMENT_COLUMNS),
+        )
+        appointment = row.mappings().one_or_none()
+        if appointment is None:
+            raise AppointmentIdNotExistsError
+        return appointment_row_loader(appointment)
+
+    async def get_master_appointments(
+        self,
+        master_id: MasterId,
+        start: datetime,
+        end: datetime,
+        after: AppointmentCursor | None,
+        limit: int,
+    ) -> Page[Appointment]:
+        return await self._get_page(
+            select(*APPOINTMENT_COLUMNS).where(
+                AppointmentModel.master_id == master_id,
+                AppointmentModel.date >= start,
+                AppointmentModel.date < end,
+            ),
+            after,
+            limit,
+            appointment_row_loader,
+        )
+
+    async def get_branch_appointments(
+        self,
+        branch_id: BranchId,
+        start: datetime,
+        end: datetime,
+        after: AppointmentCursor | None,
+        limit: int,
+    ) -> Page[Appointment]:
+        return await self._get_page(
+            select(*APPOINTMENT_COLUMNS)
+            .join(
+                BranchMasterAssociationModel,
+                BranchMasterAssociationModel.master_id == AppointmentModel.master_id,
+            )
+            .where(
+                BranchMasterAssociationModel.branch_id == branch_id,
+                AppointmentModel.date >= start,
+                AppointmentModel.date < end,
+            ),
+            after,
+            limit,
+            appointment_row_loader,
+        )
+
+    async def get_client_upcoming_appointments(
+        self,
+        client_id: ClientId,
+        now: datetime,
+        after: AppointmentCursor | None,
+        limit: int,
+    ) -> Page[ClientAppointment]:
+        # Appointments do not record a branch, so the master's first branch stands in for it
+        branch = (
+            select(BranchModel.name, BranchModel.address)
+            .join(BranchMasterAssociationModel, BranchMasterAssociationModel.branch_id == BranchModel.id)
+            .where(BranchMasterAssociationModel.master_id == AppointmentModel.master_id)
+            .order_by(BranchModel.id)
+            .limit(1)
+            .lateral("branch")
+        )
+        return await self._get_page(
+            select(
+                AppointmentModel.id,
+                AppointmentModel.date.label("date_time"),
+                AppointmentModel.end_date.label("end_date_time"),
+                MasterModel.name.label("master_name"),
+                ServiceModel.name.label("service_name"),
+                branch.c.name.label("branch_name"),
+                branch.c.address.label("branch_address"),
+            )
+            .join(MasterModel, MasterModel.id == AppointmentModel.master_id)
+            .outerjoin(ServiceModel, ServiceModel.id == AppointmentModel.service_id)
+            .outerjoin(branch, true())
+            .where(
+                AppointmentModel.client_id == client_id,
+                AppointmentModel.date > now,
+            ),
+            after,
+            limit,
+            client_appointment_row_loader,
+        )
@@ -1,25 +1,49 @@
-from sqlalchemy import select
+from collections.abc import Callable, Mapping
+from dataclasses import replace
+from typing import Any, TypeVar
+
+from sqlalchemy import ColumnElement, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from hub.application.bot.exceptions import BotIdNotExistsError, BotTelegramIdNotExistsError, BotTokenNotExistsError
 from hub.application.common.interfaces import BotReader, BotSaver
+from hub.application.common.pagination import Page
 from hub.domain.models.bot import Bot, BotId, BotTelegramId, BotToken
-from hub.domain.models.branch import Branch
-from hub.domain.models.city import City
+from hub.domain.models.branch import Branch, BranchId
+from hub.domain.models.city import City, CityId
 from hub.domain.models.manager import ManagerId
-from hub.domain.models.master import Master
-from hub.domain.models.service import Service
+from hub.domain.models.master import Master, MasterId
+from hub.domain.models.service import Service, ServiceId
+from hub.infrastructure.ttl_cache import TTLCache
 from ..converters import (
     bot_converter,
-    branch_converter,
-    city_converter,
-    master_converter,
-    service_converter,
+    bot_row_loader,
+    branch_row_loader,
+    city_row_loader,
+    master_row_loader,
+    service_row_loader,
 )
 from ..models import BotModel, BranchModel, CityModel, MasterModel, ServiceModel
 from .base import BaseDbGateway, CommiterImpl
 
+ItemT = TypeVar("ItemT")
+
 
 class BotDbGateway(BaseDbGateway, CommiterImpl, BotReader, BotSaver):
+    async def _get_page(
+        self,
+        query: Select[Any],
+        id_column: InstrumentedAttribute[Any],
+        after_id: int | None,
+        limit: int,
+        loader: Callable[[Mapping[str, Any]], ItemT],
+    ) -> Page[ItemT]:
+        total = await self._session.scalar(query.with_only_columns(func.count(), maintain_column_froms=True))
+        conditions: list[ColumnElement[bool]] = [] if after_id is None else [id_column > after_id]
+        rows = await self._session.execute(query.where(*conditions).order_by(id_column).limit(limit))
+        return Page(items=[loader(row) for row in rows.mappings()], total=total or 0, limit=limit)
+
     async def get_bot(self, bot_id: BotId) -> Bot:
         bot = await self._session.get(BotModel, bot_id)
         if bot is None:
@@ -39,26 +63,89 @@ class BotDbGateway(BaseDbGateway, CommiterImpl, BotReader, BotSaver):
         return bot_converter(bot)
 
     async def get_bots_by_manager_id(self, manager_id: ManagerId) -> list[Bot]:
-        scalar_bots = await self._session.scalars(select(BotModel).where(BotModel.manager_id == manager_id))
-        return [bot_converter(bot) for bot in scalar_bots]
+        rows = await self._session.execute(select(*BotModel.__table__.columns).where(BotModel.manager_id == manager_id))
+        return [bot_row_loader(row) for row in rows.mappings()]
 
     async def get_bot_cities(self, bot_id: BotId) -> list[City]:
-        scalar_cities = await self._session.scalars(select(CityModel).where(CityModel.bot_id == bot_id))
-        return [city_converter(city) for city in scalar_cities]
+        rows = await self._session.execute(select(*CityModel.__table__.columns).where(CityModel.bot_id == bot_id))
+        return [city_row_loader(row) for row in rows.mappings()]
 
     async def get_bot_services(self, bot_id: BotId) -> list[Service]:
-        scalar_services = await self._session.scalars(select(ServiceModel).where(ServiceModel.bot_id == bot_id))
-        return [service_converter(service) for service in scalar_services]
+        rows = await self._session.execute(select(*ServiceModel.__table__.columns).where(ServiceModel.bot_id == bot_id))
+        return [service_row_loader(row) for row in rows.mappings()]
 
     async def get_bot_branches(self, bot_id: BotId) -> list[Branch]:
-        scalar_branches = await self._session.scalars(
-            select(BranchModel).join(CityModel).join(BotModel).where(BotModel.id == bot_id),
+        rows = await self._session.execute(
+            select(*BranchModel.__table__.columns).join(CityModel).join(BotModel).where(BotModel.id == bot_id),
         )
-        return [branch_converter(branch) for branch in scalar_branches]
+        return [branch_row_loader(row) for row in rows.mappings()]
 
     async def get_bot_masters(self, bot_id: BotId) -> list[Master]:
-        scalar_masters = await self._session.scalars(select(MasterModel).where(MasterModel.bot_id == bot_id))
-        return [master_converter(master) for master in scalar_masters]
+        rows = await self._session.execute(select(*MasterModel.__table__.columns).where(MasterModel.bot_id == bot_id))
+        return [master_row_loader(row) for row in rows.mappings()]
+
+    async def get_bot_cities_page(self, bot_id: BotId, after_id: CityId | None, limit: int) -> Page[City]:
+        return await self._get_page(
+            select(*CityModel.__table__.columns).where(CityModel.bot_id == bot_id),
+            CityModel.id,
+            after_id,
+            limit,
+            city_row_loader,
+        )
+
+    async def get_bot_services_page(self, bot_id: BotId, after_id: ServiceId | None, limit: int) -> Page[Service]:
+        return await self._get_page(
+            select(*ServiceModel.__table__.columns).where(ServiceModel.bot_id == bot_id),
+            ServiceModel.id,
+            after_id,
+            limit,
+            service_row_loader,
+        )
+
+    async def get_bot_branches_page(self, bot_id: BotId, after_id: BranchId | None, limit: int) -> Page[Branch]:
+        return await self._get_page(
+            select(*BranchModel.__table__.columns).join(CityModel).where(CityModel.bot_id == bot_id),
+            BranchModel.id,
+            after_id,
+            limit,
+            branch_row_loader,
+        )
+
+    async def get_bot_masters_page(self, bot_id: BotId, after_id: MasterId | None, limit: int) -> Page[Master]:
+        return await self._get_page(
+            select(*MasterModel.__table__.columns).where(MasterModel.bot_id == bot_id),
+            MasterModel.id,
+            after_id,
+            limit,
+            master_row_loader,
+        )
+
+    async def get_bot_cities_by_telegram_id(self, bot_telegram_id: BotTelegramId) -> list[City]:
+        rows = await self._session.execute(
+            select(*CityModel.__table__.columns).join(BotModel).where(BotModel.telegram_id == bot_telegram_id),
+        )
+        return [city_row_loader(row) for row in rows.mappings()]
+
+    async def get_bot_services_by_telegram_id(self, bot_telegram_id: BotTelegramId) -> list[Service]:
+        rows = await self._session.execute(
+            select(*ServiceModel.__table__.columns).join(BotModel).where(BotModel.telegram_id == bot_telegram_id),
+        )
+        return [service_row_loader(row) for row in rows.mappings()]
+
+    async def get_bot_branches_by_telegram_id(self, bot_telegram_id: BotTelegramId) -> list[Branch]:
+        rows = await self._session.execute(
+            select(*BranchModel.__table__.columns)
+            .join(CityModel)
+            .join(BotModel)
+            .where(BotModel.telegram_id == bot_telegram_id),
+        )
+        return [branch_row_loader(row) for row in rows.mappings()]
+
+    async def get_bot_masters_by_telegram_id(self, bot_telegram_id: BotTelegramId) -> list[Master]:
+        rows = await self._session.execute(
+            select(*MasterModel.__table__.columns).join(BotModel).where(BotModel.telegram_id == bot_telegram_id),
+        )
+        return [master_row_loader(row) for row in rows.mappings()]
 
     async def save_bot(self, bot: Bot) -> BotId:
         bot_model = BotModel()
@@ -69,3 +156,78 @@ class BotDbGateway(BaseDbGateway, CommiterImpl, BotReader, BotSaver):
         self._session.add(bot_model)
         await self._session.flush()
         return bot_model.id
+
+
+BOT_CACHE_MAXSIZE = 10_000
+BOT_CACHE_TTL = 300
+
+
+class BotCache:
+    """Process wide cache of bots, shared by every request scoped CachedBotDbGateway."""
+
+    def __init__(self, maxsize: int = BOT_CACHE_MAXSIZE, ttl: float = BOT_CACHE_TTL):
+        self.by_id: TTLCache[BotId, Bot] = TTLCache(maxsize, ttl)
+        self.by_token: TTLCache[BotToken, Bot] = TTLCache(maxsize, ttl)
+        self.by_telegram_id: TTLCache[BotTelegramId, Bot] = TTLCache(maxsize, ttl)
+
+    def put(self, bot: Bot) -> Bot:
+        self.by_id.set(bot.id, bot)
+        self.by_token.set(bot.token, bot)
+        self.by_telegram_id.set(bot.telegram_id, bot)
+        return bot
+
+    def invalidate(self, bot: Bot) -> None:
+        # A cached older version of the bot may sit under another token or telegram id
+        cached = [
+            self.by_id.get(bot.id) if bot.id is not None else None,
+            self.by_token.get(bot.token),
+            self.by_telegram_id.get(bot.telegram_id),
+        ]
+        for stale in (bot, *(stale for stale in cached if stale is not None)):
+            if stale.id is not None:
+                self.by_id.pop(stale.id)
+            self.by_token.pop(stale.token)
+            self.by_telegram_id.pop(stale.telegram_id)
+
+
+class CachedBotDbGateway(BotDbGateway):
+    """BotDbGateway reading single bots through the in-process BotCache.
+
+    Saved bots are dropped from the cache once the transaction commits, so a concurrent
+    read cannot put the old version back in between. Other processes only see a changed
+    bot once its entry expires.
+    """
+
+    def __init__(self, session: AsyncSession, cache: BotCache):
+        super().__init__(session)
+        self._cache = cache
+        self._saved: list[Bot] = []
+
+    async def get_bot(self, bot_id: BotId) -> Bot:
+        bot = self._cache.by_id.get(bot_id)
+        if bot is None:
+            bot = self._cache.put(await super().get_bot(bot_id))
+        return bot
+
+    async def get_bot_by_token(self, bot_token: BotToken) -> Bot:
+        bot = self._cache.by_token.get(bot_token)
+        if bot is None:
+            bot = self._cache.put(await super().get_bot_by_token(bot_token))
+        return bot
+
+    async def get_bot_by_telegram_id(self, telegram_id: BotTelegramId) -> Bot:
+        bot = self._cache.by_telegram_id.get(telegram_id)
+        if bot is None:
+            bot = self._cache.put(await super().get_bot_by_telegram_id(telegram_id))
+        return bot
+
+    async def save_bot(self, bot: Bot) -> BotId:
+        bot_id = await super().save_bot(bot)
+        self._saved.append(replace(bot, id=bot_id))
+        return bot_id
+
+    async def commit(self) -> None:
+        await super().commit()
+        saved, self._saved = self._saved, []
+        for bot in saved:
+            self._cache.invalidate(bot)
@@ -0,0 +1,128 @@
+from datetime import datetime
+
+from sqlalchemy import and_, or_, select, update
+
+from hub.application.broadcast.exceptions import BroadcastIdNotExistsError
+from hub.application.common.interfaces import BroadcastReader, BroadcastSaver
+from hub.domain.models.bot import BotId
+from hub.domain.models.broadcast import (
+    Broadcast,
+    BroadcastId,
+    BroadcastLeaseToken,
+    BroadcastRecipient,
+    BroadcastStatus,
+    DeliveryReport,
+)
+from hub.domain.models.client import ClientId
+from ..converters import broadcast_recipient_row_loader, broadcast_row_loader
+from ..models import BroadcastModel, ClientModel
+from .base import BaseDbGateway, CommiterImpl
+
+BROADCAST_COLUMNS = (
+    BroadcastModel.id,
+    BroadcastModel.bot_id,
+    BroadcastModel.text,
+    BroadcastModel.status,
+    BroadcastModel.last_client_id,
+    BroadcastModel.delivered,
+    BroadcastModel.blocked,
+    BroadcastModel.failed,
+    BroadcastModel.lease_token,
+)
+
+
+class BroadcastDbGateway(BaseDbGateway, CommiterImpl, BroadcastReader, BroadcastSaver):
+    async def get_broadcast(self, broadcast_id: BroadcastId) -> Broadcast:
+        rows = await self._session.execute(select(*BROADCAST_COLUMNS).where(BroadcastModel.id == broadcast_id))
+        row = rows.mappings().one_or_none()
+        if row is None:
+            raise BroadcastIdNotExistsError
+        return broadcast_row_loader(row)
+
+    async def get_broadcast_recipients(
+        self,
+        bot_id: BotId,
+        after_client_id: ClientId | None,
+        limit: int,
+    ) -> list[BroadcastRecipient]:
+        query = select(ClientModel.id.label("client_id"), ClientModel.telegram_id.label("chat_id")).where(
+            ClientModel.bot_id == bot_id,
+        )
+        if after_client_id is not None:
+            query = query.where(ClientModel.id > after_client_id)
+        rows = await self._session.execute(query.order_by(ClientModel.id).limit(limit))
+        return [broadcast_recipient_row_loader(row) for row in rows.mappings()]
+
+    async def save_broadcast(self, broadcast: Broadcast) -> BroadcastId:
+        broadcast_model = BroadcastModel()
+        broadcast_model.bot_id = broadcast.bot_id
+        broadcast_model.text = broadcast.text
+        broadcast_model.status = broadcast.status
+        broadcast_model.last_client_id = broadcast.last_client_id
+        broadcast_model.delivered = broadcast.delivered
+        broadcast_model.blocked = broadcast.blocked
+        broadcast_model.failed = broadcast.failed
+
+        self._session.add(broadcast_model)
+        await self._session.flush()
+        return broadcast_model.id
+
+    async def claim_broadcast(
+        self,
+        now: datetime,
+        lease_until: datetime,
+        lease_token: BroadcastLeaseToken,
+    ) -> Broadcast | None:
+        # SKIP LOCKED lets every worker claim a different broadcast at the same time
+        candidate = (
+            select(BroadcastModel.id)
+            .where(
+                or_(
+                    BroadcastModel.status == BroadcastStatus.PENDING,
+                    and_(BroadcastModel.status == BroadcastStatus.RUNNING, BroadcastModel.locked_until < now),
+                ),
+            )
+            .order_by(BroadcastModel.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        rows = await self._session.execute(
+            update(BroadcastModel)
+            .where(BroadcastModel.id == candidate)
+            .values(status=BroadcastStatus.RUNNING, locked_until=lease_until, lease_token=lease_token)
+            .returning(*BROADCAST_COLUMNS),
+        )
+        row = rows.mappings().one_or_none()
+        if row is None:
+            return None
+        return broadcast_row_loader(row)
+
+    async def save_broadcast_progress(
+        self,
+        broadcast_id: BroadcastId,
+        lease_token: BroadcastLeaseToken,
+        last_client_id: ClientId,
+        report: DeliveryReport,
+        lease_until: datetime,
+    ) -> bool:
+        result = await self._session.execute(
+            update(BroadcastModel)
+            .where(BroadcastModel.id == broadcast_id, BroadcastModel.lease_token == lease_token)
+            .values(
+                last_client_id=last_client_id,
+                delivered=BroadcastModel.delivered + report.delivered,
+                blocked=BroadcastModel.blocked + report.blocked,
+                failed=BroadcastModel.failed + report.failed,
+                locked_until=lease_until,
+            ),
+        )
+        return result.rowcount == 1
+
+    async def finish_broadcast(self, broadcast_id: BroadcastId, lease_token: BroadcastLeaseToken) -> bool:
+        result = await self._session.execute(
+            update(BroadcastModel)
+            .where(BroadcastModel.id == broadcast_id, BroadcastModel.lease_token == lease_token)
+            .values(status=BroadcastStatus.DONE, locked_until=None, lease_token=None),
+        )
+        return result.rowcount == 1
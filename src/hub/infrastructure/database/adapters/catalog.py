@@ -0,0 +1,267 @@
+from collections.abc import Iterable, Sequence
+from itertools import batched
+from typing import Any
+
+from sqlalchemy import BigInteger, Integer, String, cast, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+
+from hub.application.common.interfaces import CatalogSaver
+from hub.domain.models.bot import BotId
+from hub.domain.models.branch import BranchId
+from hub.domain.models.catalog import CatalogImportReport, CatalogRow
+from hub.domain.models.city import CityId
+from hub.domain.models.master import MasterId
+from hub.domain.models.service import ServiceId
+from hub.domain.models.service_master import DEFAULT_BREAK_TIME, DEFAULT_WORK_TIME
+from ..models import (
+    BranchMasterAssociationModel,
+    BranchModel,
+    CityModel,
+    MasterModel,
+    ServiceMasterAssociationModel,
+    ServiceModel,
+)
+from .base import BaseDbGateway, CommiterImpl
+
+# Keeps every statement well below the 65535 bind parameters postgres accepts
+CATALOG_CHUNK_SIZE = 1000
+
+
+class CatalogDbGateway(BaseDbGateway, CommiterImpl, CatalogSaver):
+    async def import_catalog(self, bot_id: BotId, rows: list[CatalogRow]) -> CatalogImportReport:
+        report = CatalogImportReport()
+        city_ids = await self._upsert_cities(bot_id, rows, report)
+        branch_ids = await self._upsert_branches(rows, city_ids, report)
+        service_ids = await self._upsert_services(bot_id, rows, report)
+        master_ids = await self._upsert_masters(bot_id, rows, city_ids, report)
+
+        branch_links: set[tuple[BranchId, MasterId]] = set()
+        service_links: dict[tuple[ServiceId, MasterId], tuple[int | None, int | None]] = {}
+        for row in rows:
+            if row.master_name is None:
+                continue
+            master_id = master_ids[city_ids[row.city_name], row.master_name]
+            if row.branch_name is not None:
+                branch_links.add((branch_ids[city_ids[row.city_name], row.branch_name], master_id))
+            if row.service_name is not None:
+                key = (service_ids[row.service_name], master_id)
+                work_time, break_time = service_links.get(key, (None, None))
+                service_links[key] = (
+                    work_time if row.work_time is None else row.work_time,
+                    break_time if row.break_time is None else row.break_time,
+                )
+        await self._link_branches(branch_links)
+        await self._link_services(service_links)
+        report.links = len(branch_links) + len(service_links)
+        return report
+
+    async def _insert_returning(self, model: Any, records: Sequence[dict[str, Any]], *returning: Any) -> list[Any]:
+        inserted: list[Any] = []
+        for chunk in batched(records, CATALOG_CHUNK_SIZE):
+            result = await self._session.execute(insert(model).values(list(chunk)).returning(*returning))
+            inserted.extend(result)
+        return inserted
+
+    async def _update_text(self, model: Any, column_name: str, changes: Iterable[tuple[int, str]]) -> int:
+        changes = list(changes)
+        for chunk in batched(changes, CATALOG_CHUNK_SIZE):
+            new_values = values(
+                column("id", BigInteger),
+                column("value", String),
+                name="new_values",
+            ).data(list(chunk))
+            await self._session.execute(
+                update(model).where(model.id == new_values.c.id).values({column_name: new_values.c.value}),
+            )
+        return len(changes)
+
+    async def _upsert_cities(
+        self,
+        bot_id: BotId,
+        rows: list[CatalogRow],
+        report: CatalogImportReport,
+    ) -> dict[str, CityId]:
+        timezones = {row.city_name: row.timezone for row in rows}
+        existing = await self._session.execute(
+            select(CityModel.name, CityModel.id, CityModel.timezone).where(CityModel.bot_id == bot_id),
+        )
+        city_ids: dict[str, CityId] = {}
+        changed: list[tuple[int, str]] = []
+        for name, city_id, timezone in existing:
+            city_ids[name] = city_id
+            if name in timezones and timezones[name] != timezone:
+                changed.append((city_id, timezones[name]))
+        created = await self._insert_returning(
+            CityModel,
+            [
+                {"name": name, "timezone": timezone, "bot_id": bot_id}
+                for name, timezone in timezones.items()
+                if name not in city_ids
+            ],
+            CityModel.name,
+            CityModel.id,
+        )
+        city_ids.update(created)
+        report.created_cities = len(created)
+        report.updated += await self._update_text(CityModel, "timezone", changed)
+        return city_ids
+
+    async def _upsert_branches(
+        self,
+        rows: list[CatalogRow],
+        city_ids: dict[str, CityId],
+        report: CatalogImportReport,
+    ) -> dict[tuple[CityId, str], BranchId]:
+        addresses = {
+            (city_ids[row.city_name], row.branch_name): row.branch_address
+            for row in rows
+            if row.branch_name is not None
+        }
+        existing = await self._session.execute(
+            select(BranchModel.city_id, BranchModel.name, BranchModel.id, BranchModel.address).where(
+                BranchModel.city_id.in_(set(city_ids.values())),
+            ),
+        )
+        branch_ids: dict[tuple[CityId, str], BranchId] = {}
+        changed: list[tuple[int, str]] = []
+        for city_id, name, branch_id, address in existing:
+            branch_ids[city_id, name] = branch_id
+            new_address = addresses.get((city_id, name))
+            if new_address is not None and new_address != address:
+                changed.append((branch_id, new_address))
+        created = await self._insert_returning(
+            BranchModel,
+            [
+                {"city_id": city_id, "name": name, "address": address}
+                for (city_id, name), address in addresses.items()
+                if (city_id, name) not in branch_ids
+            ],
+            BranchModel.city_id,
+            BranchModel.name,
+            BranchModel.id,
+        )
+        branch_ids.update(((city_id, name), branch_id) for city_id, name, branch_id in created)
+        report.created_branches = len(created)
+        report.updated += await self._update_text(BranchModel, "address", changed)
+        return branch_ids
+
+    async def _upsert_services(
+        self,
+        bot_id: BotId,
+        rows: list[CatalogRow],
+        report: CatalogImportReport,
+    ) -> dict[str, ServiceId]:
+        descriptions: dict[str, str | None] = {}
+        for row in rows:
+            if row.service_name is not None:
+                # An empty description cell keeps what an earlier line of the file said
+                descriptions[row.service_name] = row.service_description or descriptions.get(row.service_name)
+        existing = await self._session.execute(
+            select(ServiceModel.name, ServiceModel.id, ServiceModel.description).where(
+                ServiceModel.bot_id == bot_id,
+            ),
+        )
+        service_ids: dict[str, ServiceId] = {}
+        changed: list[tuple[int, str]] = []
+        for name, service_id, description in existing:
+            service_ids[name] = service_id
+            new_description = descriptions.get(name)
+            if new_description is not None and new_description != description:
+                changed.append((service_id, new_description))
+        created = await self._insert_returning(
+            ServiceModel,
+            [
+                {"name": name, "description": description, "bot_id": bot_id}
+                for name, description in descriptions.items()
+                if name not in service_ids
+            ],
+            ServiceModel.name,
+            ServiceModel.id,
+        )
+        service_ids.update(created)
+        report.created_services = len(created)
+        report.updated += await self._update_text(ServiceModel, "description", changed)
+        return service_ids
+
+    async def _upsert_masters(
+        self,
+        bot_id: BotId,
+        rows: list[CatalogRow],
+        city_ids: dict[str, CityId],
+        report: CatalogImportReport,
+    ) -> dict[tuple[CityId, str], MasterId]:
+        wanted = {(city_ids[row.city_name], row.master_name) for row in rows if row.master_name is not None}
+        existing = await self._session.execute(
+            select(MasterModel.city_id, MasterModel.name, MasterModel.id).where(MasterModel.bot_id == bot_id),
+        )
+        master_ids: dict[tuple[CityId, str], MasterId] = {
+            (city_id, name): master_id for city_id, name, master_id in existing
+        }
+        created = await self._insert_returning(
+            MasterModel,
+            [
+                {"city_id": city_id, "name": name, "bot_id": bot_id}
+                for city_id, name in wanted
+                if (city_id, name) not in master_ids
+            ],
+            MasterModel.city_id,
+            MasterModel.name,
+            MasterModel.id,
+        )
+        master_ids.update(((city_id, name), master_id) for city_id, name, master_id in created)
+        report.created_masters = len(created)
+        return master_ids
+
+    async def _link_branches(self, links: set[tuple[BranchId, MasterId]]) -> None:
+        for chunk in batched(links, CATALOG_CHUNK_SIZE):
+            await self._session.execute(
+                insert(BranchMasterAssociationModel)
+                .values([{"branch_id": branch_id, "master_id": master_id} for branch_id, master_id in chunk])
+                .on_conflict_do_nothing(),
+            )
+
+    async def _link_services(self, links: dict[tuple[ServiceId, MasterId], tuple[int | None, int | None]]) -> None:
+        for chunk in batched(links.items(), CATALOG_CHUNK_SIZE):
+            await self._session.execute(
+                insert(ServiceMasterAssociationModel)
+                .values(
+                    [
+                        {
+                            "service_id": service_id,
+                            "master_id": master_id,
+                            "work_time": work_time or DEFAULT_WORK_TIME,
+                            "break_time": DEFAULT_BREAK_TIME if break_time is None else break_time,
+                        }
+                        for (service_id, master_id), (work_time, break_time) in chunk
+                    ],
+                )
+                .on_conflict_do_nothing(),
+            )
+        timed = [
+            (service_id, master_id, work_time, break_time)
+            for (service_id, master_id), (work_time, break_time) in links.items()
+            if work_time is not None or break_time is not None
+        ]
+        for chunk in batched(timed, CATALOG_CHUNK_SIZE):
+            times = values(
+                column("service_id", BigInteger),
+                column("master_id", BigInteger),
+                column("work_time", Integer),
+                column("break_time", Integer),
+                name="times",
+            ).data(list(chunk))
+            await self._session.execute(
+                update(ServiceMasterAssociationModel)
+                .where(
+                    ServiceMasterAssociationModel.service_id == times.c.service_id,
+                    ServiceMasterAssociationModel.master_id == times.c.master_id,
+                )
+                .values(
+                    # Same casts as MasterDbGateway: untyped NULLs would otherwise be inferred as text
+                    work_time=func.coalesce(cast(times.c.work_time, Integer), ServiceMasterAssociationModel.work_time),
+                    break_time=func.coalesce(
+                        cast(times.c.break_time, Integer),
+                        ServiceMasterAssociationModel.break_time,
+                    ),
+                ),
+            )
@@ -6,7 +6,7 @@ from hub.domain.models.branch import Branch
 from hub.domain.models.city import City, CityId, CityName
 from hub.domain.models.timezone import TimeZone
 from hub.infrastructure.database.adapters.base import BaseDbGateway, CommiterImpl
-from hub.infrastructure.database.converters import branch_converter, city_converter
+from hub.infrastructure.database.converters import branch_row_loader, city_converter
 from hub.infrastructure.database.models import BranchModel, CityModel
 
 
@@ -28,10 +28,10 @@ class CityDbGateway(BaseDbGateway, CommiterImpl, CityReader, CitySaver):
         return city_converter(city)
 
     async def get_branches(self, city_id: CityId) -> list[Branch]:
-        branches = await self._session.scalars(
-            select(BranchModel).where(BranchModel.city_id == city_id),
+        rows = await self._session.execute(
+            select(*BranchModel.__table__.columns).where(BranchModel.city_id == city_id),
         )
-        return [branch_converter(branch) for branch in branches]
+        return [branch_row_loader(row) for row in rows.mappings()]
 
     async def delete_city(self, city_id: CityId) -> None:
         await self._session.execute(delete(CityModel).where(CityModel.id == city_id))
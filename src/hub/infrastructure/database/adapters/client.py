@@ -1,11 +1,12 @@
-from sqlalchemy import select
+from sqlalchemy import and_, false, select
 
+from hub.application.bot.exceptions import BotTelegramIdNotExistsError
 from hub.application.client.exceptions import ClientIdNotExistsError, ClientTelegramIdNotExistsError
 from hub.application.common.interfaces import ClientReader, ClientSaver
-from hub.domain.models.bot import BotId
-from hub.domain.models.client import Client, ClientId, ClientTelegramId
-from ..converters import client_converter
-from ..models import CityModel, ClientModel
+from hub.domain.models.bot import BotId, BotTelegramId
+from hub.domain.models.client import Client, ClientContext, ClientId, ClientTelegramId
+from ..converters import bot_converter, city_converter, client_converter
+from ..models import BotModel, CityModel, ClientModel
 from .base import BaseDbGateway, CommiterImpl
 
 
@@ -27,6 +28,35 @@ class ClientDbGateway(BaseDbGateway, CommiterImpl, ClientReader, ClientSaver):
             raise ClientTelegramIdNotExistsError
         return client_converter(client)
 
+    async def get_client_context(
+        self,
+        bot_telegram_id: BotTelegramId,
+        telegram_id: ClientTelegramId | None,
+    ) -> ClientContext:
+        row = (
+            await self._session.execute(
+                select(BotModel, ClientModel, CityModel)
+                .select_from(BotModel)
+                .outerjoin(
+                    ClientModel,
+                    and_(
+                        ClientModel.bot_id == BotModel.id,
+                        ClientModel.telegram_id == telegram_id if telegram_id is not None else false(),
+                    ),
+                )
+                .outerjoin(CityModel, CityModel.id == ClientModel.city_id)
+                .where(BotModel.telegram_id == bot_telegram_id),
+            )
+        ).one_or_none()
+        if row is None:
+            raise BotTelegramIdNotExistsError
+        bot, client, city = row
+        return ClientContext(
+            bot=bot_converter(bot),
+            client=client_converter(client) if client else None,
+            city=city_converter(city) if city else None,
+        )
+
     async def save_client(self, client: Client) -> ClientId:
         client_model = ClientModel()
         client_model.bot_id = client.bot_id
@@ -0,0 +1,63 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from sqlalchemy import Select, select
+
+from hub.application.common.interfaces import BotDataReader
+from hub.domain.models.bot import BotId
+from ..models import (
+    AppointmentModel,
+    BotModel,
+    BranchMasterAssociationModel,
+    BranchModel,
+    CityModel,
+    ClientModel,
+    MasterModel,
+    ServiceMasterAssociationModel,
+    ServiceModel,
+)
+from .base import BaseDbGateway
+
+# Rows fetched from the server side cursor per round trip
+EXPORT_BATCH_SIZE = 2000
+
+
+class BotDataDbGateway(BaseDbGateway, BotDataReader):
+    def _queries(self, bot_id: BotId) -> list[tuple[str, Select[Any]]]:
+        return [
+            # The token gives full control over the bot, it never leaves the database
+            ("bot", select(BotModel.id, BotModel.telegram_id, BotModel.name).where(BotModel.id == bot_id)),
+            ("city", select(*CityModel.__table__.columns).where(CityModel.bot_id == bot_id)),
+            (
+                "branch",
+                select(*BranchModel.__table__.columns).join(CityModel).where(CityModel.bot_id == bot_id),
+            ),
+            ("service", select(*ServiceModel.__table__.columns).where(ServiceModel.bot_id == bot_id)),
+            ("master", select(*MasterModel.__table__.columns).where(MasterModel.bot_id == bot_id)),
+            (
+                "branch_master",
+                select(*BranchMasterAssociationModel.__table__.columns)
+                .join(MasterModel, MasterModel.id == BranchMasterAssociationModel.master_id)
+                .where(MasterModel.bot_id == bot_id),
+            ),
+            (
+                "service_master",
+                select(*ServiceMasterAssociationModel.__table__.columns)
+                .join(MasterModel, MasterModel.id == ServiceMasterAssociationModel.master_id)
+                .where(MasterModel.bot_id == bot_id),
+            ),
+            ("client", select(*ClientModel.__table__.columns).where(ClientModel.bot_id == bot_id)),
+            (
+                "appointment",
+                select(*AppointmentModel.__table__.columns)
+                .join(ClientModel, ClientModel.id == AppointmentModel.client_id)
+                .where(ClientModel.bot_id == bot_id)
+                .order_by(AppointmentModel.date),
+            ),
+        ]
+
+    async def stream_bot_data(self, bot_id: BotId) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        for record_type, query in self._queries(bot_id):
+            result = await self._session.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+            async for row in result.mappings():
+                yield record_type, dict(row)
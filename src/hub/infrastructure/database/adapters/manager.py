@@ -5,7 +5,7 @@ from hub.application.manager.exceptions import ManagerIdNotExistsError, ManagerT
 from hub.domain.models.bot import Bot
 from hub.domain.models.manager import Manager, ManagerId, ManagerTelegramId
 from hub.infrastructure.database.adapters.base import BaseDbGateway, CommiterImpl
-from hub.infrastructure.database.converters import bot_converter, manager_converter
+from hub.infrastructure.database.converters import bot_row_loader, manager_converter
 from hub.infrastructure.database.models import BotModel, ManagerModel
 
 
@@ -25,10 +25,10 @@ class ManagerDbGateway(BaseDbGateway, CommiterImpl, ManagerReader, ManagerSaver)
         return manager_converter(manager)
 
     async def get_manager_bots(self, manager_id: ManagerId) -> list[Bot]:
-        bots = await self._session.scalars(
-            select(BotModel).where(BotModel.manager_id == manager_id),
+        rows = await self._session.execute(
+            select(*BotModel.__table__.columns).where(BotModel.manager_id == manager_id),
         )
-        return [bot_converter(bot) for bot in bots]
+        return [bot_row_loader(row) for row in rows.mappings()]
 
     async def save_manager(self, manager: Manager) -> ManagerId:
         manager_model = ManagerModel()
@@ -1,14 +1,24 @@
-from adaptix.conversion import convert
-from sqlalchemy import delete, insert, literal, select, update
+from sqlalchemy import BigInteger, Integer, and_, cast, column, delete, func, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert
 
 from hub.application.common.interfaces import MasterReader, MasterSaver
 from hub.application.master.exceptions import MasterIdNotExistsError
 from hub.domain.models.bot import BotId
-from hub.domain.models.branch import AvailableBranch, BranchId
+from hub.domain.models.branch import AvailableBranch
 from hub.domain.models.master import Master, MasterId, MasterName
-from hub.domain.models.service import AvailableService, ServiceId
+from hub.domain.models.service import AvailableService
+from hub.domain.models.service_master import (
+    DEFAULT_BREAK_TIME,
+    DEFAULT_WORK_TIME,
+    MasterAssociationsDiff,
+    ServiceMasterTime,
+)
 from hub.infrastructure.database.adapters.base import BaseDbGateway, CommiterImpl
-from hub.infrastructure.database.converters import master_converter
+from hub.infrastructure.database.converters import (
+    available_branch_row_loader,
+    available_service_row_loader,
+    master_converter,
+)
 from hub.infrastructure.database.models import (
     BranchMasterAssociationModel,
     BranchModel,
@@ -35,37 +45,70 @@ class MasterDbGateway(BaseDbGateway, CommiterImpl, MasterReader, MasterSaver):
             update(MasterModel).where(MasterModel.id == master_id).values(name=name),
         )
 
-    async def attach_master_to_branch(self, master_id: MasterId, branch_id: BranchId) -> None:
-        await self._session.execute(
-            insert(BranchMasterAssociationModel).values(
-                master_id=master_id,
-                branch_id=branch_id,
-            ),
-        )
-
-    async def detach_master_from_branch(self, master_id: MasterId, branch_id: BranchId) -> None:
-        await self._session.execute(
-            delete(BranchMasterAssociationModel).where(
-                BranchMasterAssociationModel.master_id == master_id,
-                BranchMasterAssociationModel.branch_id == branch_id,
-            ),
-        )
-
-    async def master_provide_service(self, master_id: MasterId, service_id: ServiceId) -> None:
-        await self._session.execute(
-            insert(ServiceMasterAssociationModel).values(
-                master_id=master_id,
-                service_id=service_id,
-            ),
-        )
-
-    async def master_withhold_service(self, master_id: MasterId, service_id: ServiceId) -> None:
-        await self._session.execute(
-            delete(ServiceMasterAssociationModel).where(
-                ServiceMasterAssociationModel.master_id == master_id,
-                ServiceMasterAssociationModel.service_id == service_id,
-            ),
-        )
+    async def update_master_associations(self, master_id: MasterId, diff: MasterAssociationsDiff) -> None:
+        if diff.attach_branches:
+            await self._session.execute(
+                insert(BranchMasterAssociationModel)
+                .values([{"master_id": master_id, "branch_id": branch_id} for branch_id in diff.attach_branches])
+                .on_conflict_do_nothing(),
+            )
+        if diff.detach_branches:
+            await self._session.execute(
+                delete(BranchMasterAssociationModel).where(
+                    tuple_(BranchMasterAssociationModel.master_id, BranchMasterAssociationModel.branch_id).in_(
+                        [(master_id, branch_id) for branch_id in diff.detach_branches],
+                    ),
+                ),
+            )
+        service_times = {service_time.service_id: service_time for service_time in diff.service_times}
+        if diff.provide_services:
+            rows = []
+            for service_id in diff.provide_services:
+                service_time = service_times.pop(service_id, None) or ServiceMasterTime(service_id=service_id)
+                rows.append(
+                    {
+                        "master_id": master_id,
+                        "service_id": service_id,
+                        "work_time": service_time.work_time or DEFAULT_WORK_TIME,
+                        "break_time": service_time.break_time or DEFAULT_BREAK_TIME,
+                    },
+                )
+            await self._session.execute(insert(ServiceMasterAssociationModel).values(rows).on_conflict_do_nothing())
+        if diff.withhold_services:
+            await self._session.execute(
+                delete(ServiceMasterAssociationModel).where(
+                    tuple_(ServiceMasterAssociationModel.master_id, ServiceMasterAssociationModel.service_id).in_(
+                        [(master_id, service_id) for service_id in diff.withhold_services],
+                    ),
+                ),
+            )
+        if service_times:
+            times = values(
+                column("service_id", BigInteger),
+                column("work_time", Integer),
+                column("break_time", Integer),
+                name="times",
+            ).data(
+                [
+                    (service_time.service_id, service_time.work_time, service_time.break_time)
+                    for service_time in service_times.values()
+                ],
+            )
+            await self._session.execute(
+                update(ServiceMasterAssociationModel)
+                .where(
+                    ServiceMasterAssociationModel.master_id == master_id,
+                    ServiceMasterAssociationModel.service_id == times.c.service_id,
+                )
+                .values(
+                    # Untyped NULL parameters would make postgres infer text for a column left empty
+                    work_time=func.coalesce(cast(times.c.work_time, Integer), ServiceMasterAssociationModel.work_time),
+                    break_time=func.coalesce(
+                        cast(times.c.break_time, Integer),
+                        ServiceMasterAssociationModel.break_time,
+                    ),
+                ),
+            )
 
     async def delete_master(self, master_id: MasterId) -> None:
         await self._session.execute(delete(MasterModel).where(MasterModel.id == master_id))
@@ -77,83 +120,38 @@ class MasterDbGateway(BaseDbGateway, CommiterImpl, MasterReader, MasterSaver):
         return master_converter(master)
 
     async def get_available_branches(self, bot_id: BotId, master_id: MasterId) -> list[AvailableBranch]:
-        subquery = select(BranchModel.id).join(CityModel).where(CityModel.bot_id == bot_id)
-
-        branches = await self._session.scalars(
+        rows = await self._session.execute(
             select(
-                literal(value=True).label("is_associated"),
-                BranchModel,
+                *BranchModel.__table__.columns,
+                BranchMasterAssociationModel.master_id.is_not(None).label("is_associated"),
+            )
+            .join(CityModel, CityModel.id == BranchModel.city_id)
+            .outerjoin(
+                BranchMasterAssociationModel,
+                and_(
+                    BranchMasterAssociationModel.branch_id == BranchModel.id,
+                    BranchMasterAssociationModel.master_id == master_id,
+                ),
             )
-            .join(BranchMasterAssociationModel, BranchModel.id == BranchMasterAssociationModel.branch_id)
-            .filter(BranchMasterAssociationModel.master_id == master_id, BranchModel.id.in_(subquery))
-            .union_all(
-                select(
-                    literal(value=False).label("is_associated"),
-                    BranchModel,
-                ).filter(BranchModel.id.in_(subquery), ~BranchModel.masters.any(MasterModel.id == master_id)),
-            ),
+            .where(CityModel.bot_id == bot_id)
+            .order_by(BranchModel.id),
         )
-        return [convert(branch, AvailableBranch) for branch in branches]
+        return [available_branch_row_loader(row) for row in rows.mappings()]
 
     async def get_available_services(self, bot_id: BotId, master_id: MasterId) -> list[AvailableService]:
-        subquery = select(ServiceModel.id).where(ServiceModel.bot_id == bot_id)
-
-        services = await self._session.execute(
+        rows = await self._session.execute(
             select(
-                literal(value=True).label("is_associated"),
-                ServiceModel,
+                *ServiceModel.__table__.columns,
+                ServiceMasterAssociationModel.master_id.is_not(None).label("is_associated"),
             )
-            .join(
+            .outerjoin(
                 ServiceMasterAssociationModel,
-                ServiceModel.id == ServiceMasterAssociationModel.service_id,
-            )
-            .filter(ServiceMasterAssociationModel.master_id == master_id, ServiceModel.id.in_(subquery))
-            .union_all(
-                select(
-                    literal(value=False).label("is_associated"),
-                    ServiceModel,
-                ).filter(
-                    ServiceModel.id.in_(subquery),
-                    ~ServiceModel.masters.any(MasterModel.id == master_id),
+                and_(
+                    ServiceMasterAssociationModel.service_id == ServiceModel.id,
+                    ServiceMasterAssociationModel.master_id == master_id,
                 ),
-            ),
-        )
-        return [convert(service, AvailableService) for service in services]
-
-    async def check_master_attached_to_branch(self, master_id: MasterId, branch_id: BranchId) -> bool:
-        model = await self._session.scalar(
-            select(BranchMasterAssociationModel).where(
-                BranchMasterAssociationModel.master_id == master_id,
-                BranchMasterAssociationModel.branch_id == branch_id,
-            ),
-        )
-        return model is not None
-
-    async def check_master_provides_service(self, master_id: MasterId, service_id: ServiceId) -> bool:
-        model = await self._session.scalar(
-            select(ServiceMasterAssociationModel).where(
-                ServiceMasterAssociationModel.master_id == master_id,
-                ServiceMasterAssociationModel.service_id == service_id,
-            ),
-        )
-        return model is not None
-
-    async def update_master_work_time(self, master_id: MasterId, service_id: ServiceId, work_time: int) -> None:
-        await self._session.execute(
-            update(ServiceMasterAssociationModel)
-            .where(
-                ServiceMasterAssociationModel.master_id == master_id,
-                ServiceMasterAssociationModel.service_id == service_id,
-            )
-            .values(work_time=work_time),
-        )
-
-    async def update_master_break_time(self, master_id: MasterId, service_id: ServiceId, break_time: int) -> None:
-        await self._session.execute(
-            update(ServiceMasterAssociationModel)
-            .where(
-                ServiceMasterAssociationModel.master_id == master_id,
-                ServiceMasterAssociationModel.service_id == service_id,
             )
-            .values(break_time=break_time),
+            .where(ServiceModel.bot_id == bot_id)
+            .order_by(ServiceModel.id),
         )
+        return [available_service_row_loader(row) for row in rows.mappings()]
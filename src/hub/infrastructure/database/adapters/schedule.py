@@ -0,0 +1,58 @@
+from datetime import datetime
+
+from sqlalchemy import and_, select
+
+from hub.application.common.interfaces import ScheduleReader
+from hub.domain.models.bot import BotId
+from hub.domain.models.schedule import BusyInterval, MasterSchedule
+from hub.domain.models.service import ServiceId
+from ..models import AppointmentModel, MasterModel, ServiceMasterAssociationModel
+from .base import BaseDbGateway
+
+
+class ScheduleDbGateway(BaseDbGateway, ScheduleReader):
+    async def get_master_schedules(
+        self,
+        bot_id: BotId,
+        service_id: ServiceId,
+        start: datetime,
+        end: datetime,
+    ) -> list[MasterSchedule]:
+        rows = await self._session.execute(
+            select(
+                ServiceMasterAssociationModel.master_id,
+                ServiceMasterAssociationModel.work_time,
+                ServiceMasterAssociationModel.break_time,
+                AppointmentModel.date,
+                AppointmentModel.end_date,
+            )
+            .join(MasterModel, MasterModel.id == ServiceMasterAssociationModel.master_id)
+            .outerjoin(
+                AppointmentModel,
+                and_(
+                    AppointmentModel.master_id == ServiceMasterAssociationModel.master_id,
+                    AppointmentModel.date < end,
+                    AppointmentModel.end_date > start,
+                ),
+            )
+            .where(
+                ServiceMasterAssociationModel.service_id == service_id,
+                MasterModel.bot_id == bot_id,
+            )
+            .order_by(ServiceMasterAssociationModel.master_id, AppointmentModel.date),
+        )
+
+        schedules: list[MasterSchedule] = []
+        for master_id, work_time, break_time, appointment_start, appointment_end in rows:
+            if not schedules or schedules[-1].master_id != master_id:
+                schedules.append(
+                    MasterSchedule(
+                        master_id=master_id,
+                        work_time=work_time,
+                        break_time=break_time,
+                        busy=[],
+                    ),
+                )
+            if appointment_start is not None:
+                schedules[-1].busy.append(BusyInterval(start=appointment_start, end=appointment_end))
+        return schedules
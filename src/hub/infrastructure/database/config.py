@@ -8,7 +8,14 @@ class DBConfig:
     database: str
     user: str
     password: str
-    echo: bool = True
+    echo: bool = False
+
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 10
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_timeout: int = 30_000  # milliseconds
 
     @property
     def full_url(self) -> str:
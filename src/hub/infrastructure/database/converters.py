@@ -1,13 +1,18 @@
-from adaptix import Retort
+from datetime import datetime
+from uuid import UUID
+
+from adaptix import Retort, loader
 from adaptix.conversion import get_converter
 
+from hub.domain.models.appointment import Appointment, ClientAppointment
 from hub.domain.models.bot import Bot
-from hub.domain.models.branch import Branch
+from hub.domain.models.branch import AvailableBranch, Branch
+from hub.domain.models.broadcast import Broadcast, BroadcastRecipient
 from hub.domain.models.city import City
 from hub.domain.models.client import Client
 from hub.domain.models.manager import Manager
 from hub.domain.models.master import Master
-from hub.domain.models.service import Service
+from hub.domain.models.service import AvailableService, Service
 from hub.domain.new_type import NewTypeUnwrappingProvider
 from hub.infrastructure.database.models import (
     BotModel,
@@ -19,7 +24,14 @@ from hub.infrastructure.database.models import (
     ServiceModel,
 )
 
-retort = Retort(recipe=[NewTypeUnwrappingProvider()])
+retort = Retort(
+    recipe=[
+        NewTypeUnwrappingProvider(),
+        # The driver already hands back aware datetimes and UUIDs, there are no strings to parse
+        loader(datetime, lambda value: value),
+        loader(UUID, lambda value: value),
+    ],
+)
 
 bot_converter = get_converter(BotModel, Bot)
 branch_converter = get_converter(BranchModel, Branch)
@@ -28,3 +40,17 @@ client_converter = get_converter(ClientModel, Client)
 manager_converter = get_converter(ManagerModel, Manager)
 master_converter = get_converter(MasterModel, Master)
 service_converter = get_converter(ServiceModel, Service)
+
+
+# Loaders for plain row mappings, used by list reads to skip ORM hydration
+available_branch_row_loader = retort.get_loader(AvailableBranch)
+available_service_row_loader = retort.get_loader(AvailableService)
+appointment_row_loader = retort.get_loader(Appointment)
+bot_row_loader = retort.get_loader(Bot)
+branch_row_loader = retort.get_loader(Branch)
+broadcast_row_loader = retort.get_loader(Broadcast)
+broadcast_recipient_row_loader = retort.get_loader(BroadcastRecipient)
+city_row_loader = retort.get_loader(City)
+client_appointment_row_loader = retort.get_loader(ClientAppointment)
+master_row_loader = retort.get_loader(Master)
+service_row_loader = retort.get_loader(Service)
@@ -0,0 +1,18 @@
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from .config import DBConfig
+from .pool import InstrumentedAsyncAdaptedQueuePool
+
+
+def create_engine(config: DBConfig) -> AsyncEngine:
+    return create_async_engine(
+        config.full_url,
+        echo=config.echo,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
+        connect_args={"options": f"-c statement_timeout={config.statement_timeout}"},
+    )
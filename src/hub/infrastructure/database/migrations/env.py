@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 
 from hub.infrastructure.config_loader import load_config
 from hub.infrastructure.database.config import DBConfig
-from hub.infrastructure.database.models import metadata
+from hub.infrastructure.database.models import BaseModel
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -20,7 +20,7 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-target_metadata = metadata
+target_metadata = BaseModel.metadata
 
 if not (full_url := config.get_main_option("sqlalchemy.url")):
     full_url = load_config(DBConfig, "db", path=Path("./config/main_bot_config.toml")).full_url
@@ -0,0 +1,52 @@
+"""lookup indexes
+
+Revision ID: 5b8f0c2a7d41
+Revises: 1e2e743784c9
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8f0c2a7d41"
+down_revision: str | None = "1e2e743784c9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The get-or-create of the client bot was racy and may have registered a user twice per bot.
+# The first registration is kept and the appointments of the others are moved to it.
+CLIENT_DUPLICATES = """
+    SELECT id, min(id) OVER (PARTITION BY bot_id, telegram_id) AS kept_id FROM clients
+"""
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        UPDATE appointments SET client_id = duplicates.kept_id
+        FROM ({CLIENT_DUPLICATES}) AS duplicates
+        WHERE appointments.client_id = duplicates.id AND duplicates.id <> duplicates.kept_id
+        """,  # noqa: S608
+    )
+    op.execute(
+        f"""
+        DELETE FROM clients USING ({CLIENT_DUPLICATES}) AS duplicates
+        WHERE clients.id = duplicates.id AND duplicates.id <> duplicates.kept_id
+        """,  # noqa: S608
+    )
+    op.create_unique_constraint(op.f("uq_clients_bot_id_telegram_id"), "clients", ["bot_id", "telegram_id"])
+    op.create_index("ix_appointments_master_id_date", "appointments", ["master_id", "date"], unique=False)
+    op.create_index(op.f("ix_cities_bot_id"), "cities", ["bot_id"], unique=False)
+    op.create_index(op.f("ix_services_bot_id"), "services", ["bot_id"], unique=False)
+    op.create_index(op.f("ix_masters_bot_id"), "masters", ["bot_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_masters_bot_id"), table_name="masters")
+    op.drop_index(op.f("ix_services_bot_id"), table_name="services")
+    op.drop_index(op.f("ix_cities_bot_id"), table_name="cities")
+    op.drop_index("ix_appointments_master_id_date", table_name="appointments")
+    op.drop_constraint(op.f("uq_clients_bot_id_telegram_id"), "clients", type_="unique")
@@ -0,0 +1,104 @@
+"""appointment time range
+
+Revision ID: 9c3e1f7b2a58
+Revises: 5b8f0c2a7d41
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3e1f7b2a58"
+down_revision: str | None = "5b8f0c2a7d41"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Appointments of one master starting at the same time cannot both be kept. Which one
+    # stands is up to the bot's manager, so they are reported instead of being dropped.
+    conflicts = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                """
+                SELECT master_id, date, array_agg(id ORDER BY id) AS ids
+                FROM appointments
+                GROUP BY master_id, date
+                HAVING count(*) > 1
+                ORDER BY master_id, date
+                """,
+            ),
+        )
+        .all()
+    )
+    if conflicts:
+        report = "\n".join(f"master {master_id} at {date}: appointments {ids}" for master_id, date, ids in conflicts)
+        raise RuntimeError(f"Double bookings must be resolved before the upgrade:\n{report}")
+
+    # Needed to mix the scalar master_id with the range in one gist index
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.add_column("appointments", sa.Column("end_date", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("appointments", sa.Column("service_id", sa.BigInteger(), nullable=True))
+    op.create_foreign_key(
+        op.f("fk_appointments_service_id_services"),
+        "appointments",
+        "services",
+        ["service_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    # Existing appointments stored neither their service nor their duration. When the master
+    # provides a single service it is theirs, otherwise the longest work + break time of the
+    # master's services is assumed, one hour if the master has none.
+    op.execute(
+        """
+        UPDATE appointments
+        SET
+            service_id = CASE WHEN master_services.count = 1 THEN master_services.service_id END,
+            end_date = appointments.date + make_interval(mins => master_services.longest)
+        FROM (
+            SELECT
+                master_id,
+                count(*) AS count,
+                min(service_id) AS service_id,
+                max(work_time + break_time) AS longest
+            FROM service_master_association
+            GROUP BY master_id
+        ) AS master_services
+        WHERE master_services.master_id = appointments.master_id
+        """,
+    )
+    op.execute("UPDATE appointments SET end_date = date + interval '1 hour' WHERE end_date IS NULL")
+    # Double bookings were possible, and an assumed duration may run into the next booking.
+    # Such an appointment is cut short at the start of the next one of its master.
+    op.execute(
+        """
+        UPDATE appointments SET end_date = following.next_date
+        FROM (
+            SELECT id, lead(date) OVER (PARTITION BY master_id ORDER BY date) AS next_date FROM appointments
+        ) AS following
+        WHERE appointments.id = following.id AND following.next_date < appointments.end_date
+        """,
+    )
+    op.alter_column("appointments", "end_date", nullable=False)
+    op.create_exclude_constraint(
+        "ex_appointments_master_id_time_range",
+        "appointments",
+        ("master_id", "="),
+        (sa.func.tstzrange(sa.column("date"), sa.column("end_date")), "&&"),
+        using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ex_appointments_master_id_time_range", "appointments")
+    op.drop_constraint(op.f("fk_appointments_service_id_services"), "appointments", type_="foreignkey")
+    op.drop_column("appointments", "service_id")
+    op.drop_column("appointments", "end_date")
+    # btree_gist is left installed, other objects of the database may depend on it
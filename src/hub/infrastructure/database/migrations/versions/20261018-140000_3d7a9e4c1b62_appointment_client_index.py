@@ -0,0 +1,25 @@
+"""appointment client index
+
+Revision ID: 3d7a9e4c1b62
+Revises: 9c3e1f7b2a58
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3d7a9e4c1b62"
+down_revision: str | None = "9c3e1f7b2a58"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_appointments_client_id_date", "appointments", ["client_id", "date"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_appointments_client_id_date", table_name="appointments")
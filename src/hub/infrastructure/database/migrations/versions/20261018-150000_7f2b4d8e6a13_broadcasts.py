@@ -0,0 +1,50 @@
+"""broadcasts
+
+Revision ID: 7f2b4d8e6a13
+Revises: 3d7a9e4c1b62
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7f2b4d8e6a13"
+down_revision: str | None = "3d7a9e4c1b62"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "broadcasts",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("bot_id", sa.BigInteger(), nullable=False),
+        sa.Column("text", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("last_client_id", sa.BigInteger(), nullable=True),
+        sa.Column("delivered", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("blocked", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("failed", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["bot_id"],
+            ["bots.id"],
+            name=op.f("fk_broadcasts_bot_id_bots"),
+            ondelete="cascade",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_broadcasts")),
+    )
+    op.create_index(op.f("ix_broadcasts_bot_id"), "broadcasts", ["bot_id"], unique=False)
+    op.create_index("ix_broadcasts_status_locked_until", "broadcasts", ["status", "locked_until"], unique=False)
+    op.create_index("ix_clients_bot_id_id", "clients", ["bot_id", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_clients_bot_id_id", table_name="clients")
+    op.drop_index("ix_broadcasts_status_locked_until", table_name="broadcasts")
+    op.drop_index(op.f("ix_broadcasts_bot_id"), table_name="broadcasts")
+    op.drop_table("broadcasts")
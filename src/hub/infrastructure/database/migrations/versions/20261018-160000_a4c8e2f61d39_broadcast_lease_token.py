@@ -0,0 +1,26 @@
+"""broadcast lease token
+
+Revision ID: a4c8e2f61d39
+Revises: 7f2b4d8e6a13
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c8e2f61d39"
+down_revision: str | None = "7f2b4d8e6a13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("broadcasts", sa.Column("lease_token", sa.Uuid(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("broadcasts", "lease_token")
@@ -1,9 +1,25 @@
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, MetaData, String
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    UniqueConstraint,
+    Uuid,
+    column,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, registry, relationship
 
 from hub.domain.models.appointment import AppointmentDateTime, AppointmentId
 from hub.domain.models.bot import BotId, BotName, BotTelegramId, BotToken
 from hub.domain.models.branch import BranchAddress, BranchId, BranchName
+from hub.domain.models.broadcast import BroadcastId, BroadcastLeaseToken, BroadcastStatus, BroadcastText
 from hub.domain.models.city import CityId, CityName
 from hub.domain.models.client import ClientId, ClientName, ClientTelegramId
 from hub.domain.models.manager import ManagerId, ManagerTelegramId
@@ -63,7 +79,7 @@ class CityModel(BaseModel):
     name: Mapped[CityName] = mapped_column(String, nullable=False)
     timezone: Mapped[TimeZone] = mapped_column(String, nullable=False)
 
-    bot_id: Mapped[BotId] = mapped_column(BigInteger, ForeignKey("bots.id", ondelete="cascade"))
+    bot_id: Mapped[BotId] = mapped_column(BigInteger, ForeignKey("bots.id", ondelete="cascade"), index=True)
     bot: Mapped["BotModel"] = relationship(back_populates="cities")
 
     branches: Mapped[list["BranchModel"]] = relationship(back_populates="city")
@@ -121,7 +137,7 @@ class ServiceModel(BaseModel):
     name: Mapped[ServiceName] = mapped_column(String, nullable=False)
     description: Mapped[ServiceDescription] = mapped_column(String, nullable=True)
 
-    bot_id: Mapped[BotId] = mapped_column(BigInteger, ForeignKey("bots.id", ondelete="cascade"))
+    bot_id: Mapped[BotId] = mapped_column(BigInteger, ForeignKey("bots.id", ondelete="cascade"), index=True)
     bot: Mapped["BotModel"] = relationship(back_populates="services")
 
     masters: Mapped[list["MasterModel"]] = relationship(
@@ -137,7 +153,7 @@ class MasterModel(BaseModel):
     id: Mapped[MasterId] = mapped_column(BigInteger, primary_key=True)
     name: Mapped[MasterName] = mapped_column(String, nullable=False)
 
-    bot_id: Mapped[BotId] = mapped_column(BigInteger, ForeignKey("bots.id", ondelete="cascade"))
+    bot_id: Mapped[BotId] = mapped_column(BigInteger, ForeignKey("bots.id", ondelete="cascade"), index=True)
     bot: Mapped["BotModel"] = relationship(back_populates="masters")
 
     city_id: Mapped[CityId] = mapped_column(BigInteger, ForeignKey("cities.id", ondelete="SET NULL"))
@@ -155,16 +171,38 @@ class MasterModel(BaseModel):
 
 class AppointmentModel(BaseModel):
     __tablename__ = "appointments"
+    __table_args__ = (
+        Index("ix_appointments_master_id_date", "master_id", "date"),
+        Index("ix_appointments_client_id_date", "client_id", "date"),
+        # A master cannot have two appointments whose [date, end_date) ranges overlap
+        ExcludeConstraint(
+            ("master_id", "="),
+            (func.tstzrange(column("date"), column("end_date")), "&&"),
+            name="ex_appointments_master_id_time_range",
+            using="gist",
+        ),
+    )
     __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[AppointmentId] = mapped_column(BigInteger, primary_key=True)
     date: Mapped[AppointmentDateTime] = mapped_column(DateTime(timezone=True), nullable=False)
+    end_date: Mapped[AppointmentDateTime] = mapped_column(DateTime(timezone=True), nullable=False)
     master_id: Mapped[MasterId] = mapped_column(BigInteger, ForeignKey("masters.id", ondelete="cascade"))
     client_id: Mapped[ClientId] = mapped_column(BigInteger, ForeignKey("clients.id", ondelete="cascade"))
+    service_id: Mapped[ServiceId | None] = mapped_column(
+        BigInteger,
+        ForeignKey("services.id", ondelete="SET NULL"),
+        nullable=True,
+    )
 
 
 class ClientModel(BaseModel):
     __tablename__ = "clients"
+    __table_args__ = (
+        UniqueConstraint("bot_id", "telegram_id"),
+        # Broadcasts walk the clients of a bot in id order
+        Index("ix_clients_bot_id_id", "bot_id", "id"),
+    )
     __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[ClientId] = mapped_column(BigInteger, primary_key=True)
@@ -172,3 +210,21 @@ class ClientModel(BaseModel):
     name: Mapped[ClientName] = mapped_column(String, nullable=True)
     bot_id: Mapped[BotId] = mapped_column(BigInteger, ForeignKey("bots.id", ondelete="cascade"))
     city_id: Mapped[CityId] = mapped_column(BigInteger, ForeignKey("cities.id", ondelete="SET NULL"))
+
+
+class BroadcastModel(BaseModel):
+    __tablename__ = "broadcasts"
+    __table_args__ = (Index("ix_broadcasts_status_locked_until", "status", "locked_until"),)
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[BroadcastId] = mapped_column(BigInteger, primary_key=True)
+    bot_id: Mapped[BotId] = mapped_column(BigInteger, ForeignKey("bots.id", ondelete="cascade"), index=True)
+    text: Mapped[BroadcastText] = mapped_column(String, nullable=False)
+    status: Mapped[BroadcastStatus] = mapped_column(String, nullable=False)
+    last_client_id: Mapped[ClientId | None] = mapped_column(BigInteger, nullable=True)
+    delivered: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    blocked: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    # A running broadcast whose lease ran out lost its worker and is picked up again
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    lease_token: Mapped[BroadcastLeaseToken | None] = mapped_column(Uuid, nullable=True)
@@ -1,9 +1,13 @@
-from collections.abc import Callable, Sequence
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
 from inspect import Parameter
 from typing import Any, Final, ParamSpec, TypeVar, cast
 
+from aiogram import BaseMiddleware, Dispatcher
+from aiogram.types import TelegramObject
 from aiogram_dialog import ChatEvent, DialogManager
 from dishka import AsyncContainer
+from dishka.integrations.aiogram import AiogramMiddlewareData, inject_router
 from dishka.integrations.base import DependencyParser, default_parse_dependency, wrap_injection
 
 CONTAINER_KEY: Final[str] = "dishka_container"
@@ -12,6 +16,34 @@ ManagedWidget = TypeVar("ManagedWidget")
 Params = ParamSpec("Params")
 
 
+class UpdateContainerMiddleware(BaseMiddleware):
+    """Open one request scope per update.
+
+    The events an update propagates to, a message or a callback query, run in the
+    scope of their update instead of opening their own, so an update holds a single
+    session and therefore a single pooled connection.
+    """
+
+    def __init__(self, container: AsyncContainer) -> None:
+        self._container = container
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        async with self._container({TelegramObject: event, AiogramMiddlewareData: data}) as container:
+            data[CONTAINER_KEY] = container
+            return await handler(event, data)
+
+
+def setup_container(container: AsyncContainer, dispatcher: Dispatcher) -> None:
+    """Like dishka's setup_dishka with auto_inject, but with one scope per update."""
+    dispatcher.update.outer_middleware(UpdateContainerMiddleware(container))
+    dispatcher.startup.register(partial(inject_router, router=dispatcher))
+
+
 def create_inject(
     *,
     func: Callable[Params, RT],
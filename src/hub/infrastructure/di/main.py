@@ -2,24 +2,30 @@ from typing import Any
 
 from dishka import AsyncContainer, Scope, make_async_container
 
+from ..telegram.registry import TenantBotRegistry
 from ..webhook_url import MultibotWebhookUrl
 from .providers import (
     ClientBotGatewayProvider,
     ClientBotInteractorProvider,
+    ClientContextProvider,
     ContextDataProvider,
     DatabaseProvider,
     MainBotGatewayProvider,
     MainBotInteractorProvider,
+    RedisProvider,
+    TelegramProvider,
 )
 
 
 def get_main_bot_ioc_container(context: dict[type[Any], Any] | None = None) -> AsyncContainer:
     context_provider = ContextDataProvider()
     context_provider.from_context(provides=MultibotWebhookUrl, scope=Scope.APP)
+    context_provider.from_context(provides=TenantBotRegistry, scope=Scope.APP)
 
     return make_async_container(
         context_provider,
         DatabaseProvider(),
+        RedisProvider(),
         MainBotGatewayProvider(),
         MainBotInteractorProvider(),
         context=context,
@@ -27,10 +33,16 @@ def get_main_bot_ioc_container(context: dict[type[Any], Any] | None = None) -> A
 
 
 def get_multibot_ioc_container(context: dict[type[Any], Any] | None = None) -> AsyncContainer:
+    context_provider = ContextDataProvider()
+    context_provider.from_context(provides=TenantBotRegistry, scope=Scope.APP)
+
     return make_async_container(
-        ContextDataProvider(),
+        context_provider,
         DatabaseProvider(),
+        RedisProvider(),
+        TelegramProvider(),
         ClientBotGatewayProvider(),
         ClientBotInteractorProvider(),
+        ClientContextProvider(),
         context=context,
     )
@@ -1,12 +1,17 @@
-from .context import ContextDataProvider
+from .context import ClientContextProvider, ContextDataProvider
 from .database import ClientBotGatewayProvider, DatabaseProvider, MainBotGatewayProvider
 from .interactor import ClientBotInteractorProvider, MainBotInteractorProvider
+from .redis import RedisProvider
+from .telegram import TelegramProvider
 
 __all__ = (
+    "ClientContextProvider",
     "ContextDataProvider",
     "ClientBotGatewayProvider",
     "DatabaseProvider",
     "MainBotGatewayProvider",
     "ClientBotInteractorProvider",
     "MainBotInteractorProvider",
+    "RedisProvider",
+    "TelegramProvider",
 )
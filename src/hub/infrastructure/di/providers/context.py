@@ -1,9 +1,25 @@
+from typing import Final
+
 from aiogram.types import TelegramObject
-from dishka import Provider, Scope, from_context
+from dishka import Provider, Scope, from_context, provide
+from dishka.integrations.aiogram import AiogramMiddlewareData
 
+from hub.domain.models.client import ClientContext
 from hub.main.config import Config
 
+CLIENT_CONTEXT_KEY: Final[str] = "client_context"
+
 
 class ContextDataProvider(Provider):
     config = from_context(provides=Config, scope=Scope.APP)
     tgobj = from_context(provides=TelegramObject, scope=Scope.REQUEST)
+    middleware_data = from_context(provides=AiogramMiddlewareData, scope=Scope.REQUEST)
+
+
+class ClientContextProvider(Provider):
+    scope = Scope.REQUEST
+
+    # Read on every resolution, the middleware data is refreshed once the client changes
+    @provide(cache=False)
+    async def get_client_context(self, middleware_data: AiogramMiddlewareData) -> ClientContext:
+        return middleware_data[CLIENT_CONTEXT_KEY]
@@ -1,29 +1,42 @@
 from collections.abc import AsyncIterable
 
-from dishka import AnyOf, Provider, Scope, provide
-from sqlalchemy.ext.asyncio import (
-    AsyncEngine,
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
+from dishka import AnyOf, Provider, Scope, from_context, provide
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
+from hub.application.appointment.cancel import CancelAppointmentDbGateway
+from hub.application.appointment.create import CreateAppointmentDbGateway
+from hub.application.appointment.get_branch_day import GetBranchDayAppointmentsDbGateway
+from hub.application.appointment.get_client_upcoming import GetClientUpcomingAppointmentsDbGateway
+from hub.application.appointment.get_master_day import GetMasterDayAppointmentsDbGateway
+from hub.application.booking.get_available_days import GetAvailableDaysDbGateway
+from hub.application.booking.get_available_slots import GetAvailableSlotsDbGateway
 from hub.application.bot.create import CreateBotDbGateway
 from hub.application.bot.get import GetBotDbGateway
 from hub.application.bot.get_branches import GetBotBranchesDbGateway
+from hub.application.bot.get_branches_page import GetBotBranchesPageDbGateway
 from hub.application.bot.get_cities import GetBotCitiesDbGateway
+from hub.application.bot.get_cities_page import GetBotCitiesPageDbGateway
 from hub.application.bot.get_masters import GetBotMastersDbGateway
+from hub.application.bot.get_masters_page import GetBotMastersPageDbGateway
 from hub.application.bot.get_services import GetBotServicesDbGateway
+from hub.application.bot.get_services_page import GetBotServicesPageDbGateway
 from hub.application.branch.create import CreateBranchDbGateway
 from hub.application.branch.delete import DeleteBranchDbGateway
 from hub.application.branch.get import GetBranchDbGateway
 from hub.application.branch.update import UpdateBranchDbGateway
+from hub.application.broadcast.claim import ClaimBroadcastDbGateway
+from hub.application.broadcast.create import CreateBroadcastDbGateway
+from hub.application.broadcast.get import GetBroadcastDbGateway
+from hub.application.broadcast.send_batch import SendBroadcastBatchDbGateway
+from hub.application.catalog.import_catalog import ImportCatalogDbGateway
 from hub.application.city.create import CreateCityDbGateway
 from hub.application.city.delete import DeleteCityDbGateway
 from hub.application.city.get import GetCityDbGateway
 from hub.application.city.update import CityUpdateDbGateway
 from hub.application.client.create import CreateClientDbGateway
 from hub.application.client.get import GetClientDbGateway
+from hub.application.client.get_context import GetClientContextDbGateway
+from hub.application.export.export_bot import ExportBotDbGateway
 from hub.application.manager.create import CreateManagerDbGateway
 from hub.application.manager.get import GetManagerDbGateway
 from hub.application.manager.get_bots import GetManagerBotsDbGateway
@@ -37,24 +50,25 @@ from hub.application.service.create import CreateServiceDbGateway
 from hub.application.service.delete import DeleteServiceDbGateway
 from hub.application.service.get import GetServiceDbGateway
 from hub.application.service.update import ServiceUpdateDbGateway
-from hub.infrastructure.database.adapters.bot import BotDbGateway
+from hub.infrastructure.database.adapters.appointment import AppointmentDbGateway
+from hub.infrastructure.database.adapters.bot import BotCache, CachedBotDbGateway
 from hub.infrastructure.database.adapters.branch import BranchDbGateway
+from hub.infrastructure.database.adapters.broadcast import BroadcastDbGateway
+from hub.infrastructure.database.adapters.catalog import CatalogDbGateway
 from hub.infrastructure.database.adapters.city import CityDbGateway
 from hub.infrastructure.database.adapters.client import ClientDbGateway
+from hub.infrastructure.database.adapters.export import BotDataDbGateway
 from hub.infrastructure.database.adapters.manager import ManagerDbGateway
 from hub.infrastructure.database.adapters.master import MasterDbGateway
+from hub.infrastructure.database.adapters.schedule import ScheduleDbGateway
 from hub.infrastructure.database.adapters.service import ServiceDbGateway
-from hub.main.config import Config
 
 
 class DatabaseProvider(Provider):
     scope = Scope.APP
 
-    @provide
-    async def get_engine(self, config: Config) -> AsyncIterable[AsyncEngine]:
-        engine = create_async_engine(config.db.full_url)
-        yield engine
-        await engine.dispose(close=True)
+    # The engine is shared by both containers, so it is created and disposed by the application
+    engine = from_context(provides=AsyncEngine, scope=Scope.APP)
 
     @provide
     async def get_sessionmaker(self, engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
@@ -65,6 +79,10 @@ class DatabaseProvider(Provider):
         )
         return sessionmaker
 
+    @provide
+    async def get_bot_cache(self) -> BotCache:
+        return BotCache()
+
     @provide(scope=Scope.REQUEST)
     async def get_session(self, sessionmaker: async_sessionmaker[AsyncSession]) -> AsyncIterable[AsyncSession]:
         async with sessionmaker() as session:
@@ -75,7 +93,7 @@ class MainBotGatewayProvider(Provider):
     scope = Scope.REQUEST
 
     bot = provide(
-        BotDbGateway,
+        CachedBotDbGateway,
         provides=AnyOf[
             CreateBotDbGateway,
             GetBotDbGateway,
@@ -83,6 +101,9 @@ class MainBotGatewayProvider(Provider):
             GetBotServicesDbGateway,
             GetBotBranchesDbGateway,
             GetBotMastersDbGateway,
+            GetBotMastersPageDbGateway,
+            GetBotCitiesPageDbGateway,
+            GetBotBranchesPageDbGateway,
         ],
     )
     manager = provide(
@@ -131,19 +152,36 @@ class MainBotGatewayProvider(Provider):
             DeleteServiceDbGateway,
         ],
     )
+    appointment = provide(
+        AppointmentDbGateway,
+        provides=AnyOf[
+            GetMasterDayAppointmentsDbGateway,
+            GetBranchDayAppointmentsDbGateway,
+        ],
+    )
+    broadcast = provide(
+        BroadcastDbGateway,
+        provides=AnyOf[
+            CreateBroadcastDbGateway,
+            GetBroadcastDbGateway,
+        ],
+    )
+    catalog = provide(CatalogDbGateway, provides=ImportCatalogDbGateway)
+    bot_data = provide(BotDataDbGateway, provides=ExportBotDbGateway)
 
 
 class ClientBotGatewayProvider(Provider):
     scope = Scope.REQUEST
 
     bot = provide(
-        BotDbGateway,
+        CachedBotDbGateway,
         provides=AnyOf[
             GetBotDbGateway,
             GetBotCitiesDbGateway,
             GetBotServicesDbGateway,
             GetBotBranchesDbGateway,
             GetBotMastersDbGateway,
+            GetBotServicesPageDbGateway,
         ],
     )
     client = provide(
@@ -151,6 +189,7 @@ class ClientBotGatewayProvider(Provider):
         provides=AnyOf[
             CreateClientDbGateway,
             GetClientDbGateway,
+            GetClientContextDbGateway,
         ],
     )
     city = provide(
@@ -161,3 +200,29 @@ class ClientBotGatewayProvider(Provider):
         ServiceDbGateway,
         provides=AnyOf[GetServiceDbGateway,],
     )
+    master = provide(
+        MasterDbGateway,
+        provides=AnyOf[GetMasterDbGateway,],
+    )
+    appointment = provide(
+        AppointmentDbGateway,
+        provides=AnyOf[
+            CreateAppointmentDbGateway,
+            CancelAppointmentDbGateway,
+            GetClientUpcomingAppointmentsDbGateway,
+        ],
+    )
+    schedule = provide(
+        ScheduleDbGateway,
+        provides=AnyOf[
+            GetAvailableSlotsDbGateway,
+            GetAvailableDaysDbGateway,
+        ],
+    )
+    broadcast = provide(
+        BroadcastDbGateway,
+        provides=AnyOf[
+            ClaimBroadcastDbGateway,
+            SendBroadcastBatchDbGateway,
+        ],
+    )
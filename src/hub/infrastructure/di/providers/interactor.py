@@ -1,21 +1,39 @@
 from dishka import Provider, Scope, provide
 
+from hub.application.appointment.cancel import CancelAppointment
+from hub.application.appointment.create import CreateAppointment
+from hub.application.appointment.get_branch_day import GetBranchDayAppointments
+from hub.application.appointment.get_client_upcoming import GetClientUpcomingAppointments
+from hub.application.appointment.get_master_day import GetMasterDayAppointments
+from hub.application.booking.get_available_days import GetAvailableDays
+from hub.application.booking.get_available_slots import GetAvailableSlots
 from hub.application.bot.create import CreateBot
 from hub.application.bot.get import GetBot
 from hub.application.bot.get_branches import GetBotBranches
+from hub.application.bot.get_branches_page import GetBotBranchesPage
 from hub.application.bot.get_cities import GetBotCities
+from hub.application.bot.get_cities_page import GetBotCitiesPage
 from hub.application.bot.get_masters import GetBotMasters
+from hub.application.bot.get_masters_page import GetBotMastersPage
 from hub.application.bot.get_services import GetBotServices
+from hub.application.bot.get_services_page import GetBotServicesPage
 from hub.application.branch.create import CreateBranch
 from hub.application.branch.delete import DeleteBranch
 from hub.application.branch.get import GetBranch
 from hub.application.branch.update import UpdateBranch
+from hub.application.broadcast.claim import ClaimBroadcast
+from hub.application.broadcast.create import CreateBroadcast
+from hub.application.broadcast.get import GetBroadcast
+from hub.application.broadcast.send_batch import SendBroadcastBatch
+from hub.application.catalog.import_catalog import ImportCatalog
 from hub.application.city.create import CreateCity
 from hub.application.city.delete import DeleteCity
 from hub.application.city.get import GetCity
 from hub.application.city.update import CityUpdate
 from hub.application.client.create import CreateClient
 from hub.application.client.get import GetClient
+from hub.application.client.get_context import GetClientContext
+from hub.application.export.export_bot import ExportBot
 from hub.application.manager.create import CreateManager
 from hub.application.manager.get import GetManager
 from hub.application.manager.get_bots import GetManagerBots
@@ -41,6 +59,9 @@ class MainBotInteractorProvider(Provider):
     get_bot_services = provide(GetBotServices)
     get_bot_branches = provide(GetBotBranches)
     get_bot_masters = provide(GetBotMasters)
+    get_bot_masters_page = provide(GetBotMastersPage)
+    get_bot_cities_page = provide(GetBotCitiesPage)
+    get_bot_branches_page = provide(GetBotBranchesPage)
 
     # Manager providers
     create_manager = provide(CreateManager)
@@ -73,6 +94,18 @@ class MainBotInteractorProvider(Provider):
     get_service = provide(GetService)
     delete_service = provide(DeleteService)
 
+    # Appointment provider
+    get_master_day_appointments = provide(GetMasterDayAppointments)
+    get_branch_day_appointments = provide(GetBranchDayAppointments)
+
+    # Broadcast provider
+    create_broadcast = provide(CreateBroadcast)
+    get_broadcast = provide(GetBroadcast)
+
+    # Catalog provider
+    import_catalog = provide(ImportCatalog)
+    export_bot = provide(ExportBot)
+
 
 class ClientBotInteractorProvider(Provider):
     scope = Scope.REQUEST
@@ -83,13 +116,31 @@ class ClientBotInteractorProvider(Provider):
     get_bot_services = provide(GetBotServices)
     get_bot_branches = provide(GetBotBranches)
     get_bot_masters = provide(GetBotMasters)
+    get_bot_services_page = provide(GetBotServicesPage)
 
     # Client providers
     create_client = provide(CreateClient)
     get_client = provide(GetClient)
+    get_client_context = provide(GetClientContext)
 
     # City provider
     get_city = provide(GetCity)
 
     # Service provider
     get_service = provide(GetService)
+
+    # Master provider
+    get_master = provide(GetMaster)
+
+    # Appointment provider
+    create_appointment = provide(CreateAppointment)
+    cancel_appointment = provide(CancelAppointment)
+    get_client_upcoming_appointments = provide(GetClientUpcomingAppointments)
+
+    # Booking providers
+    get_available_days = provide(GetAvailableDays)
+    get_available_slots = provide(GetAvailableSlots)
+
+    # Broadcast providers
+    claim_broadcast = provide(ClaimBroadcast)
+    send_broadcast_batch = provide(SendBroadcastBatch)
@@ -0,0 +1,24 @@
+from collections.abc import AsyncIterable
+
+from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
+
+from hub.application.common.interfaces import ClientAppointmentsCache, DayAvailabilityCache, ReminderQueue
+from hub.infrastructure.redis_storage.availability_cache import RedisDayAvailabilityCache
+from hub.infrastructure.redis_storage.client_appointments_cache import RedisClientAppointmentsCache
+from hub.infrastructure.redis_storage.reminder_queue import RedisReminderQueue
+from hub.main.config import Config
+
+
+class RedisProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def get_redis(self, config: Config) -> AsyncIterable[Redis]:
+        redis = Redis.from_url(config.cache.full_url)
+        yield redis
+        await redis.aclose()
+
+    day_availability_cache = provide(RedisDayAvailabilityCache, provides=DayAvailabilityCache)
+    client_appointments_cache = provide(RedisClientAppointmentsCache, provides=ClientAppointmentsCache)
+    reminder_queue = provide(RedisReminderQueue, provides=ReminderQueue)
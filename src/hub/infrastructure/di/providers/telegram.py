@@ -0,0 +1,10 @@
+from dishka import Provider, Scope, provide
+
+from hub.application.common.interfaces import BroadcastSender
+from hub.infrastructure.telegram.broadcast_sender import TelegramBroadcastSender
+
+
+class TelegramProvider(Provider):
+    scope = Scope.APP
+
+    broadcast_sender = provide(TelegramBroadcastSender, provides=BroadcastSender)
@@ -9,6 +9,11 @@ def current_time_with_timezone(tz: str, date_format: str = "%H:%M") -> str:
     return datetime.now(tz=pytz.timezone(tz)).strftime(date_format)
 
 
+def in_timezone(value: datetime, tz: str, date_format: str = "%d.%m.%Y %H:%M") -> str:
+    return value.astimezone(pytz.timezone(tz)).strftime(date_format)
+
+
 jinja_filters: dict[str, Callable[..., Any]] = {
     "current_time_with_timezone": current_time_with_timezone,
+    "in_timezone": in_timezone,
 }
@@ -0,0 +1,100 @@
+import time
+from datetime import date, datetime, timedelta
+
+from redis.asyncio import Redis
+
+from hub.application.common.interfaces import DayAvailabilityCache
+from hub.domain.models.bot import BotId
+from hub.domain.models.service import ServiceId
+from hub.domain.models.timezone import TimeZone
+
+AVAILABILITY_TTL = timedelta(hours=1)
+
+# Flips the bit of the day in the cached month of the booked service and drops
+# the same month of every other service and timezone, since they share masters with it.
+# Values are "<days bitmap>:<valid until epoch>", the validity is kept as it was.
+UPDATE_DAY_SCRIPT = """
+local fields = redis.call("HKEYS", KEYS[1])
+for _, field in ipairs(fields) do
+    if field == ARGV[1] then
+        local value = redis.call("HGET", KEYS[1], field)
+        local separator = string.find(value, ":", 1, true)
+        local days = tonumber(string.sub(value, 1, separator - 1))
+        local bit = 2 ^ tonumber(ARGV[3])
+        local is_set = math.floor(days / bit) % 2 == 1
+        if ARGV[4] == "1" and not is_set then
+            days = days + bit
+        elseif ARGV[4] == "0" and is_set then
+            days = days - bit
+        end
+        redis.call("HSET", KEYS[1], field, string.format("%d", days) .. string.sub(value, separator))
+    elseif string.sub(field, -string.len(ARGV[2])) == ARGV[2] then
+        redis.call("HDEL", KEYS[1], field)
+    end
+end
+"""
+
+
+class RedisDayAvailabilityCache(DayAvailabilityCache):
+    def __init__(self, redis: Redis):
+        self._redis = redis
+        self._update_day = redis.register_script(UPDATE_DAY_SCRIPT)
+
+    @staticmethod
+    def _key(bot_id: BotId) -> str:
+        return f"availability:{bot_id}"
+
+    @staticmethod
+    def _month_suffix(month: date) -> str:
+        return f":{month:%Y-%m}"
+
+    def _field(self, service_id: ServiceId, timezone: TimeZone, month: date) -> str:
+        return f"{service_id}:{timezone}{self._month_suffix(month)}"
+
+    async def get_month(self, bot_id: BotId, service_id: ServiceId, timezone: TimeZone, month: date) -> int | None:
+        value = await self._redis.hget(self._key(bot_id), self._field(service_id, timezone, month))
+        if value is None:
+            return None
+        available_days, valid_until = map(int, value.split(b":"))
+        if valid_until and valid_until <= time.time():
+            return None
+        return available_days
+
+    async def save_month(
+        self,
+        bot_id: BotId,
+        service_id: ServiceId,
+        timezone: TimeZone,
+        month: date,
+        available_days: int,
+        valid_until: datetime | None,
+    ) -> None:
+        key = self._key(bot_id)
+        # The hash expires as a whole, so each month carries its own validity as well
+        value = f"{available_days}:{int(valid_until.timestamp()) if valid_until is not None else 0}"
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, self._field(service_id, timezone, month), value)
+            pipe.expire(key, AVAILABILITY_TTL)
+            await pipe.execute()
+
+    async def update_day(
+        self,
+        bot_id: BotId,
+        service_id: ServiceId,
+        timezone: TimeZone,
+        day: date,
+        *,
+        is_available: bool,
+    ) -> None:
+        await self._update_day(
+            keys=[self._key(bot_id)],
+            args=[
+                self._field(service_id, timezone, day),
+                self._month_suffix(day),
+                day.day - 1,
+                int(is_available),
+            ],
+        )
+
+    async def invalidate(self, bot_id: BotId) -> None:
+        await self._redis.delete(self._key(bot_id))
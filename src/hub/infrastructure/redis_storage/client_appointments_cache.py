@@ -0,0 +1,66 @@
+import json
+from datetime import UTC, datetime, timedelta
+
+from adaptix import Retort
+from redis.asyncio import Redis
+
+from hub.application.common.interfaces import ClientAppointmentsCache
+from hub.application.common.pagination import Page
+from hub.domain.models.appointment import AppointmentCursor, ClientAppointment
+from hub.domain.models.client import ClientId
+from hub.domain.new_type import NewTypeUnwrappingProvider
+
+CLIENT_APPOINTMENTS_TTL = timedelta(minutes=30)
+
+retort = Retort(recipe=[NewTypeUnwrappingProvider()])
+page_loader = retort.get_loader(Page[ClientAppointment])
+page_dumper = retort.get_dumper(Page[ClientAppointment])
+
+
+class RedisClientAppointmentsCache(ClientAppointmentsCache):
+    """Pages of a client's upcoming appointments, all kept in one hash per client.
+
+    Booking or cancelling drops the whole hash. It also expires no later than the
+    first cached appointment starts, so a past appointment is never served as upcoming.
+    """
+
+    def __init__(self, redis: Redis):
+        self._redis = redis
+
+    @staticmethod
+    def _key(client_id: ClientId) -> str:
+        return f"client_appointments:{client_id}"
+
+    @staticmethod
+    def _field(after: AppointmentCursor | None) -> str:
+        if after is None:
+            return "first"
+        date_time, appointment_id = after
+        return f"{date_time.isoformat()}:{appointment_id}"
+
+    async def get_page(self, client_id: ClientId, after: AppointmentCursor | None) -> Page[ClientAppointment] | None:
+        page = await self._redis.hget(self._key(client_id), self._field(after))
+        if page is None:
+            return None
+        return page_loader(json.loads(page))
+
+    async def save_page(
+        self,
+        client_id: ClientId,
+        after: AppointmentCursor | None,
+        page: Page[ClientAppointment],
+    ) -> None:
+        ttl = CLIENT_APPOINTMENTS_TTL
+        if page.items:
+            ttl = min(ttl, page.items[0].date_time - datetime.now(tz=UTC))
+        if ttl <= timedelta(0):
+            return
+        key = self._key(client_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, self._field(after), json.dumps(page_dumper(page)))
+            # lt keeps the deadline set by an earlier page that starts sooner
+            pipe.expire(key, ttl, lt=True)
+            await pipe.execute()
+
+    async def invalidate(self, client_id: ClientId) -> None:
+        await self._redis.delete(self._key(client_id))
@@ -0,0 +1,107 @@
+import json
+import time
+from datetime import datetime, timedelta
+
+from adaptix import Retort
+from redis.asyncio import Redis
+
+from hub.application.common.interfaces import ReminderQueue
+from hub.domain.models.appointment import AppointmentId
+from hub.domain.models.reminder import REMINDER_LEAD_TIMES, Reminder
+from hub.domain.new_type import NewTypeUnwrappingProvider
+
+DUE_KEY = "reminders:due"
+PAYLOAD_KEY = "reminders:payload"
+CANCELLED_KEY = "reminders:cancelled"
+
+# Cancelled appointment ids are remembered this long, which only has to outlast
+# the time between popping a reminder and putting it back
+CANCELLED_TTL = timedelta(days=1)
+
+# Takes the earliest due members off the queue together with their payloads, so
+# several workers never pop the same reminder.
+POP_DUE_SCRIPT = """
+local members = redis.call("ZRANGE", KEYS[1], "-inf", ARGV[1], "BYSCORE", "LIMIT", 0, ARGV[2])
+if #members == 0 then
+    return {}
+end
+local payloads = redis.call("HMGET", KEYS[2], unpack(members))
+redis.call("ZREM", KEYS[1], unpack(members))
+redis.call("HDEL", KEYS[2], unpack(members))
+return payloads
+"""
+
+# Puts popped reminders back unless their appointment was cancelled after the pop.
+# ARGV holds a (member, appointment id, due epoch, payload) quadruple per reminder.
+RESCHEDULE_SCRIPT = """
+for i = 1, #ARGV, 4 do
+    if not redis.call("ZSCORE", KEYS[3], ARGV[i + 1]) then
+        redis.call("HSET", KEYS[2], ARGV[i], ARGV[i + 3])
+        redis.call("ZADD", KEYS[1], ARGV[i + 2], ARGV[i])
+    end
+end
+"""
+
+retort = Retort(recipe=[NewTypeUnwrappingProvider()])
+reminder_loader = retort.get_loader(Reminder)
+reminder_dumper = retort.get_dumper(Reminder)
+
+
+class RedisReminderQueue(ReminderQueue):
+    """Reminders in a sorted set scored by due epoch, payloads in a hash beside it.
+
+    Popping is a range read on the head of the set, so the cost depends on the
+    batch size only, not on how many reminders are waiting.
+    """
+
+    def __init__(self, redis: Redis):
+        self._redis = redis
+        self._pop_due = redis.register_script(POP_DUE_SCRIPT)
+        self._reschedule = redis.register_script(RESCHEDULE_SCRIPT)
+
+    @staticmethod
+    def _member(appointment_id: AppointmentId, lead_seconds: int) -> str:
+        return f"{appointment_id}:{lead_seconds}"
+
+    async def schedule(self, reminders: list[Reminder]) -> None:
+        if not reminders:
+            return
+        members = {
+            self._member(reminder.appointment_id, int(reminder.lead_time.total_seconds())): reminder
+            for reminder in reminders
+        }
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                PAYLOAD_KEY,
+                mapping={member: json.dumps(reminder_dumper(reminder)) for member, reminder in members.items()},
+            )
+            pipe.zadd(DUE_KEY, {member: reminder.due_at.timestamp() for member, reminder in members.items()})
+            await pipe.execute()
+
+    async def cancel(self, appointment_id: AppointmentId) -> None:
+        members = [self._member(appointment_id, int(lead_time.total_seconds())) for lead_time in REMINDER_LEAD_TIMES]
+        now = time.time()
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(DUE_KEY, *members)
+            pipe.hdel(PAYLOAD_KEY, *members)
+            # Reminders popped before the cancellation must not be put back by reschedule
+            pipe.zadd(CANCELLED_KEY, {str(appointment_id): now})
+            pipe.zremrangebyscore(CANCELLED_KEY, "-inf", now - CANCELLED_TTL.total_seconds())
+            await pipe.execute()
+
+    async def reschedule(self, reminders: list[Reminder]) -> None:
+        if not reminders:
+            return
+        args: list[str | float] = []
+        for reminder in reminders:
+            args += [
+                self._member(reminder.appointment_id, int(reminder.lead_time.total_seconds())),
+                str(reminder.appointment_id),
+                reminder.due_at.timestamp(),
+                json.dumps(reminder_dumper(reminder)),
+            ]
+        await self._reschedule(keys=[DUE_KEY, PAYLOAD_KEY, CANCELLED_KEY], args=args)
+
+    async def pop_due(self, now: datetime, limit: int) -> list[Reminder]:
+        payloads = await self._pop_due(keys=[DUE_KEY, PAYLOAD_KEY], args=[now.timestamp(), limit])
+        return [reminder_loader(json.loads(payload)) for payload in payloads if payload is not None]
@@ -0,0 +1,54 @@
+import asyncio
+import logging
+
+from aiogram.exceptions import TelegramAPIError, TelegramForbiddenError, TelegramUnauthorizedError
+
+from hub.application.common.interfaces import BroadcastSender
+from hub.domain.models.bot import BotToken
+from hub.domain.models.broadcast import BroadcastRecipient, BroadcastText, DeliveryReport
+from .registry import TenantBotRegistry
+
+logger = logging.getLogger(__name__)
+
+# Requests of one batch in flight at once, the session still paces them per bot
+BROADCAST_CONCURRENCY = 30
+
+
+class TelegramBroadcastSender(BroadcastSender):
+    def __init__(self, bot_registry: TenantBotRegistry):
+        self._bot_registry = bot_registry
+
+    async def send(
+        self,
+        bot_token: BotToken,
+        text: BroadcastText,
+        recipients: list[BroadcastRecipient],
+    ) -> DeliveryReport:
+        bot = self._bot_registry.get(bot_token)
+        report = DeliveryReport()
+        semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+        revoked = False
+
+        async def send_one(recipient: BroadcastRecipient) -> None:
+            nonlocal revoked
+            async with semaphore:
+                if revoked:
+                    report.failed += 1
+                    return
+                try:
+                    await bot.send_message(chat_id=recipient.chat_id, text=text)
+                except TelegramForbiddenError:
+                    report.blocked += 1
+                except TelegramUnauthorizedError:
+                    # The token was revoked, the rest of the batch would fail the same way
+                    revoked = True
+                    self._bot_registry.discard(bot_token)
+                    report.failed += 1
+                except TelegramAPIError as e:
+                    logger.info("Broadcast message to client %s failed: %s", recipient.client_id, e.message)
+                    report.failed += 1
+                else:
+                    report.delivered += 1
+
+        await asyncio.gather(*(send_one(recipient) for recipient in recipients))
+        return report
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class TelegramSessionConfig:
+    connection_limit: int = 100
+    keepalive_timeout: float = 60
+    request_timeout: float = 60
+    bot_cache_size: int = 1000
+    # Outbound limits per bot and per chat, in messages per second
+    bot_rate_limit: float = 30
+    chat_rate_limit: float = 1
+    # Messages a chat may get at once before its rate applies, a dialog step often sends a few
+    chat_burst: int = 3
+    max_retries: int = 3
+
+
+@dataclass
+class UpdateStreamConfig:
+    # Webhooks only enqueue updates, the workers of every process dispatch them
+    enabled: bool = False
+    partitions: int = 16
+    max_length: int = 100_000
+    # Seconds a worker holds a partition without renewing it
+    lease_timeout: float = 30
@@ -0,0 +1,172 @@
+import asyncio
+import itertools
+import json
+import time
+from collections import Counter, defaultdict, deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+# Parameters aiogram sends as serialized JSON
+JSON_PARAMS = frozenset({"reply_markup", "entities", "link_preview_options", "reply_parameters", "media"})
+RECORDED_CALLS = 10_000
+STATS_PATH = "/fake/stats"
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedCall:
+    token: str
+    method: str
+    params: dict[str, Any]
+    result: dict[str, Any] | bool
+    at: float
+
+
+@dataclass(frozen=True, slots=True)
+class CorpusUpdate:
+    token: str
+    update: dict[str, Any]
+
+
+def load_corpus(path: Path) -> list[CorpusUpdate]:
+    """Read updates from JSON lines of {"token": ..., "update": ...}, one per bot and raw update."""
+    with path.open() as file:
+        return [CorpusUpdate(**json.loads(line)) for line in file if line.strip()]
+
+
+@dataclass
+class _BotUpdates:
+    pending: deque[dict[str, Any]] = field(default_factory=deque)
+    arrived: asyncio.Event = field(default_factory=asyncio.Event)
+    update_ids: Iterator[int] = field(default_factory=lambda: itertools.count(1))
+
+
+class FakeTelegramServer:
+    """In-memory stand-in for the Bot API, for running the bots locally under load.
+
+    Serves getUpdates from updates pushed or replayed into it, answers sending and
+    editing methods with a plausible message and records them. Any other method
+    succeeds with true.
+    """
+
+    def __init__(self) -> None:
+        self.calls: deque[RecordedCall] = deque(maxlen=RECORDED_CALLS)
+        self.method_counts: Counter[str] = Counter()
+        self._bots: defaultdict[str, _BotUpdates] = defaultdict(_BotUpdates)
+        self._message_ids = itertools.count(1)
+        self._watchers: dict[tuple[str, int], asyncio.Queue[RecordedCall]] = {}
+
+    def setup(self, app: web.Application) -> None:
+        app.router.add_post("/bot{token}/{method}", self._handle)
+        app.router.add_get(STATS_PATH, self._handle_stats)
+
+    def push(self, token: str, update: dict[str, Any]) -> int:
+        """Queue an update for the bot under a fresh update_id and return it."""
+        bot = self._bots[token]
+        update_id = next(bot.update_ids)
+        bot.pending.append({**update, "update_id": update_id})
+        bot.arrived.set()
+        return update_id
+
+    async def replay(self, corpus: list[CorpusUpdate], rate: float) -> None:
+        """Push the corpus at `rate` updates per second, or all at once if the rate is 0."""
+        started_at = time.monotonic()
+        for index, item in enumerate(corpus):
+            if rate:
+                delay = started_at + index / rate - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            self.push(item.token, item.update)
+
+    def watch(self, token: str, chat_id: int) -> asyncio.Queue[RecordedCall]:
+        """Calls the bot makes to the chat from now on, in the order they came."""
+        return self._watchers.setdefault((token, chat_id), asyncio.Queue())
+
+    def unwatch(self, token: str, chat_id: int) -> None:
+        self._watchers.pop((token, chat_id), None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pending": {token: len(bot.pending) for token, bot in self._bots.items()},
+            "calls": dict(self.method_counts),
+        }
+
+    async def _handle_stats(self, _: web.Request) -> web.Response:
+        return web.json_response(self.stats())
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        token = request.match_info["token"]
+        method = request.match_info["method"]
+        params = {
+            key: json.loads(value) if key in JSON_PARAMS else value
+            for key, value in (await request.post()).items()
+            if isinstance(value, str)
+        }
+        self.method_counts[method] += 1
+        if method.lower() == "getupdates":
+            result: Any = await self._get_updates(token, params)
+        elif method.lower() == "getme":
+            result = self._user(token)
+        elif method.startswith(("send", "editMessage")):
+            result = self._record(token, method, params)
+        else:
+            result = True
+        return web.json_response({"ok": True, "result": result})
+
+    async def _get_updates(self, token: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        bot = self._bots[token]
+        offset = int(params.get("offset", 0))
+        while bot.pending and bot.pending[0]["update_id"] < offset:
+            bot.pending.popleft()
+        if not bot.pending:
+            bot.arrived.clear()
+            try:
+                await asyncio.wait_for(bot.arrived.wait(), timeout=float(params.get("timeout", 0)))
+            except TimeoutError:
+                return []
+        return list(itertools.islice(bot.pending, int(params.get("limit", 100))))
+
+    def _record(self, token: str, method: str, params: dict[str, Any]) -> dict[str, Any] | bool:
+        chat_id = _chat_id(params.get("chat_id", 0))
+        result = True if "inline_message_id" in params else self._message(token, method, chat_id, params)
+        call = RecordedCall(token=token, method=method, params=params, result=result, at=time.monotonic())
+        self.calls.append(call)
+        watcher = self._watchers.get((token, chat_id))
+        if watcher is not None:
+            watcher.put_nowait(call)
+        return result
+
+    def _message(self, token: str, method: str, chat_id: int, params: dict[str, Any]) -> dict[str, Any]:
+        message_id = params.get("message_id") if method.startswith("editMessage") else None
+        reply_markup = params.get("reply_markup")
+        message: dict[str, Any] = {
+            "message_id": int(message_id) if message_id else next(self._message_ids),
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": self._user(token),
+            # Messages carry inline keyboards only, reply keyboards are not echoed back
+            "reply_markup": reply_markup if reply_markup and "inline_keyboard" in reply_markup else None,
+        }
+        if method in {"sendPhoto", "editMessageMedia"}:
+            # aiogram-dialog edits media in place only when the message already has it
+            file_id = f"photo{message['message_id']}"
+            message["photo"] = [{"file_id": file_id, "file_unique_id": file_id, "width": 1, "height": 1}]
+            message["caption"] = params.get("caption", "")
+        else:
+            message["text"] = params.get("text", "")
+        return message
+
+    @staticmethod
+    def _user(token: str) -> dict[str, Any]:
+        bot_id = int(token.split(":", maxsplit=1)[0])
+        return {"id": bot_id, "is_bot": True, "first_name": f"Bot {bot_id}", "username": f"bot{bot_id}"}
+
+
+def _chat_id(value: str | int) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return 0
@@ -0,0 +1,50 @@
+from typing import Any
+
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import BaseRequestHandler, SimpleRequestHandler, TokenBasedRequestHandler
+from aiohttp import web
+
+from .registry import TenantBotRegistry
+from .update_stream import UpdateStream
+
+
+class TenantBotRequestHandler(TokenBasedRequestHandler):
+    """Token based handler that takes bots from the shared registry instead of an unbounded dict."""
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        bot_registry: TenantBotRegistry,
+        *,
+        handle_in_background: bool = True,
+        **data: Any,
+    ):
+        super().__init__(dispatcher=dispatcher, handle_in_background=handle_in_background, **data)
+        self.bot_registry = bot_registry
+
+    async def close(self) -> None:
+        await self.bot_registry.close()
+
+    async def resolve_bot(self, request: web.Request) -> Bot:
+        return self.bot_registry.get(request.match_info["bot_token"])
+
+
+class StreamingRequestHandlerMixin(BaseRequestHandler):
+    """Answers the webhook as soon as the update is in the stream, workers dispatch it later."""
+
+    def __init__(self, *args: Any, update_stream: UpdateStream, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.update_stream = update_stream
+
+    async def _handle_request_background(self, bot: Bot, request: web.Request) -> web.Response:
+        # Raises on a Redis failure, Telegram gets a 500 and delivers the update again
+        await self.update_stream.push(bot, await request.json(loads=bot.session.json_loads))
+        return web.json_response({}, dumps=bot.session.json_dumps)
+
+
+class StreamingSimpleRequestHandler(StreamingRequestHandlerMixin, SimpleRequestHandler):
+    pass
+
+
+class StreamingTenantBotRequestHandler(StreamingRequestHandlerMixin, TenantBotRequestHandler):
+    pass
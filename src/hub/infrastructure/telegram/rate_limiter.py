@@ -0,0 +1,131 @@
+import asyncio
+from collections import OrderedDict, deque
+from typing import Any
+
+from redis.asyncio import Redis
+
+# Takes one token from every bucket in KEYS[2..] or from none of them. Returns 0 on
+# success, otherwise how many milliseconds to wait. KEYS[1] is the pause a 429 put on
+# the bot. Redis time is used, so workers on different hosts agree on the refill.
+ACQUIRE_SCRIPT = """
+local pause = redis.call("PTTL", KEYS[1])
+if pause > 0 then
+    return pause
+end
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local wait = 0
+local tokens = {}
+for i = 2, #KEYS do
+    local capacity = tonumber(ARGV[i * 2 - 3])
+    local rate = tonumber(ARGV[i * 2 - 2])
+    local state = redis.call("HMGET", KEYS[i], "tokens", "ts")
+    local available = tonumber(state[1]) or capacity
+    local updated_at = tonumber(state[2]) or now
+    available = math.min(capacity, available + (now - updated_at) * rate)
+    if available < 1 then
+        wait = math.max(wait, math.ceil((1 - available) / rate))
+    end
+    tokens[i] = available
+end
+if wait > 0 then
+    return wait
+end
+for i = 2, #KEYS do
+    local capacity = tonumber(ARGV[i * 2 - 3])
+    local rate = tonumber(ARGV[i * 2 - 2])
+    redis.call("HSET", KEYS[i], "tokens", tokens[i] - 1, "ts", now)
+    redis.call("PEXPIRE", KEYS[i], math.ceil(capacity / rate) + 1000)
+end
+return 0
+"""
+
+
+class RedisRateLimiter:
+    """Token buckets per bot and per chat, shared by every worker through Redis.
+
+    A chat's bucket holds at least chat_burst tokens, so the few messages of one
+    dialog step go out at once and only a longer run is paced at chat_rate.
+    """
+
+    def __init__(self, redis: Redis, bot_rate: float, chat_rate: float, chat_burst: int = 3):
+        self._redis = redis
+        self._acquire = redis.register_script(ACQUIRE_SCRIPT)
+        self._bot_bucket = (max(bot_rate, 1), bot_rate / 1000)
+        self._chat_bucket = (max(chat_rate, chat_burst, 1), chat_rate / 1000)
+
+    async def acquire(self, bot_id: int, chat_id: int | str) -> float:
+        """Wait for a token of the bot and of the chat, return how long it took in seconds."""
+        waited = 0.0
+        while True:
+            wait = await self._acquire(
+                keys=[
+                    f"tg_rate:pause:{bot_id}",
+                    f"tg_rate:bot:{bot_id}",
+                    f"tg_rate:chat:{bot_id}:{chat_id}",
+                ],
+                args=[*self._bot_bucket, *self._chat_bucket],
+            )
+            if not wait:
+                return waited
+            await asyncio.sleep(wait / 1000)
+            waited += wait / 1000
+
+    async def pause(self, bot_id: int, seconds: float) -> None:
+        """Hold every worker back from the bot until Telegram's retry_after passes."""
+        await self._redis.set(f"tg_rate:pause:{bot_id}", 1, px=max(int(seconds * 1000), 1))
+
+
+class FairGate:
+    """Bounds in-flight requests and hands freed slots to waiting bots in turn.
+
+    A tenant sending a burst queues behind its own requests only, every other bot
+    still gets the next slot after one of the burst's requests.
+    """
+
+    def __init__(self, limit: int):
+        self._free = limit
+        self._waiters: OrderedDict[Any, deque[asyncio.Future[None]]] = OrderedDict()
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def acquire(self, key: Any) -> None:
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, deque()).append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over right before the cancellation
+                self.release()
+            else:
+                self._forget(key, waiter)
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            key, waiters = self._waiters.popitem(last=False)
+            waiter = waiters.popleft()
+            if waiters:
+                # Back of the line, so the other bots go first
+                self._waiters[key] = waiters
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._free += 1
+
+    def _forget(self, key: Any, waiter: asyncio.Future[None]) -> None:
+        waiters = self._waiters.get(key)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return
+        if not waiters:
+            del self._waiters[key]
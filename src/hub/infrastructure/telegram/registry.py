@@ -0,0 +1,87 @@
+from collections import OrderedDict
+from typing import Any
+
+from aiogram import Bot
+from aiogram.client.default import DefaultBotProperties
+from aiogram.client.telegram import PRODUCTION, TelegramAPIServer
+from redis.asyncio import Redis
+
+from .config import TelegramSessionConfig
+from .rate_limiter import RedisRateLimiter
+from .session import PooledAiohttpSession, RateLimitedAiohttpSession
+
+
+class TenantBotRegistry:
+    """LRU of tenant Bot instances that all send requests through one pooled session."""
+
+    def __init__(self, session: PooledAiohttpSession, default: DefaultBotProperties, maxsize: int):
+        self.session = session
+        self.default = default
+        self.maxsize = maxsize
+        self._bots: OrderedDict[str, Bot] = OrderedDict()
+        self._created = 0
+        self._evicted = 0
+
+    def get(self, token: str) -> Bot:
+        bot = self._bots.get(token)
+        if bot is not None:
+            self._bots.move_to_end(token)
+            return bot
+        bot = Bot(token=token, session=self.session, default=self.default)
+        self._bots[token] = bot
+        self._created += 1
+        while len(self._bots) > self.maxsize:
+            # The session is shared, so an evicted bot has nothing of its own to close
+            self._bots.popitem(last=False)
+            self._evicted += 1
+        return bot
+
+    def discard(self, token: str) -> None:
+        self._bots.pop(token, None)
+
+    def stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = {
+            "bots": len(self._bots),
+            "max_bots": self.maxsize,
+            "created": self._created,
+            "evicted": self._evicted,
+            "connector": self.session.connector_stats(),
+        }
+        if isinstance(self.session, RateLimitedAiohttpSession):
+            stats["rate_limit"] = self.session.rate_limit_stats()
+        return stats
+
+    async def close(self) -> None:
+        self._bots.clear()
+        await self.session.close()
+
+
+def create_tenant_bot_registry(
+    config: TelegramSessionConfig,
+    default: DefaultBotProperties,
+    redis: Redis | None = None,
+    api: TelegramAPIServer = PRODUCTION,
+) -> TenantBotRegistry:
+    session: PooledAiohttpSession
+    if redis is None:
+        session = PooledAiohttpSession(
+            limit=config.connection_limit,
+            keepalive_timeout=config.keepalive_timeout,
+            timeout=config.request_timeout,
+            api=api,
+        )
+    else:
+        session = RateLimitedAiohttpSession(
+            rate_limiter=RedisRateLimiter(
+                redis=redis,
+                bot_rate=config.bot_rate_limit,
+                chat_rate=config.chat_rate_limit,
+                chat_burst=config.chat_burst,
+            ),
+            max_retries=config.max_retries,
+            limit=config.connection_limit,
+            keepalive_timeout=config.keepalive_timeout,
+            timeout=config.request_timeout,
+            api=api,
+        )
+    return TenantBotRegistry(session=session, default=default, maxsize=config.bot_cache_size)
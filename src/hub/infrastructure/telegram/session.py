@@ -0,0 +1,99 @@
+from typing import Any
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from .rate_limiter import FairGate, RedisRateLimiter
+
+# Methods that put a new message into a chat, the ones Telegram's send limits count
+SENDING_METHOD_PREFIXES = ("send", "copyMessage", "forwardMessage")
+UNLIMITED_METHODS = frozenset({"sendChatAction"})
+
+
+def is_sending_method(method: TelegramMethod[Any]) -> bool:
+    name = method.__api_method__
+    return name.startswith(SENDING_METHOD_PREFIXES) and name not in UNLIMITED_METHODS
+
+
+class PooledAiohttpSession(AiohttpSession):
+    """Aiohttp session meant to be shared by many bots, so idle TLS connections are reused."""
+
+    def __init__(self, limit: int = 100, keepalive_timeout: float = 60, **kwargs: Any):
+        super().__init__(limit=limit, **kwargs)
+        self._connector_init["keepalive_timeout"] = keepalive_timeout
+
+    def connector_stats(self) -> dict[str, Any]:
+        limit = self._connector_init["limit"]
+        if self._session is None or self._session.closed:
+            return {"limit": limit, "acquired": 0, "idle": 0, "waiting": 0, "saturation": 0}
+        # aiohttp has no public counters, the connector internals are the only source
+        connector = self._session.connector
+        acquired = len(connector._acquired)  # noqa: SLF001
+        return {
+            "limit": limit,
+            "acquired": acquired,
+            "idle": sum(len(conns) for conns in connector._conns.values()),  # noqa: SLF001
+            "waiting": sum(len(waiters) for waiters in connector._waiters.values()),  # noqa: SLF001
+            "saturation": acquired / limit if limit else 0,
+        }
+
+
+class RateLimitedAiohttpSession(PooledAiohttpSession):
+    """Pooled session that keeps every bot within Telegram's send limits.
+
+    Requests sending a message take a token from the bot's and the chat's buckets
+    first, then a slot of the fair gate. Edits, deletions and callback answers go
+    straight through. A 429 pauses the bot for all workers and the request
+    is retried after retry_after, up to max_retries times.
+    """
+
+    def __init__(self, rate_limiter: RedisRateLimiter, max_retries: int = 3, limit: int = 100, **kwargs: Any):
+        super().__init__(limit=limit, **kwargs)
+        self._rate_limiter = rate_limiter
+        self._gate = FairGate(limit)
+        self._max_retries = max_retries
+        self._requests = 0
+        self._throttled = 0
+        self._throttled_seconds = 0.0
+        self._retry_after = 0
+
+    async def make_request(
+        self,
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+        timeout: int | None = None,
+    ) -> TelegramType:
+        chat_id = getattr(method, "chat_id", None)
+        if chat_id is None or not is_sending_method(method):
+            return await super().make_request(bot, method, timeout)
+
+        retries = 0
+        while True:
+            waited = await self._rate_limiter.acquire(bot.id, chat_id)
+            self._requests += 1
+            if waited:
+                self._throttled += 1
+                self._throttled_seconds += waited
+            await self._gate.acquire(bot.id)
+            try:
+                return await super().make_request(bot, method, timeout)
+            except TelegramRetryAfter as e:
+                self._retry_after += 1
+                if retries == self._max_retries:
+                    raise
+                retries += 1
+                await self._rate_limiter.pause(bot.id, e.retry_after)
+            finally:
+                self._gate.release()
+
+    def rate_limit_stats(self) -> dict[str, Any]:
+        return {
+            "requests": self._requests,
+            "throttled": self._throttled,
+            "throttled_seconds": round(self._throttled_seconds, 3),
+            "retry_after": self._retry_after,
+            "waiting": self._gate.waiting,
+        }
@@ -0,0 +1,369 @@
+import asyncio
+import json
+import logging
+import math
+import os
+import socket
+import time
+import zlib
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any
+
+from aiogram import Bot, Dispatcher
+from aiogram.methods import TelegramMethod
+from aiohttp import web
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+from .config import UpdateStreamConfig
+
+logger = logging.getLogger(__name__)
+
+CONSUMER_GROUP = "dispatchers"
+READ_COUNT = 100
+READ_BLOCK_MS = 1000
+# Entries of a partition read but not handled yet, reading waits for them past this
+MAX_IN_FLIGHT = 1000
+# Seconds before entries left pending by a failed bot lookup are tried again
+RETRY_DELAY = 1
+
+# Takes the partition if it is free, or renews it if this worker already owns it
+ACQUIRE_LEASE_SCRIPT = """
+local owner = redis.call("GET", KEYS[1])
+if owner == ARGV[1] then
+    redis.call("PEXPIRE", KEYS[1], ARGV[2])
+    return 1
+end
+if not owner then
+    redis.call("SET", KEYS[1], ARGV[1], "PX", ARGV[2])
+    return 1
+end
+return 0
+"""
+
+RELEASE_LEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+def chat_key(update: dict[str, Any]) -> int:
+    """Chat of a raw update, or its user when the event has no chat, 0 if it has neither."""
+    for name, event in update.items():
+        if name == "update_id" or not isinstance(event, dict):
+            continue
+        chat = event.get("chat") or (event.get("message") or {}).get("chat")
+        if chat is not None:
+            return chat["id"]
+        user = event.get("from") or event.get("user")
+        if user is not None:
+            return user["id"]
+    return 0
+
+
+class UpdateStream:
+    """Raw updates of one dispatcher, spread over Redis streams by bot and chat.
+
+    All updates of a chat land in the same partition, and a partition is read by one
+    worker at a time, so a chat's updates are handled in the order they arrived.
+    Entries carry the bot's Telegram id rather than its token, the consumer looks the
+    bot up when it handles them and drops the updates of bots that no longer exist.
+    """
+
+    def __init__(self, redis: Redis, name: str, config: UpdateStreamConfig):
+        self.redis = redis
+        self.name = name
+        self.config = config
+
+    def stream_key(self, partition: int) -> str:
+        return f"updates:{self.name}:{partition}"
+
+    def lease_key(self, partition: int) -> str:
+        return f"updates:{self.name}:{partition}:owner"
+
+    @property
+    def workers_key(self) -> str:
+        return f"updates:{self.name}:workers"
+
+    def partition(self, bot_id: int, chat_id: int) -> int:
+        return zlib.crc32(f"{bot_id}:{chat_id}".encode()) % self.config.partitions
+
+    async def push(self, bot: Bot, update: dict[str, Any]) -> None:
+        await self.redis.xadd(
+            self.stream_key(self.partition(bot.id, chat_key(update))),
+            {"bot_id": bot.id, "update": json.dumps(update)},
+            maxlen=self.config.max_length,
+            approximate=True,
+        )
+
+
+class PartitionReader:
+    """Reads one partition and hands its entries to a task per chat.
+
+    A chat's updates are handled one after another while other chats go on, so a slow
+    handler only holds up its own chat. If a chat's bot cannot be resolved, its entries
+    stay pending and no new entries are read until the pending ones have been handled
+    again, so no later update of the chat overtakes them.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        stream_key: str,
+        consumer_name: str,
+        dispatcher: Dispatcher,
+        resolve_bot: Callable[[int], Awaitable[Bot | None]],
+        lease_timeout: float,
+    ):
+        self._redis = redis
+        self._stream_key = stream_key
+        self._consumer_name = consumer_name
+        self._dispatcher = dispatcher
+        self._resolve_bot = resolve_bot
+        self._lease_timeout = lease_timeout
+        self._chats: dict[tuple[int, int], deque[tuple[Any, dict[str, Any]]]] = {}
+        self._chat_tasks: set[asyncio.Task[None]] = set()
+        self._failed_chats: set[tuple[int, int]] = set()
+        self._in_flight: set[Any] = set()
+        self._slots = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+    async def run(self) -> None:
+        try:
+            await self._create_group()
+            # The lease is ours, so whatever is still pending was left by a previous owner and
+            # comes first, however recently it was delivered
+            await self._claim_pending(min_idle_time=0)
+            claimed_at = time.monotonic()
+
+            while True:
+                if self._failed_chats:
+                    await asyncio.sleep(RETRY_DELAY)
+                    await self._retry_pending()
+                    continue
+                if time.monotonic() - claimed_at >= self._lease_timeout:
+                    # Entries of a previous owner that was still finishing them when we took over
+                    await self._claim_pending(min_idle_time=int(self._lease_timeout * 1000))
+                    claimed_at = time.monotonic()
+                response = await self._redis.xreadgroup(
+                    CONSUMER_GROUP,
+                    self._consumer_name,
+                    {self._stream_key: ">"},
+                    count=READ_COUNT,
+                    block=READ_BLOCK_MS,
+                )
+                for _, entries in response:
+                    await self._dispatch(entries)
+        finally:
+            for task in self._chat_tasks:
+                task.cancel()
+            await asyncio.gather(*self._chat_tasks, return_exceptions=True)
+
+    async def _create_group(self) -> None:
+        try:
+            await self._redis.xgroup_create(self._stream_key, CONSUMER_GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _claim_pending(self, min_idle_time: int) -> None:
+        start = "0-0"
+        while True:
+            start, entries, *_ = await self._redis.xautoclaim(
+                self._stream_key,
+                CONSUMER_GROUP,
+                self._consumer_name,
+                min_idle_time=min_idle_time,
+                start_id=start,
+                count=READ_COUNT,
+            )
+            await self._dispatch(entries)
+            if start in {"0-0", b"0-0"}:
+                break
+
+    async def _retry_pending(self) -> None:
+        """Dispatch again what this consumer left pending, in stream order."""
+        self._failed_chats.clear()
+        start = "0"
+        while True:
+            response = await self._redis.xreadgroup(
+                CONSUMER_GROUP,
+                self._consumer_name,
+                {self._stream_key: start},
+                count=READ_COUNT,
+            )
+            last_id = None
+            for _, entries in response:
+                if entries:
+                    await self._dispatch(entries)
+                    last_id = entries[-1][0]
+            if last_id is None:
+                break
+            start = last_id
+
+    async def _dispatch(self, entries: list[tuple[Any, dict[Any, Any]]]) -> None:
+        for entry_id, fields in entries:
+            if entry_id in self._in_flight:
+                # Still waiting in its chat's queue, which is why it looked idle
+                continue
+            if not fields:
+                # Trimmed away before it was claimed
+                await self._redis.xack(self._stream_key, CONSUMER_GROUP, entry_id)
+                continue
+            bot_id = int(fields[b"bot_id"] if b"bot_id" in fields else fields["bot_id"])
+            update = json.loads(fields[b"update"] if b"update" in fields else fields["update"])
+            chat = bot_id, chat_key(update)
+            if chat in self._failed_chats:
+                # Left pending behind the chat's failed entries, the retry reads them in order
+                continue
+            await self._slots.acquire()
+            self._in_flight.add(entry_id)
+            queue = self._chats.get(chat)
+            if queue is None:
+                queue = self._chats[chat] = deque()
+                task = asyncio.create_task(self._handle_chat(chat, queue))
+                self._chat_tasks.add(task)
+                task.add_done_callback(self._chat_tasks.discard)
+            queue.append((entry_id, update))
+
+    async def _handle_chat(self, chat: tuple[int, int], queue: deque[tuple[Any, dict[str, Any]]]) -> None:
+        bot_id, _ = chat
+        try:
+            bot = await self._resolve_bot(bot_id)
+        except Exception:
+            logger.exception("Failed to resolve bot %s, its updates are retried", bot_id)
+            # The queued entries stay pending and the chat takes no new ones until the retry
+            self._failed_chats.add(chat)
+            del self._chats[chat]
+            self._release(entry_id for entry_id, _ in queue)
+            return
+        if bot is None:
+            logger.info("Dropping updates of unknown bot %s", bot_id)
+
+        while queue:
+            entry_id, update = queue.popleft()
+            try:
+                if bot is not None:
+                    await self._handle_update(bot, update)
+                await self._redis.xack(self._stream_key, CONSUMER_GROUP, entry_id)
+            finally:
+                self._release([entry_id])
+        del self._chats[chat]
+
+    async def _handle_update(self, bot: Bot, update: dict[str, Any]) -> None:
+        try:
+            result = await self._dispatcher.feed_raw_update(bot=bot, update=update)
+            if isinstance(result, TelegramMethod):
+                await self._dispatcher.silent_call_request(bot=bot, result=result)
+        except Exception:
+            logger.exception("Failed to process update %s", update.get("update_id"))
+
+    def _release(self, entry_ids: Iterable[Any]) -> None:
+        for entry_id in entry_ids:
+            self._in_flight.discard(entry_id)
+            self._slots.release()
+
+
+class UpdateStreamConsumer:
+    """Feeds updates from the partitions this worker holds into the dispatcher.
+
+    Workers announce themselves with a heartbeat and each one holds at most its share
+    of the partitions, so they spread out as workers come and go. A new owner first
+    takes over every entry its predecessor read but never acknowledged, and later
+    sweeps up entries left pending for longer than a lease.
+    """
+
+    def __init__(
+        self,
+        stream: UpdateStream,
+        dispatcher: Dispatcher,
+        resolve_bot: Callable[[int], Awaitable[Bot | None]],
+    ):
+        self._stream = stream
+        self._redis = stream.redis
+        self._config = stream.config
+        self._dispatcher = dispatcher
+        self._resolve_bot = resolve_bot
+        self._worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._acquire_lease = self._redis.register_script(ACQUIRE_LEASE_SCRIPT)
+        self._release_lease = self._redis.register_script(RELEASE_LEASE_SCRIPT)
+        self._readers: dict[int, asyncio.Task[None]] = {}
+
+    async def run(self) -> None:
+        lease_ms = int(self._config.lease_timeout * 1000)
+        try:
+            while True:
+                try:
+                    await self._rebalance(lease_ms)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("Failed to renew update stream partitions")
+                await asyncio.sleep(self._config.lease_timeout / 3)
+        finally:
+            await self._stop_readers(list(self._readers))
+
+    async def _rebalance(self, lease_ms: int) -> None:
+        now = time.time()
+        await self._redis.zadd(self._stream.workers_key, {self._worker_id: now})
+        await self._redis.zremrangebyscore(self._stream.workers_key, "-inf", now - self._config.lease_timeout)
+        workers = await self._redis.zcard(self._stream.workers_key)
+        share = math.ceil(self._config.partitions / max(workers, 1))
+
+        for partition in list(self._readers):
+            keep = (
+                len(self._readers) <= share
+                and not self._readers[partition].done()
+                and await self._lease(partition, lease_ms)
+            )
+            if not keep:
+                await self._stop_readers([partition])
+
+        for partition in range(self._config.partitions):
+            if len(self._readers) >= share:
+                break
+            if partition in self._readers:
+                continue
+            if await self._lease(partition, lease_ms):
+                self._readers[partition] = asyncio.create_task(self._read(partition))
+
+    async def _lease(self, partition: int, lease_ms: int) -> bool:
+        acquired = await self._acquire_lease(keys=[self._stream.lease_key(partition)], args=[self._worker_id, lease_ms])
+        return bool(acquired)
+
+    async def _stop_readers(self, partitions: list[int]) -> None:
+        for partition in partitions:
+            reader = self._readers.pop(partition)
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+            await self._release_lease(keys=[self._stream.lease_key(partition)], args=[self._worker_id])
+
+    async def _read(self, partition: int) -> None:
+        reader = PartitionReader(
+            redis=self._redis,
+            stream_key=self._stream.stream_key(partition),
+            consumer_name=self._worker_id,
+            dispatcher=self._dispatcher,
+            resolve_bot=self._resolve_bot,
+            lease_timeout=self._config.lease_timeout,
+        )
+        await reader.run()
+
+
+def setup_update_consumer(
+    app: web.Application,
+    stream: UpdateStream,
+    dispatcher: Dispatcher,
+    resolve_bot: Callable[[int], Awaitable[Bot | None]],
+) -> None:
+    consumer = UpdateStreamConsumer(stream=stream, dispatcher=dispatcher, resolve_bot=resolve_bot)
+
+    async def update_consumer_ctx(_: web.Application) -> AsyncIterator[None]:
+        task = asyncio.create_task(consumer.run())
+        yield
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    app.cleanup_ctx.append(update_consumer_ctx)
@@ -1,26 +1,43 @@
 import logging
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
-from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import PRODUCTION, TelegramAPIServer
 from aiogram.enums import ParseMode
 from aiogram.types import LinkPreviewOptions
-from aiogram.webhook.aiohttp_server import SimpleRequestHandler, TokenBasedRequestHandler, setup_application
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
 from aiogram_dialog import setup_dialogs as setup_aiogram_dialog
 from aiogram_dialog.widgets.text import setup_jinja
 from aiohttp import web
 from dishka import AsyncContainer
-from dishka.integrations.aiogram import setup_dishka
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncEngine
 
+from hub.application.bot.exceptions import BotTelegramIdNotExistsError
+from hub.application.bot.get import GetBot, GetBotDTO
+from hub.domain.models.bot import BotTelegramId
 from hub.infrastructure.config_loader import load_config
+from hub.infrastructure.database.factories import create_engine
+from hub.infrastructure.di.injectors import setup_container
 from hub.infrastructure.di.main import get_main_bot_ioc_container, get_multibot_ioc_container
 from hub.infrastructure.jinja_filters import jinja_filters
 from hub.infrastructure.redis_storage.factories import create_redis_event_isolation, create_redis_fsm_storage
+from hub.infrastructure.telegram.handler import (
+    StreamingSimpleRequestHandler,
+    StreamingTenantBotRequestHandler,
+    TenantBotRequestHandler,
+)
+from hub.infrastructure.telegram.registry import TenantBotRegistry, create_tenant_bot_registry
+from hub.infrastructure.telegram.update_stream import UpdateStream, setup_update_consumer
 from hub.infrastructure.webhook_url import MultibotWebhookUrl
 from hub.main.config import Config
+from hub.main.health import setup_health
 from hub.presentation.admin_bot.setup import setup as setup_main_bot
+from hub.presentation.client_bot.broadcasts import setup_broadcasts
+from hub.presentation.client_bot.reminders import setup_reminders
 from hub.presentation.client_bot.setup import setup as setup_multibot
 
 CONFIG_PATH = Path() / "config"
@@ -37,7 +54,7 @@ def get_dispatcher(config: Config, ioc_container: AsyncContainer) -> Dispatcher:
     )
 
     setup_jinja(dispatcher, filters=jinja_filters)
-    setup_dishka(ioc_container, dispatcher, auto_inject=True)
+    setup_container(ioc_container, dispatcher)
     setup_aiogram_dialog(dispatcher)
 
     return dispatcher
@@ -52,28 +69,42 @@ def get_on_startup(config: Config) -> Callable[[Bot], Awaitable[None]]:
     return on_startup
 
 
-# use async func because gunicorn needs an Application instance
-# or async func returning an Application instance
-async def create_app() -> web.Application:
-    logging.basicConfig(level="INFO")
+@dataclass(frozen=True, slots=True)
+class Hub:
+    main_bot_config: Config
+    multibot_config: Config
+    engine: AsyncEngine
+    redis: Redis
+    bot_registry: TenantBotRegistry
+    bot: Bot
+    main_bot_dispatcher: Dispatcher
+    multibot_dispatcher: Dispatcher
+    multibot_ioc_container: AsyncContainer
+
+
+def create_hub(api: TelegramAPIServer = PRODUCTION, *, rate_limit: bool = True) -> Hub:
     main_bot_config = load_config(Config, path=MAIN_BOT_CONFIG_PATH)
     if main_bot_config.bot is None:
         raise ValueError("The [bot] section in the main bot configuration file is missed")
     multibot_config = load_config(Config, path=MULTIBOT_CONFIG_PATH)
-    bot_settings = {
-        "session": AiohttpSession(),
-        "default": DefaultBotProperties(
+    # Both bots use the same database, one pool keeps the connection count bounded
+    engine = create_engine(main_bot_config.db)
+    # Tenant bots and the main bot talk to the same host, so they share one pooled session.
+    # Its rate limits live in Redis, so every gunicorn worker draws from the same buckets.
+    redis = Redis.from_url(multibot_config.cache.full_url)
+    bot_registry = create_tenant_bot_registry(
+        multibot_config.telegram,
+        default=DefaultBotProperties(
             parse_mode=ParseMode.HTML,
             link_preview=LinkPreviewOptions(is_disabled=True),
         ),
-    }
+        redis=redis if rate_limit else None,
+        api=api,
+    )
     bot = Bot(
         token=main_bot_config.bot.token,
-        session=AiohttpSession(),
-        default=DefaultBotProperties(
-            parse_mode=ParseMode.HTML,
-            link_preview=LinkPreviewOptions(is_disabled=True),
-        ),
+        session=bot_registry.session,
+        default=bot_registry.default,
     )
     main_bot_dispatcher = setup_main_bot(
         get_dispatcher(
@@ -82,29 +113,111 @@ async def create_app() -> web.Application:
                 context={
                     MultibotWebhookUrl: f"{multibot_config.webhook.host}{multibot_config.webhook.path}",
                     Config: main_bot_config,
+                    AsyncEngine: engine,
+                    TenantBotRegistry: bot_registry,
                 },
             ),
         ),
     )
-    main_bot_dispatcher.startup.register(get_on_startup(main_bot_config))
+    multibot_ioc_container = get_multibot_ioc_container(
+        context={
+            Config: multibot_config,
+            AsyncEngine: engine,
+            TenantBotRegistry: bot_registry,
+        },
+    )
     multibot_dispatcher = setup_multibot(
         get_dispatcher(
             config=multibot_config,
-            ioc_container=get_multibot_ioc_container(context={Config: multibot_config}),
+            ioc_container=multibot_ioc_container,
         ),
     )
-    app = web.Application()
-    SimpleRequestHandler(
-        dispatcher=main_bot_dispatcher,
+    return Hub(
+        main_bot_config=main_bot_config,
+        multibot_config=multibot_config,
+        engine=engine,
+        redis=redis,
+        bot_registry=bot_registry,
         bot=bot,
-        secret_token=main_bot_config.webhook.secret,
-    ).register(app, path=main_bot_config.webhook.path)
-    TokenBasedRequestHandler(
-        dispatcher=multibot_dispatcher,
-        bot_settings=bot_settings,
-    ).register(app, path=multibot_config.webhook.path)
-
-    setup_application(app, main_bot_dispatcher, bot=bot)
-    setup_application(app, multibot_dispatcher)
+        main_bot_dispatcher=main_bot_dispatcher,
+        multibot_dispatcher=multibot_dispatcher,
+        multibot_ioc_container=multibot_ioc_container,
+    )
+
+
+def setup_background(app: web.Application, hub: Hub) -> None:
+    """Health endpoints, background workers and connection cleanup shared by every entry point."""
+    setup_health(app, hub.engine, hub.bot_registry)
+    setup_reminders(app, hub.multibot_ioc_container, hub.bot_registry)
+    setup_broadcasts(app, hub.multibot_ioc_container)
+
+    async def close_connections(_: web.Application) -> None:
+        await hub.engine.dispose(close=True)
+        await hub.redis.aclose()
+
+    app.on_cleanup.append(close_connections)
+
+
+def resolve_main_bot(hub: Hub) -> Callable[[int], Awaitable[Bot | None]]:
+    async def resolve(_: int) -> Bot:
+        return hub.bot
+
+    return resolve
+
+
+def resolve_tenant_bot(hub: Hub) -> Callable[[int], Awaitable[Bot | None]]:
+    """Tenant bot of a streamed update, looked up by its Telegram id through the cached GetBot."""
+
+    async def resolve(telegram_id: int) -> Bot | None:
+        async with hub.multibot_ioc_container() as request:
+            get_bot = await request.get(GetBot)
+            try:
+                bot = await get_bot(GetBotDTO(telegram_id=BotTelegramId(telegram_id)))
+            except BotTelegramIdNotExistsError:
+                return None
+        return hub.bot_registry.get(bot.token)
+
+    return resolve
+
+
+# use async func because gunicorn needs an Application instance
+# or async func returning an Application instance
+async def create_app() -> web.Application:
+    logging.basicConfig(level="INFO")
+    hub = create_hub()
+    hub.main_bot_dispatcher.startup.register(get_on_startup(hub.main_bot_config))
+    app = web.Application()
+    if hub.main_bot_config.updates.enabled:
+        main_bot_stream = UpdateStream(hub.redis, name="main", config=hub.main_bot_config.updates)
+        StreamingSimpleRequestHandler(
+            dispatcher=hub.main_bot_dispatcher,
+            bot=hub.bot,
+            secret_token=hub.main_bot_config.webhook.secret,
+            update_stream=main_bot_stream,
+        ).register(app, path=hub.main_bot_config.webhook.path)
+        setup_update_consumer(app, main_bot_stream, hub.main_bot_dispatcher, resolve_bot=resolve_main_bot(hub))
+    else:
+        SimpleRequestHandler(
+            dispatcher=hub.main_bot_dispatcher,
+            bot=hub.bot,
+            secret_token=hub.main_bot_config.webhook.secret,
+        ).register(app, path=hub.main_bot_config.webhook.path)
+    if hub.multibot_config.updates.enabled:
+        multibot_stream = UpdateStream(hub.redis, name="multibot", config=hub.multibot_config.updates)
+        StreamingTenantBotRequestHandler(
+            dispatcher=hub.multibot_dispatcher,
+            bot_registry=hub.bot_registry,
+            update_stream=multibot_stream,
+        ).register(app, path=hub.multibot_config.webhook.path)
+        setup_update_consumer(app, multibot_stream, hub.multibot_dispatcher, resolve_bot=resolve_tenant_bot(hub))
+    else:
+        TenantBotRequestHandler(
+            dispatcher=hub.multibot_dispatcher,
+            bot_registry=hub.bot_registry,
+        ).register(app, path=hub.multibot_config.webhook.path)
+
+    setup_application(app, hub.main_bot_dispatcher, bot=hub.bot)
+    setup_application(app, hub.multibot_dispatcher)
+    setup_background(app, hub)
 
     return app
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from hub.infrastructure.database.config import DBConfig
 from hub.infrastructure.redis_storage.config import RedisConfig
+from hub.infrastructure.telegram.config import TelegramSessionConfig, UpdateStreamConfig
 
 
 @dataclass
@@ -27,10 +28,18 @@ class EventIsolationConfig(RedisConfig):
     db: int = 1
 
 
+@dataclass
+class CacheConfig(RedisConfig):
+    db: int = 4
+
+
 @dataclass
 class Config:
     webhook: WebhookConfig
     db: DBConfig
     fsm: FSMConfig
     event_isolation: EventIsolationConfig
+    cache: CacheConfig
+    telegram: TelegramSessionConfig = field(default_factory=TelegramSessionConfig)
+    updates: UpdateStreamConfig = field(default_factory=UpdateStreamConfig)
     bot: BotConfig | None = None
@@ -0,0 +1,22 @@
+from aiohttp import web
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from hub.infrastructure.database.pool import InstrumentedAsyncAdaptedQueuePool
+from hub.infrastructure.telegram.registry import TenantBotRegistry
+
+DB_HEALTH_PATH = "/health/db"
+TELEGRAM_HEALTH_PATH = "/health/telegram"
+
+
+def setup_health(app: web.Application, engine: AsyncEngine, bot_registry: TenantBotRegistry) -> None:
+    async def db_health(_: web.Request) -> web.Response:
+        pool = engine.pool
+        if not isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+            return web.json_response({"status": pool.status()})
+        return web.json_response(pool.stats())
+
+    async def telegram_health(_: web.Request) -> web.Response:
+        return web.json_response(bot_registry.stats())
+
+    app.router.add_get(DB_HEALTH_PATH, db_health)
+    app.router.add_get(TELEGRAM_HEALTH_PATH, telegram_health)
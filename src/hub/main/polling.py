@@ -0,0 +1,78 @@
+"""Long-polling entry point that runs both bots against a local fake Bot API.
+
+Reproduces production load without public HTTPS: the fake server replays a recorded
+update corpus into getUpdates and records what the bots send back. Tenant bots are
+taken from the corpus tokens and must exist in the database like in production.
+
+    python -m hub.main.polling --corpus updates.jsonl --rate 200
+"""
+
+import argparse
+import asyncio
+import logging
+from contextlib import suppress
+from pathlib import Path
+
+from aiogram.client.telegram import TelegramAPIServer
+from aiohttp import web
+
+from hub.infrastructure.telegram.fake_server import FakeTelegramServer, load_corpus
+from hub.main.bot import create_hub, setup_background
+
+logger = logging.getLogger(__name__)
+
+
+async def run_polling(corpus_path: Path | None, rate: float, tokens: list[str], host: str, port: int) -> None:
+    fake_server = FakeTelegramServer()
+    hub = create_hub(api=TelegramAPIServer.from_base(f"http://{host}:{port}"))
+
+    app = web.Application()
+    fake_server.setup(app)
+    setup_background(app, hub)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+
+    corpus = load_corpus(corpus_path) if corpus_path is not None else []
+    tenant_tokens = ({item.token for item in corpus} | set(tokens)) - {hub.bot.token}
+    tenant_bots = [hub.bot_registry.get(token) for token in sorted(tenant_tokens)]
+    polling = [
+        asyncio.create_task(
+            hub.main_bot_dispatcher.start_polling(hub.bot, handle_signals=False, close_bot_session=False),
+        ),
+    ]
+    if tenant_bots:
+        polling.append(
+            asyncio.create_task(
+                hub.multibot_dispatcher.start_polling(*tenant_bots, handle_signals=False, close_bot_session=False),
+            ),
+        )
+    try:
+        await fake_server.replay(corpus, rate)
+        logger.info("Replayed %s updates, polling goes on until interrupted", len(corpus))
+        await asyncio.gather(*polling)
+    finally:
+        for task in polling:
+            task.cancel()
+        await asyncio.gather(*polling, return_exceptions=True)
+        logger.info("Fake Bot API stats: %s", fake_server.stats())
+        await hub.bot_registry.close()
+        await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the bots by long polling against a local fake Bot API")
+    parser.add_argument("--corpus", type=Path, help="JSON lines of {token, update} to replay")
+    parser.add_argument("--rate", type=float, default=0, help="updates per second, 0 replays at once")
+    parser.add_argument("--token", action="append", default=[], help="extra tenant bot token to poll")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    args = parser.parse_args()
+
+    logging.basicConfig(level="INFO")
+    with suppress(KeyboardInterrupt):
+        asyncio.run(run_polling(args.corpus, args.rate, args.token, args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
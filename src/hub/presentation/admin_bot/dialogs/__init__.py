@@ -2,6 +2,8 @@ from aiogram import Dispatcher
 
 from .add_bot import add_bot_dialog
 from .bot_panel.branches import add_branch_dialog, branches_dialog
+from .bot_panel.broadcast import broadcast_dialog
+from .bot_panel.catalog_import import catalog_import_dialog
 from .bot_panel.cities import add_city_dialog, cities_dialog
 from .bot_panel.masters import (
     add_master_dialog,
@@ -29,4 +31,6 @@ def setup_dialogs(dispatcher: Dispatcher) -> None:
         add_service_dialog,
         edit_master_work_time_dialog,
         edit_master_break_time_dialog,
+        catalog_import_dialog,
+        broadcast_dialog,
     )
@@ -4,12 +4,12 @@ from aiogram import F
 from aiogram.types import Message
 from aiogram_dialog import Dialog, DialogManager, LaunchMode, ShowMode, Window
 from aiogram_dialog.widgets.input import TextInput
-from aiogram_dialog.widgets.kbd import Back, Button, Cancel, Column, Select, SwitchTo
+from aiogram_dialog.widgets.kbd import Back, Button, Cancel, Column, NextPage, PrevPage, Row, Select, SwitchTo
 from aiogram_dialog.widgets.media import StaticMedia
 from aiogram_dialog.widgets.text import Const, Format, Jinja, Multi
 from dishka import FromDishka
 
-from hub.application.bot.get_branches import GetBotBranches, GetBotBranchesDTO
+from hub.application.bot.get_branches_page import GetBotBranchesPage, GetBotBranchesPageDTO
 from hub.application.bot.get_cities import GetBotCities, GetBotCitiesDTO
 from hub.application.branch.create import CreateBranch, CreateBranchDTO
 from hub.application.branch.delete import DeleteBranch, DeleteBranchDTO
@@ -22,22 +22,28 @@ from hub.domain.models.city import CityId
 from hub.infrastructure.di.injectors import inject_getter, inject_handler, inject_trigger
 from hub.presentation.admin_bot.dialogs.common import open_with_bot_id
 from hub.presentation.admin_bot.state_groups.bot_panel import AddBranchSG, BotPanelSG, BranchSG, CitySG
+from hub.presentation.custom_widgets.keyset_scroll import KeysetScroll, ManagedKeysetScroll
+
+BRANCH_SCROLL_ID = "branch.scroll"
+BRANCH_PAGE_SIZE = 10
 
 
 @inject_getter
 async def bot_branches_getter(
     dialog_manager: DialogManager,
-    get_branches: FromDishka[GetBotBranches],
+    get_branches_page: FromDishka[GetBotBranchesPage],
     **_: Any,
 ) -> dict[str, Any]:
-    branches = await get_branches(
-        GetBotBranchesDTO(
+    scroll: ManagedKeysetScroll = dialog_manager.find(BRANCH_SCROLL_ID)
+    page = await get_branches_page(
+        GetBotBranchesPageDTO(
             bot_id=dialog_manager.start_data,
+            after_id=scroll.get_cursor(),
+            limit=BRANCH_PAGE_SIZE,
         ),
     )
-    return {
-        "branches": branches,
-    }
+    scroll.set_next_cursor(page.items[-1].id if page.is_full else None)
+    return {"branches": page.items, "pages": page.pages}
 
 
 @inject_getter
@@ -145,6 +151,11 @@ branches_dialog = Dialog(
                 on_click=process_open_branch_editor,
             ),
         ),
+        KeysetScroll(id=BRANCH_SCROLL_ID, pages="pages"),
+        Row(
+            PrevPage(scroll=BRANCH_SCROLL_ID, text=Const("⬅️"), when=F["pages"] > 1),
+            NextPage(scroll=BRANCH_SCROLL_ID, text=Const("➡️"), when=F["pages"] > 1),
+        ),
         Button(Const("➕ Добавить отделение"), id="add.branch", on_click=open_with_bot_id(AddBranchSG.GET_NAME)),
         Button(Const("↩️ Назад"), id="open.bot.panel", on_click=open_with_bot_id(BotPanelSG.MENU)),
         state=BranchSG.LIST,
@@ -0,0 +1,92 @@
+from typing import Any
+
+from aiogram import F
+from aiogram.enums import ContentType
+from aiogram.types import CallbackQuery, Message
+from aiogram_dialog import Dialog, DialogManager, Window
+from aiogram_dialog.widgets.input import MessageInput
+from aiogram_dialog.widgets.kbd import Button, Cancel, SwitchTo
+from aiogram_dialog.widgets.media import StaticMedia
+from aiogram_dialog.widgets.text import Const, Format, Jinja, Multi
+from dishka import FromDishka
+
+from hub.application.broadcast.create import CreateBroadcast, CreateBroadcastDTO
+from hub.application.broadcast.get import GetBroadcast, GetBroadcastDTO
+from hub.domain.models.broadcast import BroadcastStatus
+from hub.infrastructure.di.injectors import inject_getter, inject_handler
+from hub.presentation.admin_bot.state_groups.bot_panel import BroadcastSG
+
+
+@inject_getter
+async def broadcast_progress_getter(
+    dialog_manager: DialogManager,
+    get_broadcast: FromDishka[GetBroadcast],
+    **_: Any,
+) -> dict[str, Any]:
+    broadcast = await get_broadcast(GetBroadcastDTO(broadcast_id=dialog_manager.dialog_data["broadcast_id"]))
+    return {
+        "broadcast": broadcast,
+        "is_done": broadcast.status == BroadcastStatus.DONE,
+    }
+
+
+async def process_broadcast_text(
+    message: Message,
+    _: Any,
+    dialog_manager: DialogManager,
+) -> None:
+    dialog_manager.dialog_data["text"] = message.html_text
+    await dialog_manager.switch_to(BroadcastSG.CONFIRM)
+
+
+@inject_handler
+async def process_start_broadcast(
+    _: CallbackQuery,
+    __: Any,
+    dialog_manager: DialogManager,
+    create_broadcast: FromDishka[CreateBroadcast],
+) -> None:
+    broadcast_id = await create_broadcast(
+        CreateBroadcastDTO(
+            bot_id=dialog_manager.start_data,
+            text=dialog_manager.dialog_data["text"],
+        ),
+    )
+    dialog_manager.dialog_data["broadcast_id"] = broadcast_id
+    await dialog_manager.switch_to(BroadcastSG.PROGRESS)
+
+
+broadcast_dialog = Dialog(
+    Window(
+        StaticMedia(path="./resources/media/main_bot/stub.png"),
+        Const("📣 Отправьте сообщение, которое получат все клиенты бота."),
+        MessageInput(process_broadcast_text, content_types=ContentType.TEXT),
+        Cancel(Const("↩️ Назад")),
+        state=BroadcastSG.GET_TEXT,
+    ),
+    Window(
+        StaticMedia(path="./resources/media/main_bot/stub.png"),
+        Multi(
+            Const("Клиенты получат это сообщение:"),
+            Format("{dialog_data[text]}"),
+            sep="\n\n",
+        ),
+        Button(Const("📣 Отправить"), id="start.broadcast", on_click=process_start_broadcast),
+        SwitchTo(Const("✏️ Изменить"), id="open.text", state=BroadcastSG.GET_TEXT),
+        Cancel(Const("↩️ Назад")),
+        state=BroadcastSG.CONFIRM,
+    ),
+    Window(
+        StaticMedia(path="./resources/media/main_bot/stub.png"),
+        Jinja(
+            "{% if is_done %}✅ Рассылка завершена.{% else %}⏳ Рассылка идет, сообщения уходят в фоне.{% endif %}\n\n"
+            "Доставлено: {{ broadcast.delivered }}\n"
+            "Заблокировали бота: {{ broadcast.blocked }}\n"
+            "Ошибки: {{ broadcast.failed }}",
+        ),
+        SwitchTo(Const("🔄 Обновить"), id="refresh", state=BroadcastSG.PROGRESS, when=~F["is_done"]),
+        Cancel(Const("↩️ Назад")),
+        state=BroadcastSG.PROGRESS,
+        getter=broadcast_progress_getter,
+    ),
+)
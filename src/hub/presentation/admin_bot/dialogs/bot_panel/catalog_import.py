@@ -0,0 +1,101 @@
+import asyncio
+import csv
+from dataclasses import asdict
+from tempfile import SpooledTemporaryFile
+from typing import Any, BinaryIO, cast
+
+from aiogram.enums import ContentType
+from aiogram.types import Message
+from aiogram_dialog import Dialog, DialogManager, Window
+from aiogram_dialog.widgets.input import MessageInput
+from aiogram_dialog.widgets.kbd import Cancel, SwitchTo
+from aiogram_dialog.widgets.media import StaticMedia
+from aiogram_dialog.widgets.text import Const, Jinja, Multi
+from dishka import FromDishka
+
+from hub.application.catalog.import_catalog import CATALOG_COLUMNS, ImportCatalog, ImportCatalogDTO
+from hub.infrastructure.catalog_file import read_catalog_file
+from hub.infrastructure.di.injectors import inject_handler
+from hub.presentation.admin_bot.state_groups.bot_panel import ImportCatalogSG
+
+# Telegram caps a message at 4096 characters, the rest of the errors is only counted
+MAX_SHOWN_ERRORS = 30
+# Larger uploads are spooled to disk instead of being held in memory
+MAX_IN_MEMORY_FILE_SIZE = 1024 * 1024
+
+
+async def catalog_columns_getter(**_: Any) -> dict[str, Any]:
+    return {"columns": CATALOG_COLUMNS}
+
+
+@inject_handler
+async def process_catalog_file(
+    message: Message,
+    _: Any,
+    dialog_manager: DialogManager,
+    import_catalog: FromDishka[ImportCatalog],
+) -> None:
+    if message.document is None or message.bot is None:
+        raise ValueError("Document cannot be None")
+    file_name = message.document.file_name or ""
+    with SpooledTemporaryFile(max_size=MAX_IN_MEMORY_FILE_SIZE) as file:
+        # aiogram asks for a BinaryIO, the spool is typed as IO[bytes] and only gets written to
+        await message.bot.download(message.document, destination=cast(BinaryIO, file))
+        try:
+            # Parsed in full before importing, so a broken file is rejected before any row is used
+            rows = await asyncio.to_thread(list, read_catalog_file(file, file_name))
+        except (ValueError, csv.Error):
+            await message.answer("😔 Не получилось прочитать файл. Нужен CSV с заголовком или JSON-массив объектов.")
+            return
+        report = await import_catalog(
+            ImportCatalogDTO(bot_id=dialog_manager.start_data, rows=rows),
+        )
+    dialog_manager.dialog_data["report"] = {
+        **asdict(report),
+        "errors": [asdict(error) for error in report.errors[:MAX_SHOWN_ERRORS]],
+        "errors_count": len(report.errors),
+    }
+    await dialog_manager.switch_to(state=ImportCatalogSG.REPORT)
+
+
+catalog_import_dialog = Dialog(
+    Window(
+        StaticMedia(path="./resources/media/main_bot/stub.png"),
+        Multi(
+            Const("📥 Отправьте файл CSV или JSON с городами, отделениями, услугами и мастерами."),
+            Jinja(
+                "Колонки: {{ columns | join(', ') }}.\n"
+                "Обязательны city и timezone, для отделения нужен address. "
+                "work_time и break_time задаются в минутах для пары мастер-услуга.",
+            ),
+            Const("Существующие записи находятся по названию и обновляются, новые создаются."),
+            sep="\n\n",
+        ),
+        MessageInput(process_catalog_file, content_types=ContentType.DOCUMENT),
+        Cancel(Const("↩️ Назад")),
+        state=ImportCatalogSG.UPLOAD,
+        getter=catalog_columns_getter,
+    ),
+    Window(
+        StaticMedia(path="./resources/media/main_bot/stub.png"),
+        Jinja(
+            "✅ Импорт завершен.\n\n"
+            "Создано городов: {{ dialog_data.report.created_cities }}, "
+            "отделений: {{ dialog_data.report.created_branches }}, "
+            "услуг: {{ dialog_data.report.created_services }}, "
+            "мастеров: {{ dialog_data.report.created_masters }}.\n"
+            "Обновлено записей: {{ dialog_data.report.updated }}.\n"
+            "Связей мастеров: {{ dialog_data.report.links }}."
+            "{% if dialog_data.report.errors_count %}\n\n"
+            "⚠️ Пропущено строк: {{ dialog_data.report.errors_count }}\n"
+            "{% for error in dialog_data.report.errors %}"
+            "Строка {{ error.line }}, колонка {{ error.column }}: "
+            "{% if error.value is none %}нет значения{% else %}неверное значение «{{ error.value }}»{% endif %}\n"
+            "{% endfor %}"
+            "{% endif %}",
+        ),
+        SwitchTo(Const("📥 Загрузить еще"), id="open.upload", state=ImportCatalogSG.UPLOAD),
+        Cancel(Const("↩️ Назад")),
+        state=ImportCatalogSG.REPORT,
+    ),
+)
@@ -8,13 +8,13 @@ from aiogram.types import CallbackQuery
 from aiogram.utils.i18n import gettext as _
 from aiogram_dialog import Dialog, DialogManager, LaunchMode, SubManager, Window
 from aiogram_dialog.widgets.input import TextInput
-from aiogram_dialog.widgets.kbd import Button, Cancel, Column, Group, Row, Select, SwitchTo
+from aiogram_dialog.widgets.kbd import Button, Cancel, Column, Group, NextPage, PrevPage, Row, Select, SwitchTo
 from aiogram_dialog.widgets.media import StaticMedia
 from aiogram_dialog.widgets.text import Const, Format, Jinja, Multi
 from babel.dates import get_timezone_name
 from dishka import FromDishka
 
-from hub.application.bot.get_cities import GetBotCities, GetBotCitiesDTO
+from hub.application.bot.get_cities_page import GetBotCitiesPage, GetBotCitiesPageDTO
 from hub.application.city.create import CreateCity, CreateCityDTO
 from hub.application.city.delete import DeleteCity, DeleteCityDTO
 from hub.application.city.get import GetCity, GetCityDTO
@@ -23,23 +23,29 @@ from hub.domain.models.city import CityId, CityName
 from hub.domain.models.timezone import TimeZone
 from hub.infrastructure.di.injectors import inject_getter, inject_handler
 from hub.presentation.admin_bot.state_groups.bot_panel import AddCitySG, BotPanelSG, CitySG
+from hub.presentation.custom_widgets.keyset_scroll import KeysetScroll, ManagedKeysetScroll
 from ..common import TimeZoneName, open_with_bot_id, timezones_getter
 
+CITY_SCROLL_ID = "city.scroll"
+CITY_PAGE_SIZE = 10
+
 
 @inject_getter
 async def city_list_getter(
     dialog_manager: DialogManager,
-    get_bot_cities: FromDishka[GetBotCities],
+    get_bot_cities_page: FromDishka[GetBotCitiesPage],
     **_: Any,
 ) -> dict[str, Any]:
-    cities = await get_bot_cities(
-        GetBotCitiesDTO(
+    scroll: ManagedKeysetScroll = dialog_manager.find(CITY_SCROLL_ID)
+    page = await get_bot_cities_page(
+        GetBotCitiesPageDTO(
             bot_id=dialog_manager.start_data,
+            after_id=scroll.get_cursor(),
+            limit=CITY_PAGE_SIZE,
         ),
     )
-    return {
-        "cities": cities,
-    }
+    scroll.set_next_cursor(page.items[-1].id if page.is_full else None)
+    return {"cities": page.items, "pages": page.pages}
 
 
 @inject_getter
@@ -130,10 +136,14 @@ cities_dialog = Dialog(
                 on_click=process_select_city,
             ),
         ),
+        KeysetScroll(id=CITY_SCROLL_ID, pages="pages"),
+        Row(
+            PrevPage(scroll=CITY_SCROLL_ID, text=Const("⬅️"), when=F["pages"] > 1),
+            NextPage(scroll=CITY_SCROLL_ID, text=Const("➡️"), when=F["pages"] > 1),
+        ),
         Row(
             Button(Const("⬅️ Назад"), id="back.to.menu", on_click=open_with_bot_id(BotPanelSG.MENU)),
             Button(Const("➕ Добавить город"), id="add.city", on_click=open_with_bot_id(AddCitySG.GET_NAME)),
-
         ),
         state=CitySG.LIST,
         getter=city_list_getter,
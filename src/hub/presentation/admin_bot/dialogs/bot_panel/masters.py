@@ -6,16 +6,28 @@ from aiogram.fsm.state import State
 from aiogram.types import Message
 from aiogram_dialog import Dialog, DialogManager, ShowMode, Window
 from aiogram_dialog.widgets.input import TextInput
-from aiogram_dialog.widgets.kbd import Back, Button, Cancel, Column, Group, Select, SwitchTo
+from aiogram_dialog.widgets.kbd import (
+    Back,
+    Button,
+    Cancel,
+    Column,
+    Group,
+    ManagedMultiselect,
+    Multiselect,
+    NextPage,
+    PrevPage,
+    Row,
+    Select,
+    SwitchTo,
+)
 from aiogram_dialog.widgets.media import StaticMedia
 from aiogram_dialog.widgets.text import Const, Format, Jinja, Multi
 from dishka import FromDishka
 
 from hub.application.bot.get_branches import GetBotBranches, GetBotBranchesDTO
 from hub.application.bot.get_cities import GetBotCities, GetBotCitiesDTO
-from hub.application.bot.get_masters import GetBotMasters, GetBotMastersDTO
+from hub.application.bot.get_masters_page import GetBotMastersPage, GetBotMastersPageDTO
 from hub.application.bot.get_services import GetBotServices, GetBotServicesDTO
-from hub.application.branch.get import GetBranch, GetBranchDTO
 from hub.application.master.create import CreateMaster, CreateMasterDTO
 from hub.application.master.delete import DeleteMaster, DeleteMasterDTO
 from hub.application.master.get import GetMaster, GetMasterDTO
@@ -27,13 +39,14 @@ from hub.application.master.get_master_available_services import (
     GetMasterAvailableServices,
     GetMasterAvailableServicesDTO,
 )
-from hub.application.master.update import UpdateMaster, UpdateMasterDTO, UpdateServiceTimeDTO
+from hub.application.master.update import UpdateMaster, UpdateMasterDTO
 from hub.application.service.get import GetService, GetServiceDTO
 from hub.domain.models.bot import BotId
 from hub.domain.models.branch import BranchId
 from hub.domain.models.city import CityId
 from hub.domain.models.master import MasterId, MasterName
 from hub.domain.models.service import ServiceId
+from hub.domain.models.service_master import MasterAssociationsDiff, ServiceMasterTime
 from hub.infrastructure.di.injectors import inject_getter, inject_handler, inject_trigger
 from hub.presentation.admin_bot.state_groups.bot_panel import (
     AddMasterSG,
@@ -43,24 +56,32 @@ from hub.presentation.admin_bot.state_groups.bot_panel import (
     MasterEditWorkTimeSG,
     MasterSG,
 )
+from hub.presentation.custom_widgets.keyset_scroll import KeysetScroll, ManagedKeysetScroll
 from ..common import (
     open_with_bot_id,
     put_start_data_to_dialog_data,
 )
 
+MASTER_SCROLL_ID = "master.scroll"
+MASTER_PAGE_SIZE = 10
+
 
 @inject_getter
 async def master_list_getter(
     dialog_manager: DialogManager,
-    get_bot_masters: FromDishka[GetBotMasters],
+    get_bot_masters_page: FromDishka[GetBotMastersPage],
     **_: Any,
 ) -> dict[str, Any]:
-    masters = await get_bot_masters(
-        GetBotMastersDTO(
+    scroll: ManagedKeysetScroll = dialog_manager.find(MASTER_SCROLL_ID)
+    page = await get_bot_masters_page(
+        GetBotMastersPageDTO(
             bot_id=dialog_manager.start_data,
+            after_id=scroll.get_cursor(),
+            limit=MASTER_PAGE_SIZE,
         ),
     )
-    return {"masters": masters}
+    scroll.set_next_cursor(page.items[-1].id if page.is_full else None)
+    return {"masters": page.items, "pages": page.pages}
 
 
 @inject_getter
@@ -137,44 +158,100 @@ async def process_delete_master(
     await dialog_manager.switch_to(state=MasterSG.LIST)
 
 
+BRANCHES_MULTISELECT_ID = "select.branches"
+SERVICES_MULTISELECT_ID = "select.services"
+
+
+async def _init_multiselect(dialog_manager: DialogManager, widget_id: str, checked: list[int]) -> None:
+    multiselect: ManagedMultiselect = dialog_manager.find(widget_id)
+    await multiselect.reset_checked()
+    for item_id in checked:
+        await multiselect.set_checked(item_id, checked=True)
+    dialog_manager.dialog_data[widget_id] = checked
+
+
+def _get_multiselect_diff(dialog_manager: DialogManager, widget_id: str) -> tuple[set[int], set[int]]:
+    """Return the ids checked and unchecked since the multiselect was initialized."""
+    multiselect: ManagedMultiselect = dialog_manager.find(widget_id)
+    initial = set(dialog_manager.dialog_data[widget_id])
+    checked = set(multiselect.get_checked())
+    return checked - initial, initial - checked
+
+
 @inject_handler
-async def process_select_branch(
+async def process_open_edit_branches(
     _: Any,
     __: Any,
     dialog_manager: DialogManager,
-    branch_id: BranchId,
-    get_branch: FromDishka[GetBranch],
-    update_master: FromDishka[UpdateMaster],
+    get_branches: FromDishka[GetMasterAvailableBranches],
 ) -> None:
-    branch = await get_branch(
-        GetBranchDTO(
-            branch_id=branch_id,
-        ),
-    )
-    await update_master(
-        UpdateMasterDTO(
+    branches = await get_branches(
+        GetMasterAvailableBranchesDTO(
+            bot_id=dialog_manager.start_data,
             master_id=dialog_manager.dialog_data["master_id"],
-            branch=branch,
         ),
     )
+    await _init_multiselect(
+        dialog_manager,
+        BRANCHES_MULTISELECT_ID,
+        [branch.id for branch in branches if branch.is_associated],
+    )
 
 
 @inject_handler
-async def process_select_service(
+async def process_open_edit_services(
     _: Any,
     __: Any,
     dialog_manager: DialogManager,
-    service_id: ServiceId,
-    get_service: FromDishka[GetService],
-    update_master: FromDishka[UpdateMaster],
+    get_services: FromDishka[GetMasterAvailableServices],
 ) -> None:
-    service = await get_service(GetServiceDTO(service_id=service_id))
-    await update_master(
-        UpdateMasterDTO(
+    services = await get_services(
+        GetMasterAvailableServicesDTO(
+            bot_id=dialog_manager.start_data,
             master_id=dialog_manager.dialog_data["master_id"],
-            service=service,
         ),
     )
+    await _init_multiselect(
+        dialog_manager,
+        SERVICES_MULTISELECT_ID,
+        [service.id for service in services if service.is_associated],
+    )
+
+
+@inject_handler
+async def process_save_branches(
+    _: Any,
+    __: Any,
+    dialog_manager: DialogManager,
+    update_master: FromDishka[UpdateMaster],
+) -> None:
+    attach, detach = _get_multiselect_diff(dialog_manager, BRANCHES_MULTISELECT_ID)
+    if attach or detach:
+        await update_master(
+            UpdateMasterDTO(
+                master_id=dialog_manager.dialog_data["master_id"],
+                associations=MasterAssociationsDiff(attach_branches=attach, detach_branches=detach),
+            ),
+        )
+    await dialog_manager.switch_to(state=MasterSG.EDITOR)
+
+
+@inject_handler
+async def process_save_services(
+    _: Any,
+    __: Any,
+    dialog_manager: DialogManager,
+    update_master: FromDishka[UpdateMaster],
+) -> None:
+    provide, withhold = _get_multiselect_diff(dialog_manager, SERVICES_MULTISELECT_ID)
+    if provide or withhold:
+        await update_master(
+            UpdateMasterDTO(
+                master_id=dialog_manager.dialog_data["master_id"],
+                associations=MasterAssociationsDiff(provide_services=provide, withhold_services=withhold),
+            ),
+        )
+    await dialog_manager.switch_to(state=MasterSG.EDITOR)
 
 
 @inject_getter
@@ -242,6 +319,11 @@ masters_dialog = Dialog(
             ),
             width=2,
         ),
+        KeysetScroll(id=MASTER_SCROLL_ID, pages="pages"),
+        Row(
+            PrevPage(scroll=MASTER_SCROLL_ID, text=Const("⬅️"), when=F["pages"] > 1),
+            NextPage(scroll=MASTER_SCROLL_ID, text=Const("➡️"), when=F["pages"] > 1),
+        ),
         Button(Const("➕ Добавить"), id="add.master", on_click=open_with_bot_id(AddMasterSG.GET_NAME)),
         Cancel(Const("⬅️ Назад")),
         state=MasterSG.LIST,
@@ -263,8 +345,18 @@ masters_dialog = Dialog(
         StaticMedia(path="./resources/media/main_bot/stub.png"),
         Jinja("Настройки мастера: {{ master.name }}"),
         SwitchTo(Const("Сменить имя"), id="open.edit.name", state=MasterSG.EDIT_NAME),
-        SwitchTo(Const("Отделения работы"), id="open.edit.branch", state=MasterSG.EDIT_BRANCH),
-        SwitchTo(Const("Оказываемые услуги"), id="open.edit.services", state=MasterSG.EDIT_SERVICES),
+        SwitchTo(
+            Const("Отделения работы"),
+            id="open.edit.branch",
+            state=MasterSG.EDIT_BRANCH,
+            on_click=process_open_edit_branches,
+        ),
+        SwitchTo(
+            Const("Оказываемые услуги"),
+            id="open.edit.services",
+            state=MasterSG.EDIT_SERVICES,
+            on_click=process_open_edit_services,
+        ),
         Button(
             Const("Время оказания услуг"),
             id="open.edit.work.time",
@@ -293,42 +385,36 @@ masters_dialog = Dialog(
     ),
     Window(
         StaticMedia(path="./resources/media/main_bot/stub.png"),
-        Const("Выберите отделения в котором работает мастер:"),
+        Const("Выберите отделения в котором работает мастер и сохраните:"),
         Column(
-            Select(
-                Multi(
-                    Const("✔️", when=F["item"].is_associated),
-                    Jinja("{{ item.name }}"),
-                    sep=" ",
-                ),
-                id="select.branch",
+            Multiselect(
+                Jinja("✔️ {{ item.name }}"),
+                Jinja("{{ item.name }}"),
+                id=BRANCHES_MULTISELECT_ID,
                 item_id_getter=lambda branch: branch.id,
                 items="branches",
                 type_factory=BranchId,
-                on_click=process_select_branch,
             ),
         ),
+        Button(Const("💾 Сохранить"), id="save.branches", on_click=process_save_branches),
         SwitchTo(Const("↩️ Назад"), id="back.to.editor", state=MasterSG.EDITOR),
         state=MasterSG.EDIT_BRANCH,
         getter=available_branches_getter,
     ),
     Window(
         StaticMedia(path="./resources/media/main_bot/stub.png"),
-        Jinja("Выберите услуги, которые оказывает мастер:"),
+        Jinja("Выберите услуги, которые оказывает мастер, и сохраните:"),
         Column(
-            Select(
-                Multi(
-                    Const("✔️", when=F["item"].is_associated),
-                    Jinja("{{ item.name }}"),
-                    sep=" ",
-                ),
-                id="select.service",
+            Multiselect(
+                Jinja("✔️ {{ item.name }}"),
+                Jinja("{{ item.name }}"),
+                id=SERVICES_MULTISELECT_ID,
                 item_id_getter=lambda service: service.id,
                 items="services",
                 type_factory=ServiceId,
-                on_click=process_select_service,
             ),
         ),
+        Button(Const("💾 Сохранить"), id="save.services", on_click=process_save_services),
         SwitchTo(Const("↩️ Назад"), id="back.to.editor", state=MasterSG.EDITOR),
         state=MasterSG.EDIT_SERVICES,
         getter=get_available_services,
@@ -361,15 +447,17 @@ async def process_work_time(
     dialog_manager: DialogManager,
     work_time: int,
     update_master: FromDishka[UpdateMaster],
-    get_service: FromDishka[GetService],
 ) -> None:
-    service = await get_service(GetServiceDTO(service_id=dialog_manager.dialog_data["service_id"]))
     await update_master(
         UpdateMasterDTO(
             master_id=dialog_manager.dialog_data["master_id"],
-            service_time=UpdateServiceTimeDTO(
-                service=service,
-                work_time=work_time,
+            associations=MasterAssociationsDiff(
+                service_times=[
+                    ServiceMasterTime(
+                        service_id=dialog_manager.dialog_data["service_id"],
+                        work_time=work_time,
+                    ),
+                ],
             ),
         ),
     )
@@ -383,15 +471,17 @@ async def process_break_time(
     dialog_manager: DialogManager,
     break_time: int,
     update_master: FromDishka[UpdateMaster],
-    get_service: FromDishka[GetService],
 ) -> None:
-    service = await get_service(GetServiceDTO(service_id=dialog_manager.dialog_data["service_id"]))
     await update_master(
         UpdateMasterDTO(
             master_id=dialog_manager.dialog_data["master_id"],
-            service_time=UpdateServiceTimeDTO(
-                service=service,
-                break_time=break_time,
+            associations=MasterAssociationsDiff(
+                service_times=[
+                    ServiceMasterTime(
+                        service_id=dialog_manager.dialog_data["service_id"],
+                        break_time=break_time,
+                    ),
+                ],
             ),
         ),
     )
@@ -1,18 +1,25 @@
+import asyncio
+import gzip
+from tempfile import NamedTemporaryFile
 from typing import Any
 
-from aiogram_dialog import Dialog, DialogManager, LaunchMode, Window
+from aiogram.types import CallbackQuery, FSInputFile
+from aiogram_dialog import Dialog, DialogManager, LaunchMode, ShowMode, Window
 from aiogram_dialog.widgets.kbd import Button, Start
 from aiogram_dialog.widgets.media import StaticMedia
 from aiogram_dialog.widgets.text import Const, Jinja
 from dishka import FromDishka
 
 from hub.application.bot.get import GetBot, GetBotDTO
-from hub.infrastructure.di.injectors import inject_getter
+from hub.application.export.export_bot import ExportBot, ExportBotDTO
+from hub.infrastructure.di.injectors import inject_getter, inject_handler
 from hub.presentation.admin_bot.state_groups.bot_panel import (
     BotPanelSG,
     BranchSG,
+    BroadcastSG,
     CitySG,
     GeneralSettingsSG,
+    ImportCatalogSG,
     MasterSG,
     ServiceSG,
 )
@@ -34,6 +41,28 @@ async def get_bot_data(
     return {"bot_name": bot.name}
 
 
+@inject_handler
+async def process_export(
+    callback_query: CallbackQuery,
+    _: Any,
+    dialog_manager: DialogManager,
+    export_bot: FromDishka[ExportBot],
+) -> None:
+    if callback_query.message is None:
+        raise ValueError("Message cannot be None")
+    await callback_query.answer("⏳ Готовим выгрузку, это может занять время.")
+    bot_id = dialog_manager.start_data
+    # Chunks go straight to a compressed temporary file, large bots never sit in memory
+    with NamedTemporaryFile(suffix=".ndjson.gz") as file:
+        with gzip.GzipFile(fileobj=file, mode="wb") as archive:
+            async for chunk in await export_bot(ExportBotDTO(bot_id=bot_id)):
+                # Compressing and writing a chunk blocks for milliseconds, keep it off the event loop
+                await asyncio.to_thread(archive.write, chunk)
+        file.flush()
+        await callback_query.message.answer_document(FSInputFile(file.name, filename=f"bot_{bot_id}.ndjson.gz"))
+    dialog_manager.show_mode = ShowMode.DELETE_AND_SEND
+
+
 bot_panel_dialog = Dialog(
     Window(
         StaticMedia(path="./resources/media/main_bot/stub.png"),
@@ -43,6 +72,9 @@ bot_panel_dialog = Dialog(
         Button(Const("Настройки мастеров"), id="open.masters", on_click=open_with_bot_id(MasterSG.LIST)),
         Button(Const("Настройки услуг"), id="open.services", on_click=open_with_bot_id(ServiceSG.LIST)),
         Button(Const("Общие настройки"), id="open.settings", on_click=open_with_bot_id(GeneralSettingsSG.LIST)),
+        Button(Const("Импорт из файла"), id="open.import", on_click=open_with_bot_id(ImportCatalogSG.UPLOAD)),
+        Button(Const("Экспорт данных"), id="export", on_click=process_export),
+        Button(Const("Рассылка клиентам"), id="open.broadcast", on_click=open_with_bot_id(BroadcastSG.GET_TEXT)),
         Start(Const("↩️ Назад"), id="close.panel", state=BotsListSG.LIST),
         state=BotPanelSG.MENU,
         getter=get_bot_data,
@@ -75,3 +75,14 @@ class GeneralSettingsSG(StatesGroup):
 
 class WorkingHoursEditorSG(StatesGroup):
     VIEW = State()
+
+
+class ImportCatalogSG(StatesGroup):
+    UPLOAD = State()
+    REPORT = State()
+
+
+class BroadcastSG(StatesGroup):
+    GET_TEXT = State()
+    CONFIRM = State()
+    PROGRESS = State()
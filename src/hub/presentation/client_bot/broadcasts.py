@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+
+from aiohttp import web
+from dishka import AsyncContainer
+
+from hub.application.bot.exceptions import BotIdNotExistsError
+from hub.application.broadcast.claim import ClaimBroadcast, ClaimBroadcastDTO
+from hub.application.broadcast.exceptions import BroadcastLeaseLostError
+from hub.application.broadcast.send_batch import SendBroadcastBatch, SendBroadcastBatchDTO
+from hub.domain.models.broadcast import Broadcast, BroadcastStatus
+
+logger = logging.getLogger(__name__)
+
+# Broadcasts one process sends at once, more tenants wait for a free runner
+MAX_ACTIVE_BROADCASTS = 4
+POLL_INTERVAL = 5
+
+
+class BroadcastWorker:
+    """Claims queued broadcasts and sends them batch by batch in the background.
+
+    Every batch runs in its own request scope, so no transaction or client list
+    outlives it. A broadcast of a crashed process is claimed again once its lease
+    runs out and resumes after the last recorded client.
+    """
+
+    def __init__(self, container: AsyncContainer):
+        self._container = container
+        self._active: set[asyncio.Task[None]] = set()
+
+    async def run(self) -> None:
+        while True:
+            broadcast = None
+            if len(self._active) < MAX_ACTIVE_BROADCASTS:
+                try:
+                    async with self._container() as request:
+                        claim_broadcast = await request.get(ClaimBroadcast)
+                        broadcast = await claim_broadcast(ClaimBroadcastDTO())
+                except Exception:
+                    logger.exception("Failed to claim a broadcast")
+            if broadcast is None:
+                await asyncio.sleep(POLL_INTERVAL)
+                continue
+            task = asyncio.create_task(self._send(broadcast))
+            self._active.add(task)
+            task.add_done_callback(self._active.discard)
+
+    async def _send(self, broadcast: Broadcast) -> None:
+        try:
+            while broadcast.status != BroadcastStatus.DONE:
+                async with self._container() as request:
+                    send_batch = await request.get(SendBroadcastBatch)
+                    broadcast = await send_batch(SendBroadcastBatchDTO(broadcast=broadcast))
+        except BotIdNotExistsError:
+            logger.info("Bot of broadcast %s was deleted", broadcast.id)
+        except BroadcastLeaseLostError:
+            logger.warning("Broadcast %s was taken over by another worker after its lease ran out", broadcast.id)
+        except Exception:
+            # The lease runs out and the broadcast is retried from its last batch
+            logger.exception("Broadcast %s stopped", broadcast.id)
+        else:
+            logger.info(
+                "Broadcast %s done: delivered %s, blocked %s, failed %s",
+                broadcast.id,
+                broadcast.delivered,
+                broadcast.blocked,
+                broadcast.failed,
+            )
+
+    async def close(self) -> None:
+        for task in self._active:
+            task.cancel()
+        await asyncio.gather(*self._active, return_exceptions=True)
+
+
+def setup_broadcasts(app: web.Application, container: AsyncContainer) -> None:
+    worker = BroadcastWorker(container=container)
+
+    async def broadcast_worker_ctx(_: web.Application) -> AsyncIterator[None]:
+        task = asyncio.create_task(worker.run())
+        yield
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await worker.close()
+
+    app.cleanup_ctx.append(broadcast_worker_ctx)
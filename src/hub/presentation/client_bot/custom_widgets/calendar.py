@@ -1,6 +1,7 @@
 from datetime import date, datetime
 from typing import Any
 
+from aiogram.types import InlineKeyboardButton
 from aiogram_dialog import DialogManager
 from aiogram_dialog.widgets.kbd import Calendar, CalendarScope, CalendarUserConfig
 from aiogram_dialog.widgets.kbd.calendar_kbd import (
@@ -8,8 +9,9 @@ from aiogram_dialog.widgets.kbd.calendar_kbd import (
     CalendarMonthView,
     CalendarScopeView,
     CalendarYearsView,
+    empty_button,
 )
-from aiogram_dialog.widgets.text import Const, Text
+from aiogram_dialog.widgets.text import Const, Format, Text
 from babel.dates import get_day_names, get_month_names
 from pytz import timezone
 
@@ -34,6 +36,32 @@ class RuMonth(Text):
         return get_month_names("wide", context="stand-alone", locale=self.locale)[selected_date.month].title()
 
 
+class BookingDaysView(CalendarDaysView):
+    """Days view that leaves days without free slots unclickable.
+
+    Free days are taken from the ``available_days`` key of the window data,
+    when it is missing every day is rendered as usual.
+    """
+
+    def __init__(self, *args: Any, unavailable_date_text: Text | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.unavailable_date_text = unavailable_date_text or Format("·")
+
+    async def _render_date_button(
+        self,
+        selected_date: date,
+        today: date,
+        data: dict,
+        manager: DialogManager,
+    ) -> InlineKeyboardButton:
+        available_days = data.get("available_days")
+        if available_days is None or selected_date in available_days:
+            return await super()._render_date_button(selected_date, today, data, manager)
+        button = empty_button()
+        button.text = await self.unavailable_date_text.render_text({"date": selected_date, "data": data}, manager)
+        return button
+
+
 class BookingCalendar(Calendar):
     async def _get_user_config(
         self,
@@ -48,7 +76,7 @@ class BookingCalendar(Calendar):
 
     def _init_views(self) -> dict[CalendarScope, CalendarScopeView]:
         return {
-            CalendarScope.DAYS: CalendarDaysView(
+            CalendarScope.DAYS: BookingDaysView(
                 self._item_callback_data,
                 header_text=Const("Дни за месяц: ") + RuMonth("ru_RU"),
                 weekday_text=RuWeekDay("ru_RU"),
@@ -1,16 +1,139 @@
-from aiogram_dialog import Dialog, Window
-from aiogram_dialog.widgets.kbd import Start
+from datetime import datetime
+from typing import Any
+
+from aiogram import F
+from aiogram.types import CallbackQuery
+from aiogram_dialog import Dialog, DialogManager, Window
+from aiogram_dialog.widgets.kbd import Button, Group, NextPage, PrevPage, Row, Select, Start, SwitchTo
 from aiogram_dialog.widgets.media import StaticMedia
-from aiogram_dialog.widgets.text import Const
+from aiogram_dialog.widgets.text import Const, Jinja, Multi
+from dishka import FromDishka
 
+from hub.application.appointment.cancel import CancelAppointment, CancelAppointmentDTO
+from hub.application.appointment.exceptions import AppointmentIdNotExistsError
+from hub.application.appointment.get_client_upcoming import (
+    GetClientUpcomingAppointments,
+    GetClientUpcomingAppointmentsDTO,
+)
+from hub.domain.models.appointment import AppointmentId
+from hub.domain.models.client import ClientContext
+from hub.infrastructure.di.injectors import inject_getter, inject_handler
+from hub.presentation.custom_widgets.keyset_scroll import KeysetScroll, ManagedKeysetScroll
 from ..state_groups.appointments import ClientAppointmentsSG
 from ..state_groups.main_menu import MainMenuSG
 
+APPOINTMENT_SCROLL_ID = "appointment.scroll"
+APPOINTMENT_PAGE_SIZE = 5
+
+
+@inject_getter
+async def client_appointments_getter(
+    dialog_manager: DialogManager,
+    context: FromDishka[ClientContext],
+    get_client_upcoming_appointments: FromDishka[GetClientUpcomingAppointments],
+    **_: Any,
+) -> dict[str, Any]:
+    if context.client is None or context.city is None:
+        raise ValueError("Client cannot be None")
+    scroll: ManagedKeysetScroll = dialog_manager.find(APPOINTMENT_SCROLL_ID)
+    # Cursors live in the dialog storage, so the (date, id) pair is kept as plain strings and ints
+    cursor = scroll.get_cursor()
+    page = await get_client_upcoming_appointments(
+        GetClientUpcomingAppointmentsDTO(
+            client_id=context.client.id,
+            after=None if cursor is None else (datetime.fromisoformat(cursor[0]), cursor[1]),
+            limit=APPOINTMENT_PAGE_SIZE,
+        ),
+    )
+    last = page.items[-1] if page.is_full else None
+    scroll.set_next_cursor(None if last is None else [last.date_time.isoformat(), last.id])
+    return {
+        "appointments": page.items,
+        "timezone": context.city.timezone,
+        "pages": page.pages,
+    }
+
+
+async def process_select_appointment(
+    _: Any,
+    __: Any,
+    dialog_manager: DialogManager,
+    appointment_id: AppointmentId,
+) -> None:
+    dialog_manager.dialog_data["appointment_id"] = appointment_id
+    await dialog_manager.switch_to(ClientAppointmentsSG.CANCEL)
+
+
+@inject_handler
+async def process_cancel_appointment(
+    callback_query: CallbackQuery,
+    _: Any,
+    dialog_manager: DialogManager,
+    context: FromDishka[ClientContext],
+    cancel_appointment: FromDishka[CancelAppointment],
+) -> None:
+    if context.client is None or context.city is None:
+        raise ValueError("Client cannot be None")
+    try:
+        await cancel_appointment(
+            CancelAppointmentDTO(
+                bot_id=context.bot.id,
+                client_id=context.client.id,
+                appointment_id=dialog_manager.dialog_data["appointment_id"],
+                timezone=context.city.timezone,
+            ),
+        )
+    except AppointmentIdNotExistsError:
+        await callback_query.answer("Эта запись уже отменена.", show_alert=True)
+    else:
+        await callback_query.answer("✅ Запись отменена.")
+    await dialog_manager.switch_to(ClientAppointmentsSG.LIST)
+
+
 client_appointments_dialog = Dialog(
     Window(
         StaticMedia(path="./resources/media/main_bot/stub.png"),
-        Const("Встречи"),
-        Start(Const("Назад"), id="close", state=MainMenuSG.MENU),
+        Multi(
+            Const("📋 Ваши предстоящие записи:", when=F["appointments"]),
+            Jinja(
+                "{% for item in appointments %}"
+                "🗓 <b>{{ item.date_time | in_timezone(timezone) }}</b>\n"
+                "{% if item.service_name %}💅 {{ item.service_name }}\n{% endif %}"
+                "👤 {{ item.master_name }}\n"
+                "{% if item.branch_name %}📍 {{ item.branch_name }}, {{ item.branch_address }}\n{% endif %}"
+                "\n"
+                "{% endfor %}",
+                when=F["appointments"],
+            ),
+            Const("Чтобы отменить запись, нажмите на нее 👇", when=F["appointments"]),
+            Const("У Вас пока нет предстоящих записей.", when=~F["appointments"]),
+            sep="\n\n",
+        ),
+        Group(
+            Select(
+                Jinja("❌ {{ item.date_time | in_timezone(timezone) }}"),
+                id="select.appointment",
+                item_id_getter=lambda appointment: appointment.id,
+                type_factory=AppointmentId,
+                items="appointments",
+                on_click=process_select_appointment,
+            ),
+            width=1,
+        ),
+        KeysetScroll(id=APPOINTMENT_SCROLL_ID, pages="pages"),
+        Row(
+            PrevPage(scroll=APPOINTMENT_SCROLL_ID, text=Const("⬅️"), when=F["pages"] > 1),
+            NextPage(scroll=APPOINTMENT_SCROLL_ID, text=Const("➡️"), when=F["pages"] > 1),
+        ),
+        Start(Const("↩️ Назад"), id="close", state=MainMenuSG.MENU),
         state=ClientAppointmentsSG.LIST,
+        getter=client_appointments_getter,
+    ),
+    Window(
+        StaticMedia(path="./resources/media/main_bot/stub.png"),
+        Const("Вы уверены, что хотите отменить запись?"),
+        Button(Const("❌ Отменить запись"), id="cancel.appointment", on_click=process_cancel_appointment),
+        SwitchTo(Const("↩️ Назад"), id="open.list", state=ClientAppointmentsSG.LIST),
+        state=ClientAppointmentsSG.CANCEL,
     ),
 )
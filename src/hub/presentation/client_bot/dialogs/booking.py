@@ -1,72 +1,102 @@
+from datetime import date, datetime
 from typing import Any
 
 from aiogram import F
+from aiogram.types import CallbackQuery
 from aiogram_dialog import Dialog, DialogManager, Window
-from aiogram_dialog.widgets.kbd import NextPage, PrevPage, Row, ScrollingGroup, Select, Start, SwitchTo
+from aiogram_dialog.widgets.kbd import Group, NextPage, PrevPage, Row, Select, Start, SwitchTo
 from aiogram_dialog.widgets.media import StaticMedia
-from aiogram_dialog.widgets.text import Const, Jinja, Multi
+from aiogram_dialog.widgets.text import Const, Format, Jinja, Multi
 from dishka import FromDishka
+from pytz import timezone
 
-from hub.application.bot.get import GetBot, GetBotDTO
-from hub.application.bot.get_services import GetBotServices, GetBotServicesDTO
-from hub.application.city.get import GetCity, GetCityDTO
-from hub.application.client.get import GetClient, GetClientDTO
+from hub.application.appointment.create import CreateAppointment, CreateAppointmentDTO
+from hub.application.appointment.exceptions import SlotAlreadyTakenError
+from hub.application.booking.get_available_days import GetAvailableDays, GetAvailableDaysDTO
+from hub.application.booking.get_available_slots import GetAvailableSlots, GetAvailableSlotsDTO
+from hub.application.bot.get_services_page import GetBotServicesPage, GetBotServicesPageDTO
+from hub.application.master.get import GetMaster, GetMasterDTO
 from hub.application.service.get import GetService, GetServiceDTO
+from hub.domain.models.client import ClientContext
 from hub.domain.models.service import ServiceId
-from hub.infrastructure.di.injectors import inject_getter
+from hub.infrastructure.di.injectors import inject_getter, inject_handler
 from hub.presentation.client_bot.custom_widgets.calendar import BookingCalendar
 from hub.presentation.client_bot.state_groups.booking import BookingSG
 from hub.presentation.client_bot.state_groups.main_menu import MainMenuSG
+from hub.presentation.custom_widgets.keyset_scroll import KeysetScroll, ManagedKeysetScroll
 
 SERVICE_SCROLL_ID = "service.scroll"
+SERVICE_PAGE_SIZE = 6
+CALENDAR_ID = "calendar"
 
 
 @inject_getter
 async def booking_get_service_getter(
     dialog_manager: DialogManager,
-    get_bot_services: FromDishka[GetBotServices],
+    context: FromDishka[ClientContext],
+    get_bot_services_page: FromDishka[GetBotServicesPage],
     **_: Any,
 ) -> dict[str, Any]:
-    if dialog_manager.event.bot is None:
-        raise ValueError("Bot cannot be None")
-    services = await get_bot_services(GetBotServicesDTO(bot_telegram_id=dialog_manager.event.bot.id))
+    scroll: ManagedKeysetScroll = dialog_manager.find(SERVICE_SCROLL_ID)
+    page = await get_bot_services_page(
+        GetBotServicesPageDTO(
+            bot_id=context.bot.id,
+            after_id=scroll.get_cursor(),
+            limit=SERVICE_PAGE_SIZE,
+        ),
+    )
+    scroll.set_next_cursor(page.items[-1].id if page.is_full else None)
     return {
-        "services": services,
+        "services": page.items,
+        "pages": page.pages,
     }
 
 
 @inject_getter
 async def booking_get_date_getter(
     dialog_manager: DialogManager,
-    get_bot: FromDishka[GetBot],
-    get_client: FromDishka[GetClient],
-    get_city: FromDishka[GetCity],
+    context: FromDishka[ClientContext],
+    get_available_days: FromDishka[GetAvailableDays],
     **_: Any,
 ) -> dict[str, Any]:
-    if dialog_manager.event.bot is None:
-        raise ValueError("Bot cannot be None")
-    elif dialog_manager.event.from_user is None:
-        raise ValueError("User cannot be None")
-    bot = await get_bot(GetBotDTO(telegram_id=dialog_manager.event.bot.id))
-    client = await get_client(
-        GetClientDTO(
-            bot_id=bot.id,
-            telegram_id=dialog_manager.event.from_user.id,
+    if context.client is None or context.city is None:
+        raise ValueError("Client cannot be None")
+    month = dialog_manager.find(CALENDAR_ID).get_offset() or datetime.now(tz=timezone(context.city.timezone)).date()
+    available_days = await get_available_days(
+        GetAvailableDaysDTO(
+            bot_id=context.bot.id,
+            service_id=dialog_manager.dialog_data["service_id"],
+            month=month,
+            timezone=context.city.timezone,
         ),
     )
-    city = await get_city(GetCityDTO(city_id=client.city_id))
     return {
-        "client": client,
-        "timezone": city.timezone,
+        "client": context.client,
+        "timezone": context.city.timezone,
+        "available_days": available_days,
     }
 
 
 @inject_getter
 async def booking_get_time_getter(
-    dialog_manager: DialogManager,  # noqa: ARG001
+    dialog_manager: DialogManager,
+    context: FromDishka[ClientContext],
+    get_available_slots: FromDishka[GetAvailableSlots],
     **_: Any,
 ) -> dict[str, Any]:
-    return {}
+    if context.client is None or context.city is None:
+        raise ValueError("Client cannot be None")
+    slots = await get_available_slots(
+        GetAvailableSlotsDTO(
+            bot_id=context.bot.id,
+            service_id=dialog_manager.dialog_data["service_id"],
+            date=date.fromisoformat(dialog_manager.dialog_data["booking_date"]),
+            timezone=context.city.timezone,
+        ),
+    )
+    return {
+        "slots": slots,
+    }
 
 
 @inject_getter
@@ -89,6 +119,48 @@ async def process_get_service(
     await dialog_manager.switch_to(BookingSG.GET_DATE)
 
 
+async def process_get_date(
+    _: Any,
+    __: Any,
+    dialog_manager: DialogManager,
+    selected_date: date,
+) -> None:
+    dialog_manager.dialog_data["booking_date"] = selected_date.isoformat()
+    await dialog_manager.switch_to(BookingSG.GET_TIME)
+
+
+@inject_handler
+async def process_get_time(
+    callback_query: CallbackQuery,
+    _: Any,
+    dialog_manager: DialogManager,
+    slot_start: str,
+    context: FromDishka[ClientContext],
+    get_master: FromDishka[GetMaster],
+    create_appointment: FromDishka[CreateAppointment],
+) -> None:
+    if context.client is None or context.city is None:
+        raise ValueError("Client cannot be None")
+    try:
+        appointment = await create_appointment(
+            CreateAppointmentDTO(
+                bot_id=context.bot.id,
+                client_id=context.client.id,
+                client_telegram_id=context.client.telegram_id,
+                service_id=dialog_manager.dialog_data["service_id"],
+                date_time=datetime.fromisoformat(slot_start),
+                timezone=context.city.timezone,
+            ),
+        )
+    except SlotAlreadyTakenError:
+        await callback_query.answer("😔 Это время уже заняли, выберите другое.", show_alert=True)
+        return
+    master = await get_master(GetMasterDTO(master_id=appointment.master_id))
+    dialog_manager.dialog_data["booking_time"] = f"{appointment.date_time:%H:%M}"
+    dialog_manager.dialog_data["master_name"] = master.name
+    await dialog_manager.switch_to(BookingSG.SUCCESS_BOOKING)
+
+
 booking_dialog = Dialog(
     Window(
         StaticMedia(path="./resources/media/main_bot/stub.png"),
@@ -97,7 +169,7 @@ booking_dialog = Dialog(
             Const("Выбирайте, куда на что хотите записаться 👇"),
             sep="\n\n",
         ),
-        ScrollingGroup(
+        Group(
             Select(
                 Jinja("{{ item.name }}"),
                 id="select.service",
@@ -106,11 +178,9 @@ booking_dialog = Dialog(
                 items="services",
                 on_click=process_get_service,
             ),
-            id=SERVICE_SCROLL_ID,
             width=1,
-            height=6,
-            hide_pager=True,
         ),
+        KeysetScroll(id=SERVICE_SCROLL_ID, pages="pages"),
         Row(
             PrevPage(scroll=SERVICE_SCROLL_ID, text=Const("⬅️"), when=F["pages"] > 1),
             NextPage(scroll=SERVICE_SCROLL_ID, text=Const("➡️"), when=F["pages"] > 1),
@@ -128,7 +198,7 @@ booking_dialog = Dialog(
             sep="\n\n",
         ),
         SwitchTo(Const("📋 Об услуге"), id="open.description", state=BookingSG.SERVICE_DESCRIPTION),
-        BookingCalendar(id="calendar"),
+        BookingCalendar(id=CALENDAR_ID, on_click=process_get_date),
         SwitchTo(Const("↩️ Назад"), id="open.menu", state=BookingSG.GET_SERVICE),
         state=BookingSG.GET_DATE,
         getter=booking_get_date_getter,
@@ -137,9 +207,21 @@ booking_dialog = Dialog(
         StaticMedia(path="./resources/media/main_bot/stub.png"),
         Multi(
             Const("🕰 День назначили, а время?"),
-            Const("Нажмите на время, к которому придете 👇"),
+            Const("Нажмите на время, к которому придете 👇", when=F["slots"]),
+            Const("😔 На этот день свободного времени не осталось, выберите другой день.", when=~F["slots"]),
             sep="\n\n",
         ),
+        Group(
+            Select(
+                Format("{item.start:%H:%M}"),
+                id="select.time",
+                item_id_getter=lambda slot: slot.start.isoformat(),
+                items="slots",
+                on_click=process_get_time,
+            ),
+            width=4,
+        ),
+        SwitchTo(Const("↩️ Назад"), id="back.to.date", state=BookingSG.GET_DATE),
         state=BookingSG.GET_TIME,
         getter=booking_get_time_getter,
     ),
@@ -163,6 +245,7 @@ booking_dialog = Dialog(
             Const("Ждем Вас, не опаздывайте! 🤗"),
             sep="\n\n",
         ),
+        Start(Const("↩️ В меню"), id="close", state=MainMenuSG.MENU),
         state=BookingSG.SUCCESS_BOOKING,
     ),
 )
@@ -6,13 +6,12 @@ from aiogram_dialog.widgets.media import StaticMedia
 from aiogram_dialog.widgets.text import Const, Jinja, Multi
 from dishka import FromDishka
 
-from hub.application.bot.get import GetBot, GetBotDTO
 from hub.application.bot.get_cities import GetBotCities, GetBotCitiesDTO
 from hub.application.client.create import CreateClient, CreateClientDTO
-from hub.application.client.exceptions import ClientTelegramIdNotExistsError
-from hub.application.client.get import GetClient, GetClientDTO
 from hub.domain.models.city import CityId
+from hub.domain.models.client import ClientContext
 from hub.infrastructure.di.injectors import inject_getter, inject_handler, inject_trigger
+from ..middlewares.client_context import load_client_context
 from ..state_groups.appointments import ClientAppointmentsSG
 from ..state_groups.booking import BookingSG
 from ..state_groups.main_menu import MainMenuSG, RegistrationSG
@@ -22,34 +21,27 @@ from ..state_groups.main_menu import MainMenuSG, RegistrationSG
 async def check_client_register(
     _: Any,
     dialog_manager: DialogManager,
-    get_bot: FromDishka[GetBot],
-    get_client: FromDishka[GetClient],
+    context: FromDishka[ClientContext],
     get_bot_cities: FromDishka[GetBotCities],
     create_client: FromDishka[CreateClient],
 ) -> None:
-    bot = await get_bot(GetBotDTO(telegram_id=dialog_manager.middleware_data["bot"].id))
     if dialog_manager.event.from_user is None:
         raise ValueError("User cannot be None")
-    try:
-        await get_client(
-            GetClientDTO(
-                bot_id=bot.id,
+    if context.client is not None:
+        await dialog_manager.start(MainMenuSG.MENU)
+        return
+    cities = await get_bot_cities(GetBotCitiesDTO(bot_id=context.bot.id))
+    if len(cities) == 1:
+        await create_client(
+            CreateClientDTO(
+                name=dialog_manager.event.from_user.full_name,
                 telegram_id=dialog_manager.event.from_user.id,
+                bot_telegram_id=context.bot.telegram_id,
+                city_id=cities[0].id,
             ),
         )
+        await load_client_context(dialog_manager.middleware_data)
         await dialog_manager.start(MainMenuSG.MENU)
-    except ClientTelegramIdNotExistsError:
-        cities = await get_bot_cities(GetBotCitiesDTO(bot_id=bot.id))
-        if len(cities) == 1:
-            await create_client(
-                CreateClientDTO(
-                    name=dialog_manager.event.from_user.full_name,
-                    telegram_id=dialog_manager.event.from_user.id,
-                    bot_telegram_id=bot.telegram_id,
-                    city_id=cities[0].id,
-                ),
-            )
-            await dialog_manager.start(MainMenuSG.MENU)
 
 
 @inject_getter
@@ -88,6 +80,7 @@ async def process_select_city(
             city_id=city_id,
         ),
     )
+    await load_client_context(dialog_manager.middleware_data)
     await dialog_manager.start(MainMenuSG.MENU)
 
 
@@ -1,5 +1,7 @@
 from aiogram import Dispatcher
 
+from .client_context import ClientContextMiddleware
 
-def setup_middlewares(dispatcher: Dispatcher) -> None:  # noqa: ARG001
-    pass
+
+def setup_middlewares(dispatcher: Dispatcher) -> None:
+    dispatcher.update.outer_middleware(ClientContextMiddleware())
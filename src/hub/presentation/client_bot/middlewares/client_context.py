@@ -0,0 +1,49 @@
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from aiogram import BaseMiddleware, Bot
+from aiogram.types import TelegramObject, User
+from dishka.integrations.aiogram import AiogramMiddlewareData
+
+from hub.application.client.get_context import GetClientContext, GetClientContextDTO
+from hub.infrastructure.di.injectors import CONTAINER_KEY
+from hub.infrastructure.di.providers.context import CLIENT_CONTEXT_KEY
+
+if TYPE_CHECKING:
+    from dishka import AsyncContainer
+
+
+async def load_client_context(data: dict[str, Any]) -> None:
+    """Resolve the context of the update's user into the middleware data of its scope.
+
+    Updates without a user, like a channel post, get the bot's context with no client.
+    Handlers that change the client, like registering them, call it again so the rest
+    of the update sees the new state. It is stored in the update's data, which the
+    request scope was opened with, as the events under it get copies of it.
+    """
+    bot: Bot = data["bot"]
+    user: User | None = data.get("event_from_user")
+    container: AsyncContainer = data[CONTAINER_KEY]
+    get_client_context = await container.get(GetClientContext)
+    middleware_data = await container.get(AiogramMiddlewareData)
+    middleware_data[CLIENT_CONTEXT_KEY] = await get_client_context(
+        GetClientContextDTO(bot_telegram_id=bot.id, telegram_id=user.id if user is not None else None),
+    )
+
+
+class ClientContextMiddleware(BaseMiddleware):
+    """Resolve the bot, the client and the client's city once per update.
+
+    Must be registered on the update observer after UpdateContainerMiddleware,
+    so it runs for every event type, including aiogram-dialog background updates. The
+    result is stored in the middleware data and provided as ClientContext by the container.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        await load_client_context(data)
+        return await handler(event, data)
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytz
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+    TelegramUnauthorizedError,
+)
+from aiohttp import web
+from dishka import AsyncContainer
+
+from hub.application.bot.exceptions import BotIdNotExistsError
+from hub.application.bot.get import GetBot, GetBotDTO
+from hub.application.common.interfaces import ReminderQueue
+from hub.domain.models.reminder import Reminder
+from hub.infrastructure.telegram.registry import TenantBotRegistry
+
+if TYPE_CHECKING:
+    from hub.domain.models.bot import BotId
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+POLL_INTERVAL = 1
+# Reminders that could not be sent for a reason that may pass are tried again after this
+RETRY_DELAY = timedelta(seconds=30)
+
+
+def render_reminder(reminder: Reminder) -> str:
+    date_time = reminder.appointment_date_time.astimezone(pytz.timezone(reminder.timezone))
+    return f"⏰ Напоминаем, что Вы записаны на {date_time:%d.%m.%Y} в {date_time:%H:%M}."
+
+
+class ReminderWorker:
+    """Pops due reminders in batches and sends them through the tenant bots.
+
+    Bots of a batch send concurrently, the rate-limited session paces each of them.
+    A bot still in flood control after its retries, or failing in a way that may
+    pass, puts the rest of its reminders back for later. A reminder Telegram refuses
+    for good is dropped and the bot goes on with the next one.
+    """
+
+    def __init__(self, container: AsyncContainer, bot_registry: TenantBotRegistry):
+        self._container = container
+        self._bot_registry = bot_registry
+
+    async def run(self) -> None:
+        queue = await self._container.get(ReminderQueue)
+        while True:
+            reminders: list[Reminder] = []
+            try:
+                reminders = await queue.pop_due(datetime.now(tz=UTC), BATCH_SIZE)
+                if reminders:
+                    await self._send_batch(queue, reminders)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Failed to send due reminders")
+            if len(reminders) < BATCH_SIZE:
+                await asyncio.sleep(POLL_INTERVAL)
+
+    async def _send_batch(self, queue: ReminderQueue, reminders: list[Reminder]) -> None:
+        by_bot: defaultdict[BotId, list[Reminder]] = defaultdict(list)
+        for reminder in reminders:
+            by_bot[reminder.bot_id].append(reminder)
+
+        bots: dict[BotId, Bot] = {}
+        try:
+            async with self._container() as request:
+                get_bot = await request.get(GetBot)
+                for bot_id in by_bot:
+                    try:
+                        bot = await get_bot(GetBotDTO(bot_id=bot_id))
+                    except BotIdNotExistsError:
+                        logger.info("Dropping reminders of deleted bot %s", bot_id)
+                        continue
+                    bots[bot_id] = self._bot_registry.get(bot.token)
+        except Exception:
+            # They are already off the queue, without this they would be lost
+            await self._retry_later(queue, reminders, datetime.now(tz=UTC) + RETRY_DELAY)
+            raise
+
+        results = await asyncio.gather(
+            *(self._send_bot(queue, bot, by_bot[bot_id]) for bot_id, bot in bots.items()),
+            return_exceptions=True,
+        )
+        for bot_id, result in zip(bots, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error("Failed to send reminders of bot %s", bot_id, exc_info=result)
+
+    async def _send_bot(self, queue: ReminderQueue, bot: Bot, reminders: list[Reminder]) -> None:
+        for index, reminder in enumerate(reminders):
+            try:
+                await bot.send_message(chat_id=reminder.chat_id, text=render_reminder(reminder))
+            except TelegramRetryAfter as e:
+                await self._retry_later(
+                    queue,
+                    reminders[index:],
+                    datetime.now(tz=UTC) + timedelta(seconds=e.retry_after),
+                )
+                return
+            except TelegramUnauthorizedError:
+                self._bot_registry.discard(bot.token)
+                logger.info("Dropping reminders of revoked bot %s", bot.id)
+                return
+            except (TelegramNetworkError, TelegramServerError) as e:
+                logger.warning("Telegram is unavailable for bot %s, retrying reminders later: %s", bot.id, e.message)
+                await self._retry_later(queue, reminders[index:], datetime.now(tz=UTC) + RETRY_DELAY)
+                return
+            except TelegramAPIError as e:
+                logger.info("Reminder for appointment %s not delivered: %s", reminder.appointment_id, e.message)
+            except Exception:
+                logger.exception("Failed to send reminders of bot %s, retrying later", bot.id)
+                await self._retry_later(queue, reminders[index:], datetime.now(tz=UTC) + RETRY_DELAY)
+                return
+
+    @staticmethod
+    async def _retry_later(queue: ReminderQueue, reminders: list[Reminder], due_at: datetime) -> None:
+        await queue.reschedule([replace(reminder, due_at=due_at) for reminder in reminders])
+
+
+def setup_reminders(app: web.Application, container: AsyncContainer, bot_registry: TenantBotRegistry) -> None:
+    worker = ReminderWorker(container=container, bot_registry=bot_registry)
+
+    async def reminder_worker_ctx(_: web.Application) -> AsyncIterator[None]:
+        task = asyncio.create_task(worker.run())
+        yield
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    app.cleanup_ctx.append(reminder_worker_ctx)
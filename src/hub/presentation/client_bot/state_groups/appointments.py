@@ -3,3 +3,4 @@ from aiogram.fsm.state import State, StatesGroup
 
 class ClientAppointmentsSG(StatesGroup):
     LIST = State()
+    CANCEL = State()
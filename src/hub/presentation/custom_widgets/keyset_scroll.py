@@ -0,0 +1,48 @@
+from typing import Any
+
+from aiogram_dialog import ChatEvent, DialogManager
+from aiogram_dialog.widgets.common import ManagedScroll
+from aiogram_dialog.widgets.kbd import StubScroll
+
+
+class KeysetScroll(StubScroll):
+    """Scroll for lists paged in the database.
+
+    The getter asks for one page after get_cursor() and reports the id of its last item
+    with set_next_cursor(), so moving forward never needs an offset. Only pages that
+    were already reached can be opened, which is all PrevPage/NextPage need.
+    """
+
+    def _get_state(self, manager: DialogManager) -> dict[str, Any]:
+        return self.get_widget_data(manager, {"page": 0, "cursors": [None]})
+
+    async def get_page(self, manager: DialogManager) -> int:
+        return self._get_state(manager)["page"]
+
+    async def set_page(self, event: ChatEvent, page: int, manager: DialogManager) -> None:
+        state = self._get_state(manager)
+        state["page"] = max(0, min(page, len(state["cursors"]) - 1))
+        await self.on_page_changed.process_event(event, self.managed(manager), manager)
+
+    def get_cursor(self, manager: DialogManager) -> Any:
+        state = self._get_state(manager)
+        return state["cursors"][state["page"]]
+
+    def set_next_cursor(self, manager: DialogManager, cursor: Any) -> None:
+        state = self._get_state(manager)
+        del state["cursors"][state["page"] + 1 :]
+        if cursor is not None:
+            state["cursors"].append(cursor)
+
+    def managed(self, manager: DialogManager) -> "ManagedKeysetScroll":
+        return ManagedKeysetScroll(self, manager)
+
+
+class ManagedKeysetScroll(ManagedScroll):
+    widget: KeysetScroll
+
+    def get_cursor(self) -> Any:
+        return self.widget.get_cursor(self.manager)
+
+    def set_next_cursor(self, cursor: Any) -> None:
+        self.widget.set_next_cursor(self.manager, cursor)
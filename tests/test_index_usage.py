@@ -0,0 +1,209 @@
+"""EXPLAIN the hot lookups and check that their indexes serve them.
+
+Runs against the database of the main bot config (CONFIG_PATH, migrated to head)
+and is skipped when there is none. Many tenants are seeded so that a single bot's
+rows are a small share of each table, inside a transaction that is rolled back.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from hub.infrastructure.config_loader import load_config
+from hub.infrastructure.database.adapters.appointment import AppointmentDbGateway
+from hub.infrastructure.database.adapters.bot import BotDbGateway
+from hub.infrastructure.database.adapters.client import ClientDbGateway
+from hub.infrastructure.database.adapters.schedule import ScheduleDbGateway
+from hub.infrastructure.database.config import DBConfig
+from hub.infrastructure.database.factories import create_engine
+
+CONFIG_PATH = Path(os.getenv("CONFIG_PATH", "./config/main_bot_config.toml"))
+TENANTS = 200
+INDEX_SCANS = frozenset({"Index Scan", "Index Only Scan", "Bitmap Index Scan"})
+
+# Bots get the telegram ids from :first_id to :last_id, each with 5 cities, 10 services, 10 masters providing
+# all of them, 100 clients and one appointment a day for 20 days per master
+SEED = tuple(
+    text(statement)
+    for statement in (
+        "INSERT INTO managers (telegram_id) SELECT n FROM generate_series(:first_id, :last_id) n",
+        (
+            "INSERT INTO bots (token, telegram_id, name, manager_id) "
+            "SELECT telegram_id || '-test', telegram_id, 'Test', id FROM managers "
+            "WHERE telegram_id BETWEEN :first_id AND :last_id"
+        ),
+        (
+            "INSERT INTO cities (name, timezone, bot_id) SELECT 'City ' || n, 'Europe/Moscow', bots.id "
+            "FROM bots, generate_series(1, 5) n WHERE bots.telegram_id BETWEEN :first_id AND :last_id"
+        ),
+        (
+            "INSERT INTO services (name, bot_id) SELECT 'Service ' || n, bots.id "
+            "FROM bots, generate_series(1, 10) n WHERE bots.telegram_id BETWEEN :first_id AND :last_id"
+        ),
+        (
+            "INSERT INTO masters (name, bot_id, city_id) "
+            "SELECT 'Master ' || n, bots.id, (SELECT min(id) FROM cities WHERE bot_id = bots.id) "
+            "FROM bots, generate_series(1, 10) n WHERE bots.telegram_id BETWEEN :first_id AND :last_id"
+        ),
+        (
+            "INSERT INTO service_master_association (service_id, master_id, work_time, break_time) "
+            "SELECT services.id, masters.id, 60, 0 FROM masters JOIN services ON services.bot_id = masters.bot_id "
+            "JOIN bots ON bots.id = masters.bot_id WHERE bots.telegram_id BETWEEN :first_id AND :last_id"
+        ),
+        (
+            "INSERT INTO clients (telegram_id, name, bot_id, city_id) "
+            "SELECT n, 'Client ' || n, bots.id, (SELECT min(id) FROM cities WHERE bot_id = bots.id) "
+            "FROM bots, generate_series(1, 100) n WHERE bots.telegram_id BETWEEN :first_id AND :last_id"
+        ),
+        (
+            "INSERT INTO appointments (date, end_date, master_id, client_id, service_id) "
+            "SELECT slot.start, slot.start + interval '1 hour', masters.id, client.id, service.id "
+            "FROM masters JOIN bots ON bots.id = masters.bot_id "
+            "JOIN (SELECT bot_id, min(id) AS id FROM clients GROUP BY bot_id) client ON client.bot_id = bots.id "
+            "JOIN (SELECT bot_id, min(id) AS id FROM services GROUP BY bot_id) service ON service.bot_id = bots.id, "
+            "generate_series(0, 19) d, "
+            "LATERAL (SELECT CAST(:today AS timestamptz) + d * interval '1 day' + interval '10 hours' AS start) slot "
+            "WHERE bots.telegram_id BETWEEN :first_id AND :last_id"
+        ),
+    )
+)
+LOOKUP_IDS = text(
+    "SELECT bots.id AS bot_id, bots.telegram_id AS bot_telegram_id, "
+    "(SELECT min(telegram_id) FROM clients WHERE bot_id = bots.id) AS client_telegram_id, "
+    "(SELECT min(id) FROM services WHERE bot_id = bots.id) AS service_id, "
+    "(SELECT min(id) FROM masters WHERE bot_id = bots.id) AS master_id "
+    "FROM bots WHERE telegram_id = :telegram_id",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Lookup:
+    name: str
+    index: str
+    call: Callable[[AsyncSession, dict[str, Any]], Awaitable[Any]]
+
+
+LOOKUPS = (
+    Lookup(
+        name="client by telegram id",
+        index="uq_clients_bot_id_telegram_id",
+        call=lambda session, ids: ClientDbGateway(session).get_client_by_telegram_id(
+            ids["bot_id"],
+            ids["client_telegram_id"],
+        ),
+    ),
+    Lookup(
+        name="client context",
+        index="uq_clients_bot_id_telegram_id",
+        call=lambda session, ids: ClientDbGateway(session).get_client_context(
+            ids["bot_telegram_id"],
+            ids["client_telegram_id"],
+        ),
+    ),
+    Lookup(
+        name="master schedules",
+        index="ix_appointments_master_id_date",
+        call=lambda session, ids: ScheduleDbGateway(session).get_master_schedules(
+            ids["bot_id"],
+            ids["service_id"],
+            datetime.now(tz=UTC),
+            datetime.now(tz=UTC) + timedelta(days=7),
+        ),
+    ),
+    Lookup(
+        name="master appointments",
+        index="ix_appointments_master_id_date",
+        call=lambda session, ids: AppointmentDbGateway(session).get_master_appointments(
+            ids["master_id"],
+            datetime.now(tz=UTC),
+            datetime.now(tz=UTC) + timedelta(days=7),
+            None,
+            20,
+        ),
+    ),
+    Lookup(
+        name="bot cities",
+        index="ix_cities_bot_id",
+        call=lambda session, ids: BotDbGateway(session).get_bot_cities(ids["bot_id"]),
+    ),
+    Lookup(
+        name="bot services",
+        index="ix_services_bot_id",
+        call=lambda session, ids: BotDbGateway(session).get_bot_services(ids["bot_id"]),
+    ),
+    Lookup(
+        name="bot masters",
+        index="ix_masters_bot_id",
+        call=lambda session, ids: BotDbGateway(session).get_bot_masters(ids["bot_id"]),
+    ),
+)
+
+pytestmark = pytest.mark.skipif(not CONFIG_PATH.exists(), reason=f"no database configured in {CONFIG_PATH}")
+
+
+def plan_scans(plan: dict[str, Any]) -> Iterator[tuple[str, str | None]]:
+    yield plan["Node Type"], plan.get("Index Name")
+    for child in plan.get("Plans", []):
+        yield from plan_scans(child)
+
+
+async def explain_lookup(connection: AsyncConnection, lookup: Lookup, ids: dict[str, Any]) -> list[tuple[str, Any]]:
+    statements: list[tuple[str, Any]] = []
+
+    def capture(_conn: Any, _cursor: Any, statement: str, parameters: Any, *_: Any) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(connection.sync_engine, "before_cursor_execute", capture)
+    try:
+        await lookup.call(AsyncSession(bind=connection), ids)
+    finally:
+        event.remove(connection.sync_engine, "before_cursor_execute", capture)
+
+    scans = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        scans.extend(plan_scans(result.scalar_one()[0]["Plan"]))
+    return scans
+
+
+async def explain_lookups() -> dict[str, list[tuple[str, Any]]]:
+    engine = create_engine(load_config(DBConfig, "db", path=CONFIG_PATH))
+    try:
+        # The gateways read through the seeding connection, so rolling it back is the cleanup
+        async with engine.connect() as connection:
+            first_id = time.time_ns() // 1000
+            for statement in SEED:
+                await connection.execute(
+                    statement,
+                    {"first_id": first_id, "last_id": first_id + TENANTS - 1, "today": datetime.now(tz=UTC).date()},
+                )
+            await connection.execute(text("ANALYZE"))
+            ids = dict(
+                (await connection.execute(LOOKUP_IDS, {"telegram_id": first_id + TENANTS // 2})).mappings().one(),
+            )
+            scans = {lookup.name: await explain_lookup(connection, lookup, ids) for lookup in LOOKUPS}
+            await connection.rollback()
+    finally:
+        await engine.dispose()
+    return scans
+
+
+@pytest.fixture(scope="module")
+def lookup_scans() -> dict[str, list[tuple[str, Any]]]:
+    return asyncio.run(explain_lookups())
+
+
+@pytest.mark.parametrize("lookup", LOOKUPS, ids=lambda lookup: lookup.name)
+def test_lookup_scans_its_index(lookup_scans: dict[str, list[tuple[str, Any]]], lookup: Lookup) -> None:
+    scans = lookup_scans[lookup.name]
+
+    assert any(node in INDEX_SCANS and index == lookup.index for node, index in scans), scans
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+
+import pytest
+from adaptix import Retort
+from adaptix.load_error import LoadError
+
+from hub.domain.new_type import IdentityNewType, NewTypeUnwrappingProvider, new_type
+
+ItemId = new_type("ItemId", int)
+ItemName = new_type("ItemName", str)
+BoxedItemId = new_type("BoxedItemId", int, boxed=True)
+
+
+@dataclass(frozen=True, slots=True)
+class Item:
+    id: ItemId | None
+    name: ItemName
+    boxed_id: BoxedItemId | None
+
+
+@pytest.fixture()
+def retort() -> Retort:
+    return Retort(recipe=[NewTypeUnwrappingProvider()])
+
+
+def test_identity_new_type_returns_supertype_values() -> None:
+    assert isinstance(ItemId, IdentityNewType)
+    # Exactly int, isinstance would pass for a subclass too
+    assert type(ItemId(5)) is int  # noqa: E721
+    assert ItemId("5") == 5
+
+
+def test_boxed_new_type_is_a_subclass() -> None:
+    assert type(BoxedItemId(5)) is BoxedItemId
+    assert BoxedItemId(5) == 5
+
+
+@pytest.mark.parametrize(("item_id", "boxed_id"), [(1, 2), (None, None)])
+def test_loader_unwraps_optional_new_types(retort: Retort, item_id: int | None, boxed_id: int | None) -> None:
+    item = retort.load({"id": item_id, "name": "Item", "boxed_id": boxed_id}, Item)
+
+    assert item == Item(id=item_id, name="Item", boxed_id=boxed_id)
+    # Exact types, the identity ones must not come back boxed
+    assert type(item.id) is type(item_id)
+    assert type(item.name) is str  # noqa: E721
+    assert type(item.boxed_id) is (type(None) if boxed_id is None else BoxedItemId)
+
+
+def test_loader_checks_the_supertype(retort: Retort) -> None:
+    with pytest.raises(LoadError):
+        retort.load({"id": "1", "name": "Item", "boxed_id": None}, Item)
+
+
+@pytest.mark.parametrize(("item_id", "boxed_id"), [(1, 2), (None, None)])
+def test_dumper_unwraps_optional_new_types(retort: Retort, item_id: int | None, boxed_id: int | None) -> None:
+    item = Item(id=item_id, name="Item", boxed_id=None if boxed_id is None else BoxedItemId(boxed_id))
+
+    assert retort.dump(item) == {"id": item_id, "name": "Item", "boxed_id": boxed_id}